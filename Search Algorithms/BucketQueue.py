@@ -0,0 +1,128 @@
+'''
+Topic:      Bucket (Dial) priority queue for small integer keys
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from typing import Dict, Generic, List, Tuple, TypeVar
+T = TypeVar("T")
+
+import random
+import string
+
+###############################################################################
+###############################################################################
+
+class BucketQueue(Generic[T]):
+    ''' Dial's bucket queue: a circular array of span buckets (lists), one
+        per integer key, for searches whose keys never decrease below the
+        last removed key and are always less than span above it -- e.g.,
+        Dijkstra with edge costs below span.  insert and remove_min are
+        amortised O(1) instead of the O(log n) of the binary heap.
+
+        Like PriorityQueue, each item is held at most once: inserting it
+        again with a smaller key is a decrease-key.  The old entry is left
+        in its bucket and skipped when reached, as its key no longer
+        matches the item's current key (items must therefore be hashable).
+    '''
+
+    __slots__ = ('_buckets', '_span', '_keys', '_current', '_high_water')
+
+    ##########
+    def __init__(self, span: int):
+        '''
+        Args:
+            span: number of buckets; every key inserted must be less than
+                  the last removed key plus span
+        '''
+        self._buckets: List[List[T]] = [[] for i in range(span)]
+        self._span = span
+        self._keys: Dict[T, int] = {}   # current key of every item in the queue
+        self._current = 0                # the smallest key still possible
+        self._high_water = 0
+
+    ##########
+    def __len__(self): return len(self._keys)
+
+    ##########
+    def __contains__(self, item: T) -> bool: return item in self._keys
+
+    ##########
+    def is_empty(self): return len(self._keys) == 0
+
+    ##########
+    def high_water(self) -> int:
+        ''' returns the largest number of items the queue has ever held '''
+        return self._high_water
+
+    ##########
+    def key(self, item: T) -> int:
+        ''' returns the current key of an item in the queue
+        Raises:
+            KeyError exception if the item is not in the queue
+        '''
+        return self._keys[item]
+
+    ##########
+    def insert(self, key: int, item: T) -> bool:
+        ''' inserts the item with the given key; if the item is already in
+            the queue its key is lowered to the given key (decrease-key), and
+            left alone if the given key is not smaller
+        Returns:
+            True if the item was added or its key was decreased
+        Raises:
+            ValueError exception if the queue is not empty and the key is
+            outside the window [last removed key, last removed key + span)
+        '''
+        keys = self._keys
+        old = keys.get(item)
+        if old is not None and key >= old: return False
+        if not self._current <= key < self._current + self._span:
+            if keys:
+                raise ValueError(f"Error in BucketQueue.insert(): key {key} outside " \
+                                 f"[{self._current}, {self._current + self._span})")
+            self._current = key   # an empty queue can move its window anywhere
+        keys[item] = key
+        self._buckets[key % self._span].append(item)
+        if len(keys) > self._high_water: self._high_water = len(keys)
+        return True
+
+    ##########
+    def remove_min(self) -> Tuple[int, T]:
+        ''' removes and returns a (key, item) tuple with the smallest key;
+            among equal keys the most recently inserted item comes first
+        Raises:
+            IndexError exception if the queue is empty
+        '''
+        keys = self._keys
+        if not keys: raise IndexError("Error in BucketQueue.remove_min(): queue is empty")
+        buckets, span, current = self._buckets, self._span, self._current
+        while True:
+            bucket = buckets[current % span]
+            while bucket:
+                item = bucket.pop()
+                if keys.get(item) == current:   # otherwise a stale entry
+                    del keys[item]
+                    self._current = current
+                    return current, item
+            current += 1
+
+###############################################################################
+###############################################################################
+
+def main():
+
+    bq = BucketQueue(101)
+    for i in range(10):
+        bq.insert(random.randint(1,100), random.choice(string.ascii_letters))
+
+    while not bq.is_empty():
+        print(bq.remove_min())
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,256 @@
+'''
+Topic:      Hierarchical pathfinding (HPA*) over a reusable cluster abstraction
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from Maze import _BLOCKED
+from PriorityQueue import *
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+###############################################################################
+###############################################################################
+
+class HPAStar:
+    ''' class answering many start/goal queries against one Maze by splitting
+        the grid into square clusters, placing entrance (transition) cells on
+        the borders between neighbouring clusters, and precomputing the
+        distances between the entrances of each cluster; a query searches
+        this small abstract graph and then refines each abstract edge into
+        cells with a search confined to one cluster
+
+        The abstraction registers itself as a watcher of the maze, so when a
+        cell becomes blocked or free only its cluster (and the entrances it
+        shares with its neighbours) is rebuilt, lazily, on the next query.
+    '''
+
+    MAX_SINGLE_ENTRANCE = 6  # longer border openings get a transition at each end
+
+    ##########
+    def __init__(self, maze: Maze, cluster_size: int = 10):
+        '''
+        Args:
+            maze:         the Maze to answer queries on
+            cluster_size: side length, in cells, of each square cluster
+        '''
+        self._maze = maze
+        self._size = cluster_size
+        self._cluster_rows = -(-maze._num_rows // cluster_size)
+        self._cluster_cols = -(-maze._num_cols // cluster_size)
+
+        # (cluster, neighbouring cluster) -> transition cell pairs, cluster < neighbour
+        self._transitions: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        # cluster -> entrance cell -> entrance cells in neighbouring clusters
+        self._partners: Dict[int, Dict[int, List[int]]] = {}
+        # cluster -> entrance cell -> [(entrance cell in same cluster, distance)]
+        self._intra: Dict[int, Dict[int, List[Tuple[int, int]]]] = {}
+
+        self._dirty: Set[int] = set(range(self._cluster_rows * self._cluster_cols))
+        maze._watchers.add(self)
+        self._rebuild()
+
+    ##########
+    def cell_changed(self, index: int) -> None:
+        ''' called by the maze when the cell at the flat index became blocked
+            or free; marks its cluster for rebuilding '''
+        self._dirty.add(self._cluster_of(index))
+
+    ##########
+    def _cluster_of(self, index: int) -> int:
+        ''' returns the id of the cluster holding the given flat index '''
+        row, col = divmod(index, self._maze._num_cols)
+        return (row // self._size) * self._cluster_cols + col // self._size
+
+    ##########
+    def _bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        ''' returns (first row, end row, first col, end col) of a cluster '''
+        c_row, c_col = divmod(cluster, self._cluster_cols)
+        return c_row * self._size, min((c_row + 1) * self._size, self._maze._num_rows), \
+               c_col * self._size, min((c_col + 1) * self._size, self._maze._num_cols)
+
+    ##########
+    def _neighbouring_clusters(self, cluster: int) -> List[int]:
+        ''' returns the ids of the (up to four) clusters next to a cluster '''
+        c_row, c_col = divmod(cluster, self._cluster_cols)
+        result = []
+        if c_row > 0:                      result.append(cluster - self._cluster_cols)
+        if c_row + 1 < self._cluster_rows: result.append(cluster + self._cluster_cols)
+        if c_col > 0:                      result.append(cluster - 1)
+        if c_col + 1 < self._cluster_cols: result.append(cluster + 1)
+        return result
+
+    ##########
+    def _find_transitions(self, first: int, second: int) -> List[Tuple[int, int]]:
+        ''' scans the border between two neighbouring clusters (first < second)
+            for openings and returns their transition cell pairs '''
+        maze  = self._maze
+        cols  = maze._num_cols
+        cells = maze._cells
+        row0, row1, col0, col1 = self._bounds(first)
+
+        if first // self._cluster_cols == second // self._cluster_cols:   # side by side: border is a column
+            pairs = [(r * cols + col1 - 1, r * cols + col1) for r in range(row0, row1)]
+        else:                     # one above the other: border is a row
+            pairs = [((row1 - 1) * cols + c, row1 * cols + c) for c in range(col0, col1)]
+
+        transitions, run = [], []
+        for a, b in pairs + [(-1, -1)]:
+            if a != -1 and cells[a] != _BLOCKED and cells[b] != _BLOCKED:
+                run.append((a, b))
+                continue
+            if len(run) >= HPAStar.MAX_SINGLE_ENTRANCE:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    ##########
+    def _local_bfs(self, source: int, cluster: int, target: int = -1) -> Dict[int, int]:
+        ''' breadth-first search from the source confined to one cluster
+        Args:
+            source:  flat index to search from
+            cluster: id of the cluster the search may not leave
+            target:  optional flat index at which to stop early
+        Returns:
+            a dictionary mapping each reached flat index to its parent index
+            (the source maps to -1)
+        '''
+        row0, row1, col0, col1 = self._bounds(cluster)
+        cols = self._maze._num_cols
+        offsets, targets = self._maze._adjacency()
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            i = queue.popleft()
+            if i == target: break
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if j in parents: continue
+                row, col = divmod(j, cols)
+                if row0 <= row < row1 and col0 <= col < col1:
+                    parents[j] = i
+                    queue.append(j)
+        return parents
+
+    ##########
+    def _distances(self, source: int, cluster: int, nodes) -> List[Tuple[int, int]]:
+        ''' returns [(node, distance)] for the given nodes reachable from the
+            source without leaving the cluster '''
+        parents = self._local_bfs(source, cluster)
+        distance = {source: 0}
+        for index in parents:   # parents are inserted in BFS order
+            if index != source: distance[index] = distance[parents[index]] + 1
+        return [(node, distance[node]) for node in nodes if node != source and node in distance]
+
+    ##########
+    def _rebuild(self) -> None:
+        ''' rebuilds the abstraction around every dirty cluster: the
+            transitions on its borders, then the entrances and the intra-
+            cluster distances of it and its neighbours '''
+        if not self._dirty: return
+        affected = set(self._dirty)
+        for cluster in self._dirty:
+            affected.update(self._neighbouring_clusters(cluster))
+            for other in self._neighbouring_clusters(cluster):
+                pair = (min(cluster, other), max(cluster, other))
+                self._transitions[pair] = self._find_transitions(*pair)
+        self._dirty = set()
+
+        for cluster in affected:
+            partners: Dict[int, List[int]] = {}
+            for other in self._neighbouring_clusters(cluster):
+                pair = (min(cluster, other), max(cluster, other))
+                for a, b in self._transitions.get(pair, []):
+                    mine, theirs = (a, b) if cluster == pair[0] else (b, a)
+                    partners.setdefault(mine, []).append(theirs)
+            self._partners[cluster] = partners
+            self._intra[cluster] = {node: self._distances(node, cluster, partners) \
+                                    for node in partners}
+
+    ##########
+    def _refine(self, abstract: List[int]) -> List[int]:
+        ''' turns a path of abstract nodes into the full path of flat indices '''
+        path = [abstract[0]]
+        for u, v in zip(abstract, abstract[1:]):
+            if self._cluster_of(u) != self._cluster_of(v):   # an inter-cluster step
+                path.append(v)
+                continue
+            parents = self._local_bfs(u, self._cluster_of(u), v)
+            segment, index = [], v
+            while index != u:
+                segment.append(index)
+                index = parents[index]
+            path += reversed(segment)
+        return path
+
+    ##########
+    def query(self, start: Position, goal: Position) -> Optional[Tuple[Node, int]]:
+        ''' answers one start/goal query with the abstraction, rebuilding any
+            dirty clusters first
+        Args:
+            start: (row, col) position to search from
+            goal:  (row, col) position to search to
+        Returns:
+            (goal node, search count) if the goal can be reached, where the
+            search count is the abstract nodes generated plus the cells the
+            refinement visited; None, if no goal can be found
+        '''
+        self._rebuild()
+        maze = self._maze
+        cols = maze._num_cols
+        s, g = maze._index(start), maze._index(goal)
+        if not maze.is_connected(start, goal): return None   # also rejects blocked cells
+        s_cluster, g_cluster = self._cluster_of(s), self._cluster_of(g)
+        goal_row, goal_col = divmod(g, cols)
+
+        # temporary edges linking the start and goal into the abstract graph
+        from_start = self._distances(s, s_cluster, list(self._partners[s_cluster]) + [g])
+        into_goal  = {node: distance for node, distance in \
+                          self._distances(g, g_cluster, self._partners[g_cluster])}
+        if s_cluster != g_cluster:
+            from_start = [(node, distance) for node, distance in from_start if node != g]
+
+        def successors(node: int) -> List[Tuple[int, int]]:
+            cluster = self._cluster_of(node)
+            result = from_start if node == s else self._intra[cluster].get(node, [])
+            result = result + [(other, 1) for other in self._partners[cluster].get(node, [])]
+            if node in into_goal: result.append((g, into_goal[node]))
+            return result
+
+        g_score = {s: 0}
+        parents = {s: -1}
+        closed  = set()
+        count   = 0
+        to_explore = PriorityQueue()
+        row, col = divmod(s, cols)
+        to_explore.insert(abs(row - goal_row) + abs(col - goal_col), s)
+
+        while not to_explore.is_empty():
+            f, node = to_explore.remove_min()
+            if node == g: break
+            closed.add(node)
+            for other, distance in successors(node):
+                g_m = g_score[node] + distance
+                if other in closed or g_m >= g_score.get(other, g_m + 1): continue
+                g_score[other] = g_m
+                parents[other] = node
+                count += 1
+                row, col = divmod(other, cols)
+                to_explore.insert(g_m + abs(row - goal_row) + abs(col - goal_col), other)
+        else:
+            return None
+
+        abstract, node = [], g
+        while node != -1:
+            abstract.append(node)
+            node = parents[node]
+        abstract.reverse()
+
+        path = self._refine(abstract)
+        return maze._chain(path), count + len(path)
+
+###############################################################################
+###############################################################################
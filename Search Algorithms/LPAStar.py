@@ -0,0 +1,137 @@
+'''
+Topic:      Incremental replanning with Lifelong Planning A* (LPA*)
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from Maze import _BLOCKED
+from PriorityQueue import *
+from array import array
+from typing import List, Optional, Tuple
+
+###############################################################################
+###############################################################################
+
+class LPAStar:
+    ''' incremental planner bound to a Maze: keeps the g (current distance)
+        and rhs (one-step lookahead distance) of every cell between calls,
+        so after a few cells become blocked or free only the cells whose
+        distance from the start actually changed are re-expanded
+
+        The planner registers itself as a watcher of the maze, so edits made
+        through update_cell, Maze.set_contents or a Cell are all seen.
+    '''
+
+    ##########
+    def __init__(self, maze: Maze):
+        '''
+        Args:
+            maze: the Maze to plan on, from its current start to its goal
+        '''
+        self._maze  = maze
+        self._cols  = maze._num_cols
+        size        = maze._num_rows * maze._num_cols
+        self._inf   = size + 1          # stands in for infinity: no path is this long
+        self._scale = 2 * size + 2      # key = k1 * scale + k2, with k2 < scale
+        self._start = maze._index(maze._start._position)
+        self._goal  = maze._index(maze._goal._position)
+        self._goal_row, self._goal_col = divmod(self._goal, self._cols)
+
+        self._g   = array('i', [self._inf]) * size
+        self._rhs = array('i', [self._inf]) * size
+        self._rhs[self._start] = 0
+        self._open = PriorityQueue()
+        self._open.insert(self._key(self._start), self._start)
+        self._pending: List[int] = []   # cells changed since the last plan()
+
+        maze._watchers.add(self)
+
+    ##########
+    def _key(self, index: int) -> int:
+        ''' LPA* priority [min(g, rhs) + h, min(g, rhs)] packed into one int '''
+        row, col = divmod(index, self._cols)
+        best = min(self._g[index], self._rhs[index])
+        return (best + abs(row - self._goal_row) + abs(col - self._goal_col)) * self._scale + best
+
+    ##########
+    def _update_vertex(self, index: int) -> None:
+        ''' recomputes the rhs of a cell from its neighbours and puts it in
+            (or takes it out of) the open list depending on its consistency '''
+        if index != self._start:
+            if self._maze._cells[index] == _BLOCKED:
+                self._rhs[index] = self._inf
+            else:
+                g = self._g
+                self._rhs[index] = min([g[j] + 1 for j in self._maze._neighbours(index)] \
+                                       + [self._inf])
+        if index in self._open: self._open.remove(index)
+        if self._g[index] != self._rhs[index]:
+            self._open.insert(self._key(index), index)
+
+    ##########
+    def cell_changed(self, index: int) -> None:
+        ''' called by the maze when the cell at the flat index became blocked
+            or free; the repair happens on the next plan() '''
+        self._pending.append(index)
+
+    ##########
+    def update_cell(self, position: Position, contents: Contents) -> Optional[Tuple[Node, int]]:
+        ''' sets the contents of one cell and repairs the plan
+        Args:
+            position: (row, col) of the cell to change
+            contents: its new contents
+        Returns:
+            the result of plan() after the change
+        Raises:
+            ValueError exception if the start or goal would be blocked
+        '''
+        index = self._maze._index(position)
+        if index in (self._start, self._goal) and contents == Contents.BLOCKED:
+            raise ValueError(f"Error in LPAStar.update_cell(): cannot block {position}")
+        self._maze.set_contents(position, contents)
+        return self.plan()
+
+    ##########
+    def plan(self) -> Optional[Tuple[Node, int]]:
+        ''' brings the plan up to date with every change since the last call
+        Returns:
+            (goal node, search count) if the goal can be reached, where the
+            search count is the number of cells expanded by this call;
+            None, if no goal can be found
+        '''
+        for index in self._pending:
+            self._update_vertex(index)
+            for j in self._maze._neighbours(index):
+                self._update_vertex(j)
+        self._pending = []
+
+        g, rhs, goal = self._g, self._rhs, self._goal
+        neighbours = self._maze._neighbours
+        count = 0
+        while not self._open.is_empty() and \
+              (self._open.top()[0] < self._key(goal) or rhs[goal] != g[goal]):
+            key, index = self._open.remove_min()
+            count += 1
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+            else:
+                g[index] = self._inf
+                self._update_vertex(index)
+            for j in neighbours(index):
+                self._update_vertex(j)
+
+        if g[goal] >= self._inf: return None
+
+        # walk back from the goal along neighbours one step closer to the start
+        path = [goal]
+        index = goal
+        while index != self._start:
+            index = next(j for j in neighbours(index) if g[j] == g[index] - 1)
+            path.append(index)
+        path.reverse()
+        return self._maze._chain(path), count
+
+###############################################################################
+###############################################################################
@@ -0,0 +1,109 @@
+'''
+Topic:      Landmark (ALT) lower bounds for A* on mazes
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from array import array
+from typing import Callable, List
+
+###############################################################################
+###############################################################################
+
+class Landmarks:
+    ''' precomputed BFS distances from k landmark cells, giving A* the ALT
+        heuristic: by the triangle inequality, the distance from a cell n
+        to the goal g is at least |d(L, g) - d(L, n)| for every landmark L,
+        which in a maze full of walls is far closer to the truth than the
+        Manhattan distance
+
+        Landmarks are chosen by farthest-point selection -- each new one is
+        the free cell farthest from all those chosen so far -- so they end
+        up on the edges of the maze, behind the walls a search would
+        otherwise wander around.  The set registers itself as a watcher of
+        the maze and is rebuilt, lazily, after any cell becomes blocked or
+        free, since freeing a cell can shorten distances and make the old
+        bounds overestimate.
+    '''
+
+    ##########
+    def __init__(self, maze: Maze, k: int = 8):
+        '''
+        Args:
+            maze: the Maze to precompute distances on
+            k:    number of landmarks
+        '''
+        self._maze = maze
+        self._k = k
+        self._landmarks: List[int] = []       # flat indices of the landmarks
+        self._distances: List[array] = []     # int32 steps from each landmark, -1 if unreachable
+        self._dirty = True
+        maze._watchers.add(self)
+        self._build()
+
+    ##########
+    def cell_changed(self, index: int) -> None:
+        ''' called by the maze when a cell became blocked or free '''
+        self._dirty = True
+
+    ##########
+    def _build(self) -> None:
+        ''' selects the landmarks and floods the maze from each of them '''
+        maze = self._maze
+        size = maze._num_rows * maze._num_cols
+        self._landmarks, self._distances = [], []
+        self._dirty = False
+        if self._k == 0: return
+
+        # seed the selection with the cell farthest from the start
+        distances, parents = maze._flood(maze._index(maze._start._position))
+        nearest = distances   # steps from each cell to the nearest landmark so far
+        while len(self._landmarks) < self._k:
+            landmark = max(range(size), key = nearest.__getitem__)
+            if nearest[landmark] <= 0: break   # every reachable cell is a landmark already
+            distances, parents = maze._flood(landmark)
+            self._landmarks.append(landmark)
+            self._distances.append(distances)
+            nearest = array('i', map(min, nearest, distances))
+
+    ##########
+    def cells(self) -> List[Position]:
+        ''' returns the (row, col) positions of the landmarks '''
+        if self._dirty: self._build()
+        return [Position(*divmod(index, self._maze._num_cols)) for index in self._landmarks]
+
+    ##########
+    def nbytes(self) -> int:
+        ''' returns the bytes held by the landmark distance arrays '''
+        return sum(distances.itemsize * len(distances) for distances in self._distances)
+
+    ##########
+    def heuristic(self, goal: Position) -> Callable[[int], int]:
+        ''' returns the ALT heuristic towards the goal, for Maze.a_star: a
+            function of a flat index giving the largest of the Manhattan
+            distance and every landmark's |d(L, goal) - d(L, index)|; as a
+            maximum of consistent bounds it is itself consistent
+        Args:
+            goal: (row, col) the searches will head for
+        '''
+        if self._dirty: self._build()
+        cols = self._maze._num_cols
+        target = self._maze._index(goal)
+        goal_row, goal_col = divmod(target, cols)
+        # landmarks that cannot reach the goal give no bound
+        pairs = [(distances, distances[target]) for distances in self._distances \
+                 if distances[target] >= 0]
+
+        def alt(index: int) -> int:
+            row, col = divmod(index, cols)
+            best = abs(row - goal_row) + abs(col - goal_col)
+            for distances, to_goal in pairs:
+                steps = distances[index]
+                if steps >= 0 and abs(steps - to_goal) > best: best = abs(steps - to_goal)
+            return best
+        return alt
+
+###############################################################################
+###############################################################################
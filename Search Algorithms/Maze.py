@@ -9,10 +9,17 @@ Date:       8 November 2021
 from Stack import *
 from Queue import *
 from PriorityQueue import *
-import copy
+from BucketQueue import *
+from Metrics import *
+from PathCache import *
 from enum import Enum
-from typing import List, NamedTuple, Optional
+from array import array
+from collections import deque
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 import random
+import re
+import weakref
 
 ###############################################################################
 ###############################################################################
@@ -28,6 +35,21 @@ class Contents(str, Enum):
     BLOCKED = "X"
     PATH    = "*"
 
+# the maze grid stores each cell as the byte of its Contents character, so
+# these map between the two representations
+_CONTENTS = {ord(c.value): c for c in Contents}
+_BLOCKED  = ord(Contents.BLOCKED.value)
+_PATH     = ord(Contents.PATH.value)
+_EMPTY    = ord(Contents.EMPTY.value)
+_OPEN_RUN = re.compile(rb"[^" + Contents.BLOCKED.value.encode("ascii") + rb"]+")
+# maps a grid byte to the digit of its bit in bitset_bfs's free-cell mask
+_FREE_BITS = bytes(ord("0") if code == _BLOCKED else ord("1") for code in range(256))
+
+# names of the Maze methods that search from the start to the goal
+# (ida_star is left out: with no expansion budget one query can run for hours)
+SEARCHES = ("dfs", "bfs", "a_star", "dijkstra", "jps", "bidirectional_bfs", "bidirectional_a_star", \
+            "bitset_bfs", "ara_star")
+
 ###############################################################################
 ###############################################################################
 
@@ -41,16 +63,41 @@ class Position(NamedTuple):
 
 class Cell:
     ''' allows us to use Cell as a data type -- an ordered triple of
-        row, column, cell contents '''
+        row, column, cell contents; a Cell bound to a Maze is only a view of
+        that maze's flat grid, so reading or writing its contents reads or
+        writes the grid '''
+
+    __slots__ = ('_position', '_code', '_maze')
 
     ##########
-    def __init__(self, row: int, col: int, contents: Contents):
+    def __init__(self, row: int, col: int, contents: Optional[Contents], \
+                       maze: Optional['Maze'] = None):
+        '''
+        Args:
+            row:      row of the cell
+            col:      column of the cell
+            contents: contents of a free-standing cell (ignored when bound)
+            maze:     the Maze whose grid holds this cell's contents, if any
+        '''
         self._position = Position(row, col)
-        self._contents = contents
+        self._maze     = maze
+        self._code     = None if maze is not None else ord(contents.value)
+
+    ##########
+    @property
+    def _contents(self) -> Contents:
+        if self._maze is None: return _CONTENTS[self._code]
+        return _CONTENTS[self._maze._cells[self._maze._index(self._position)]]
+
+    ##########
+    @_contents.setter
+    def _contents(self, contents: Contents) -> None:
+        if self._maze is None: self._code = ord(contents.value)
+        else: self._maze._set_code(self._maze._index(self._position), ord(contents.value))
 
     ##########
     def get_position(self) -> Position:
-        return Position(self._position.row, self._position.col)
+        return self._position
 
     ##########
     def mark_on_path(self) -> None:
@@ -80,6 +127,8 @@ class Cell:
 
 class Node:
 
+    __slots__ = ('cell', 'parent', 'cost', 'heuristic')
+
     ##########
     def __init__(self, cell: Cell, parent: Optional['Node'], cost: float, heuristic: float):
         self.cell       = cell
@@ -99,20 +148,185 @@ class Node:
 ###############################################################################
 ###############################################################################
 
+class Path:
+    ''' compact search result: instead of a chain of Nodes, keeps the
+        parent-index array the search filled in (4 bytes per cell) and the
+        flat index the path ends at; the path is only walked when asked '''
+
+    __slots__ = ('_maze', '_parents', '_end', '_distances')
+
+    ##########
+    def __init__(self, maze: 'Maze', parents: array, end: int, distances: Optional[array] = None):
+        '''
+        Args:
+            maze:      the Maze the search ran on
+            parents:   parent flat index of every reached cell (-1 for none)
+            end:       flat index of the last cell on the path
+            distances: optional steps from the start of every reached cell,
+                       e.g., a DistanceField's, making len O(1)
+        '''
+        self._maze      = maze
+        self._parents   = parents
+        self._end       = end
+        self._distances = distances
+
+    ##########
+    def __iter__(self) -> Iterator[int]:
+        ''' yields the flat indices on the path, from its end back to its
+            start, without building a list '''
+        parents, index = self._parents, self._end
+        while index != -1:
+            yield index
+            index = parents[index]
+
+    ##########
+    def __len__(self) -> int:
+        ''' returns the number of cells on the path '''
+        if self._distances is not None: return self._distances[self._end] + 1
+        return sum(1 for index in self)
+
+    ##########
+    def cells(self) -> Iterator[Cell]:
+        ''' yields Cell views of the path, from its end back to its start '''
+        for index in self: yield self._maze._cell(index)
+
+    ##########
+    def to_node(self) -> Node:
+        ''' returns the path as the equivalent chain of Nodes '''
+        return self._maze._trace(self._parents, self._end)
+
+###############################################################################
+###############################################################################
+
+class DistanceField:
+    ''' result of one BFS flood fill from a source cell: the number of
+        steps from the source to every cell (-1 if it cannot be reached)
+        and the parent of every reached cell, each an int32 array, so the
+        shortest path from the source to any goal is read off in O(path) '''
+
+    __slots__ = ('_maze', 'source', 'distances', 'parents')
+
+    ##########
+    def __init__(self, maze: 'Maze', source: int, distances: array, parents: array):
+        self._maze     = maze
+        self.source    = source      # flat index of the source cell
+        self.distances = distances
+        self.parents   = parents
+
+    ##########
+    def distance(self, position: Position) -> Optional[int]:
+        ''' returns the number of steps on a shortest path from the source to
+            the given position, or None if there is none, in O(1) '''
+        steps = self.distances[self._maze._index(position)]
+        return None if steps < 0 else steps
+
+    ##########
+    def path(self, position: Position, compact: bool = False) -> Optional[Union[Node, Path]]:
+        ''' returns a shortest path from the source to the given position,
+            like a search result: the Node at the position, whose parents
+            lead back to the source (or a Path, if compact), with the cost of
+            every node its distance; None if there is no path '''
+        index = self._maze._index(position)
+        if self.distances[index] < 0: return None
+        if compact: return Path(self._maze, self.parents, index, self.distances)
+        return self._maze._trace(self.parents, index, self.distances)
+
+###############################################################################
+###############################################################################
+
+class SearchStep(NamedTuple):
+    ''' what a step-wise search yields: its state after a batch of
+        expansions, or its outcome as the last item '''
+
+    status:    str    # "running", or how it ended: "found", "exhausted" or "budget"
+    expanded:  int    # cells expanded so far
+    generated: int    # cells generated so far
+    frontier:  int    # cells waiting on the frontier
+    path:      Optional[Union[Node, Path]]
+    # running: Path to the cell just expanded; found: the path to the goal
+    # (Nodes or a Path, per compact); budget: the same to the explored cell
+    # nearest the goal, the best so far; exhausted: None
+
+##########
+class AnytimeStep(NamedTuple):
+    ''' what ara_star_steps yields each time it finds a better path '''
+
+    epsilon:   float  # the path costs at most epsilon times the optimum
+    expanded:  int    # cells expanded so far, over every pass
+    generated: int    # cells generated so far, over every pass
+    path:      Union[Node, Path]
+
+##########
+def last_step(steps: Iterator[SearchStep]) -> SearchStep:
+    ''' runs a step-wise search to the end and returns its outcome '''
+    return deque(steps, maxlen = 1)[0]
+
+###############################################################################
+###############################################################################
+
+def _walk(path: Union[Node, Path]) -> Iterator[Cell]:
+    ''' yields the cells of a Node chain or a Path, from its end back to
+        its start '''
+    if isinstance(path, Path):
+        yield from path.cells()
+        return
+    while path is not None:
+        yield path.cell
+        path = path.parent
+
+###############################################################################
+###############################################################################
+
 def manhattan(from_: Cell, to_: Cell) -> float:
     ''' Heuristic function for A* algorithm '''
 
-    col_distance = abs(to_.get_position().col - from_.get_position().col)
-    row_distance = abs(to_.get_position().row - from_.get_position().row)
-    return col_distance + row_distance
+    from_, to_ = from_._position, to_._position
+    return abs(to_.col - from_.col) + abs(to_.row - from_.row)
+
+###############################################################################
+###############################################################################
+
+def _random_grid(rows: int, cols: int, prop_blocked: float, keep_free: Tuple[int, ...]) -> bytearray:
+    ''' draws a row-major grid with exactly round((rows * cols - 2) *
+        prop_blocked) blocked cells, uniformly at random, none of them at the
+        flat indices in keep_free (the start and goal)
+
+        The mask is drawn in one call: random bytes are mapped straight to
+        Contents characters with bytes.translate, blocking each cell with
+        probability about prop_blocked.  Given its blocked count, such a
+        mask is a uniformly random subset of that size, so a few cells
+        picked uniformly at random are then freed (or blocked) to hit the
+        exact count without biasing the result.
+    Returns:
+        the grid as a bytearray of Contents characters
+    '''
+    size = rows * cols
+    target = round((size - 2) * prop_blocked)
+    cut = round(prop_blocked * 256)
+    table = bytes(_BLOCKED if value < cut else _EMPTY for value in range(256))
+    cells = bytearray(random.randbytes(size).translate(table))
+    for index in keep_free: cells[index] = _EMPTY
+
+    blocked = cells.count(_BLOCKED)
+    # flip randomly chosen cells of the over-represented kind
+    source, replacement = (_BLOCKED, _EMPTY) if blocked > target else (_EMPTY, _BLOCKED)
+    for i in range(abs(blocked - target)):
+        index = random.randrange(size)
+        while cells[index] != source or index in keep_free:
+            index = random.randrange(size)
+        cells[index] = replacement
+    return cells
 
 ###############################################################################
 ###############################################################################
 
 class Maze:
-    ''' class representing a 2D maxe of Cell objects '''
+    ''' class representing a 2D maze of cells, stored as a flat row-major
+        bytearray of Contents characters '''
 
     _order = 0
+    MAX_FIELDS = 16   # distance fields kept per maze; the oldest is dropped first
+    PATH_CACHE_BYTES = 1 << 20   # size limit of each maze's cached_path cache
 
     ##########
     def __init__(self, rows: int = 10, cols: int = 10, prop_blocked: float = 0.2, \
@@ -125,35 +339,123 @@ class Maze:
             prop_blocked:  proportion of cells to be blocked
             start:         tuple indicating the (row,col) of the start cell
             goal:          tuple indicating the (row,col) of the goal cell
+        Raises:
+            ValueError exception if prop_blocked is not between 0 and 1
+        '''
+        if not 0 <= prop_blocked <= 1:
+            raise ValueError(f"Error in Maze(): prop_blocked {prop_blocked} is not between 0 and 1")
+        cells = _random_grid(rows, cols, prop_blocked, \
+                             (start.row * cols + start.col, goal.row * cols + goal.col))
+        self._setup(rows, cols, cells, start, goal)
+
+    ##########
+    def _setup(self, rows: int, cols: int, cells: bytearray, start: Position, goal: Position, \
+               mark: bool = True) -> None:
+        ''' private method filling in a new maze around a ready-made grid
+        Args:
+            rows:  number of rows in the grid
+            cols:  number of columns in the grid
+            cells: row-major grid, one byte (the Contents character) per cell
+            start: (row,col) of the start cell
+            goal:  (row,col) of the goal cell
+            mark:  write the start and goal into the grid; False for a
+                   read-only grid
         '''
         self._num_rows = rows
         self._num_cols = cols
-        self._start    = Cell(start.row, start.col, Contents.START)
-        self._goal     = Cell(goal.row,  goal.col,  Contents.GOAL)
         self._search_count = 0
+        self._peak_frontier = 0   # frontier high-water mark of the last search
+        self._adjacency_cache: Optional[Tuple[array, array]] = None
+        self._component_cache: Optional[array] = None
+        self._weights: Optional[bytearray] = None   # cost of entering each cell, None for all 1
+        self._fields: Dict[int, DistanceField] = {}   # distance_field cache, by source index
+        # notified by _set_code of blocked/free changes; held weakly, so a watcher
+        # lives only as long as its owner keeps it
+        self._watchers: weakref.WeakSet = weakref.WeakSet()
+        self._version = 0   # goes up whenever a cell becomes blocked or free or the weights change
+        self._path_cache = PathCache(Maze.PATH_CACHE_BYTES)   # cached_path results, by version
+        self._cells = cells
+
+        self._start = Cell(start.row, start.col, None, self)
+        self._goal  = Cell(goal.row,  goal.col,  None, self)
+        if mark:
+            self._start._contents = Contents.START
+            self._goal._contents  = Contents.GOAL
 
-        self._grid: List[List[Cell]] = \
-            [ [Cell(r,c, Contents.EMPTY) for c in range(cols)] for r in range(rows) ]
-
-        self._grid[start.row][start.col] = self._start
-        self._grid[goal.row][goal.col]   = self._goal
+    ##########
+    @classmethod
+    def _read_only(cls, rows: int, cols: int, cells: memoryview, offsets: memoryview, \
+                   targets: memoryview, labels: memoryview, weights: Optional[bytes]) -> 'Maze':
+        ''' private constructor of a maze over read-only buffers (the grid,
+            its CSR adjacency and component labels, as unsigned bytes and
+            int32 memoryviews), e.g., views of shared memory; it can answer
+            queries aimed with _aim but not be edited or show paths '''
+        maze = cls.__new__(cls)
+        maze._setup(rows, cols, cells, Position(0, 0), Position(0, 0), mark = False)
+        maze._adjacency_cache = (offsets, targets)
+        maze._component_cache = labels
+        maze._weights = weights
+        return maze
 
-        options = [cell for row in self._grid for cell in row]
-        options.remove(self._start)
-        options.remove(self._goal)
-        blocked = random.sample(options, k = round((rows * cols - 2) * prop_blocked))
-        for b in blocked: b._contents = Contents.BLOCKED
+    ##########
+    @classmethod
+    def from_cells(cls, rows: int, cols: int, cells: bytearray, \
+                        start: Position, goal: Position) -> 'Maze':
+        ''' builds a maze around an existing row-major grid of Contents
+            characters (which the maze takes over, not copies), e.g., one
+            written by a maze generator '''
+        if len(cells) != rows * cols:
+            raise ValueError(f"Error in Maze.from_cells(): {len(cells)} cells for {rows}x{cols} grid")
+        maze = cls.__new__(cls)
+        maze._setup(rows, cols, cells, start, goal)
+        return maze
 
     ##########
     def __str__(self) -> str:
         ''' returns a str version of the maze, showing contents, with cells
             deliminted by vertical pipes '''
-        maze_str = ""
-        for row in self._grid:
-            maze_str += "|" \
-                + "|".join([f"{int(cell._contents):2}" if not isinstance(cell._contents, str) else \
-                            f"{cell._contents:2}" for cell in row]) + "|\n"
-        return maze_str[:-1]
+        return self.render()
+
+    ##########
+    def render(self, path: Optional[Union[Node, Path]] = None) -> str:
+        ''' returns the maze as a str like __str__, with the cells of the
+            given path (other than the start and goal) shown as on the path,
+            leaving the maze itself unchanged -- e.g., to draw each step of
+            a step-wise search '''
+        cells = self._cells
+        if path is not None:
+            cells = bytearray(cells)
+            ends = (self._index(self._start._position), self._index(self._goal._position))
+            for cell in _walk(path):
+                index = self._index(cell._position)
+                if index not in ends: cells[index] = _PATH
+        cols = self._num_cols
+        rows = [cells[r * cols:(r + 1) * cols].decode("ascii") for r in range(self._num_rows)]
+        return "\n".join("|" + " |".join(row) + " |" for row in rows)
+
+    ##########
+    def reset(self) -> None:
+        ''' clears the search state left by earlier searches -- the search
+            count, the frontier high-water mark and any cells show_path marked
+            as on the path -- leaving the maze layout as it was '''
+        self._search_count  = 0
+        self._peak_frontier = 0
+        if _PATH in self._cells:
+            self._cells[:] = self._cells.replace(bytes([_PATH]), bytes([_EMPTY]))
+
+    ##########
+    def clone(self) -> 'Maze':
+        ''' returns a cheap copy of the maze for marking paths on: only the
+            flat contents buffer is copied, the (never mutated) neighbour
+            cache is shared, and the copy starts with fresh search state and
+            no watchers '''
+        other = Maze.from_cells(self._num_rows, self._num_cols, bytearray(self._cells), \
+                                self._start._position, self._goal._position)
+        other._adjacency_cache = self._adjacency_cache
+        other._component_cache = self._component_cache
+        other._weights = self._weights
+        other.reset()
+        return other
 
     ##########
     def get_start(self): return self._start
@@ -161,6 +463,277 @@ class Maze:
     ##########
     def get_goal(self):  return self._goal
 
+    ##########
+    def get_version(self) -> int:
+        ''' returns the maze's version, which goes up on every change that
+            can change a search's result: a cell becoming blocked or free, or
+            new terrain weights '''
+        return self._version
+
+    ##########
+    def get_path_cache(self) -> PathCache:
+        ''' returns the cache behind cached_path, e.g., for its counters '''
+        return self._path_cache
+
+    ##########
+    def set_endpoints(self, start: Position, goal: Position) -> None:
+        ''' moves the start and goal to the given positions; the old start
+            and goal cells become empty
+        Raises:
+            ValueError exception if either position is blocked
+        '''
+        for position in (start, goal):
+            if self._cells[self._index(position)] == _BLOCKED:
+                raise ValueError(f"Error in Maze.set_endpoints(): {position} is blocked")
+        self._start._contents = Contents.EMPTY
+        self._goal._contents  = Contents.EMPTY
+        self._start = Cell(start.row, start.col, None, self)
+        self._goal  = Cell(goal.row,  goal.col,  None, self)
+        self._start._contents = Contents.START
+        self._goal._contents  = Contents.GOAL
+
+    ##########
+    def set_weights(self, weights: Optional[bytes]) -> None:
+        ''' gives every cell a terrain weight, the cost of stepping into it,
+            used by dijkstra and a_star; the unweighted searches ignore it
+        Args:
+            weights: one byte per cell (1 to 255) in row-major order, or
+                     None to make every step cost 1 again
+        Raises:
+            ValueError exception if the size is wrong or a weight is 0
+        '''
+        if weights is not None:
+            if len(weights) != self._num_rows * self._num_cols:
+                raise ValueError(f"Error in Maze.set_weights(): {len(weights)} weights for " \
+                                 f"{self._num_rows}x{self._num_cols} grid")
+            if 0 in weights:
+                raise ValueError("Error in Maze.set_weights(): weights must be at least 1")
+            weights = bytes(weights)   # never mutated, so clones can share it
+        self._weights = weights
+        self._version += 1
+
+    ##########
+    def get_weight(self, position: Position) -> int:
+        ''' returns the cost of stepping into the cell at the given position '''
+        return 1 if self._weights is None else self._weights[self._index(position)]
+
+    ##########
+    def _aim(self, start: Position, goal: Position) -> None:
+        ''' private method pointing the searches at a new start and goal
+            without writing them into the grid, as set_endpoints does, so
+            that a read-only maze can answer many queries
+        Raises:
+            ValueError exception if either position is off the grid or blocked
+        '''
+        for position in (start, goal):
+            if not (0 <= position.row < self._num_rows and 0 <= position.col < self._num_cols):
+                raise ValueError(f"Error in Maze._aim(): {position} is off the grid")
+            if self._cells[self._index(position)] == _BLOCKED:
+                raise ValueError(f"Error in Maze._aim(): {position} is blocked")
+        self._start = Cell(start.row, start.col, None, self)
+        self._goal  = Cell(goal.row,  goal.col,  None, self)
+
+    ##########
+    def _index(self, position: Position) -> int:
+        ''' returns the flat, row-major index of the given position '''
+        return position.row * self._num_cols + position.col
+
+    ##########
+    def _set_code(self, index: int, code: int) -> None:
+        ''' private method through which every change to the grid is made;
+            if the cell became blocked or free, drops the cached adjacency,
+            component labels and distance fields, moves the version on and
+            tells every registered watcher (any object with a cell_changed
+            (index) method, e.g., an HPAStar) about the change '''
+        changed = (self._cells[index] == _BLOCKED) != (code == _BLOCKED)
+        self._cells[index] = code
+        if changed:
+            self._adjacency_cache = None
+            self._component_cache = None
+            self._fields = {}
+            self._version += 1
+            for watcher in self._watchers: watcher.cell_changed(index)
+
+    ##########
+    def _cell(self, index: int) -> Cell:
+        ''' materialises a Cell view of the grid cell at the given flat index '''
+        row, col = divmod(index, self._num_cols)
+        return Cell(row, col, None, self)
+
+    ##########
+    def get_cell(self, position: Position) -> Cell:
+        ''' returns the Cell at the given (row, col) position '''
+        return self._cell(self._index(position))
+
+    ##########
+    def set_contents(self, position: Position, contents: Contents) -> None:
+        ''' sets the contents of the cell at the given (row, col) position '''
+        self._set_code(self._index(position), ord(contents.value))
+
+    ##########
+    def _neighbours(self, index: int) -> List[int]:
+        ''' returns the flat indices of the unblocked cells next to the cell
+            at the given flat index, using index arithmetic only
+        Args:
+            index: flat index of the current cell being explored
+        Returns:
+            a list of flat indices (up, down, left, right order)
+        '''
+        cells = self._cells
+        cols  = self._num_cols
+        row, col = divmod(index, cols)
+        valid = []
+
+        if row != 0 and cells[index - cols] != _BLOCKED:
+            valid.append(index - cols)
+        if row + 1 != self._num_rows and cells[index + cols] != _BLOCKED:
+            valid.append(index + cols)
+        if col != 0 and cells[index - 1] != _BLOCKED:
+            valid.append(index - 1)
+        if col + 1 != cols and cells[index + 1] != _BLOCKED:
+            valid.append(index + 1)
+
+        return valid
+
+    ##########
+    def _adjacency(self) -> Tuple[array, array]:
+        ''' returns the compressed (CSR) adjacency of the maze, building and
+            caching it on first use: the unblocked neighbours of the cell at
+            flat index i are targets[offsets[i]:offsets[i+1]]
+        Returns:
+            a tuple (offsets, targets) of int32 arrays
+        '''
+        if self._adjacency_cache is None:
+            size    = self._num_rows * self._num_cols
+            offsets = array('i', bytes(4 * (size + 1)))
+            targets = array('i')
+            for index in range(size):
+                if self._cells[index] != _BLOCKED:
+                    targets.extend(self._neighbours(index))
+                offsets[index + 1] = len(targets)
+            self._adjacency_cache = (offsets, targets)
+        return self._adjacency_cache
+
+    ##########
+    def _components(self) -> array:
+        ''' returns the connected-component label of every cell (-1 for a
+            blocked cell), labelling the grid on first use and caching it;
+            two free cells are connected if and only if their labels match
+
+            One scanline sweep: each row is split into runs of free cells,
+            runs overlapping a run in the row above are merged with a
+            union-find over run numbers, and each run's cells are then
+            filled with its root's label.
+        Returns:
+            an int32 array of labels, by flat index
+        '''
+        if self._component_cache is None:
+            cols = self._num_cols
+            runs: List[Tuple[int, int]] = []   # (first, end) flat index of each run
+            parent: List[int] = []
+            def find(run: int) -> int:
+                while parent[run] != run:
+                    parent[run] = parent[parent[run]]
+                    run = parent[run]
+                return run
+
+            above: List[Tuple[int, int, int]] = []   # (first col, end col, run) in the row above
+            for r in range(self._num_rows):
+                row = self._cells[r * cols:(r + 1) * cols]
+                here, k = [], 0
+                for match in _OPEN_RUN.finditer(row):
+                    first, end = match.span()
+                    run = len(runs)
+                    runs.append((r * cols + first, r * cols + end))
+                    parent.append(run)
+                    here.append((first, end, run))
+                    # merge with every run above overlapping columns first..end-1
+                    while k < len(above) and above[k][1] <= first: k += 1
+                    j = k
+                    while j < len(above) and above[j][0] < end:
+                        a, b = find(above[j][2]), find(run)
+                        if a != b: parent[max(a, b)] = min(a, b)
+                        j += 1
+                    if j > k: k = j - 1   # the last overlapping run may reach the next run
+                above = here
+
+            labels = array('i', [-1]) * (self._num_rows * cols)
+            for run, (first, end) in enumerate(runs):
+                labels[first:end] = array('i', [find(run)]) * (end - first)
+            self._component_cache = labels
+        return self._component_cache
+
+    ##########
+    def is_connected(self, a: Optional[Position] = None, b: Optional[Position] = None) -> bool:
+        ''' returns whether a path of free cells joins two positions (by
+            default the start and goal); the first call labels the whole
+            grid in one linear sweep, and every later call, until the grid
+            changes, is a constant-time lookup
+        Args:
+            a: (row, col) of the first cell, or None for the start
+            b: (row, col) of the second cell, or None for the goal
+        '''
+        labels = self._components()
+        i = self._index(self._start._position if a is None else a)
+        j = self._index(self._goal._position if b is None else b)
+        return labels[i] != -1 and labels[i] == labels[j]
+
+    ##########
+    def _separated(self, i: int, j: int) -> bool:
+        ''' private check run at the top of every search: True if the
+            component labels are already cached and put the flat indices i
+            and j in different components, so the search can fail at once '''
+        labels = self._component_cache
+        return labels is not None and (labels[i] == -1 or labels[i] != labels[j])
+
+    ##########
+    def distance_field(self, source: Optional[Position] = None) -> DistanceField:
+        ''' returns the BFS distance field from the source (by default the
+            start), flooding the whole maze once per source and caching the
+            result until the grid changes, so that the shortest paths to
+            many goals cost one flood plus O(path) each
+        Args:
+            source: (row, col) of the cell to measure distances from
+        Raises:
+            ValueError exception if the source is blocked
+        '''
+        index = self._index(self._start._position if source is None else source)
+        field = self._fields.get(index)
+        if field is not None: return field
+        if self._cells[index] == _BLOCKED:
+            raise ValueError(f"Error in Maze.distance_field(): {source} is blocked")
+
+        if len(self._fields) >= Maze.MAX_FIELDS:
+            del self._fields[next(iter(self._fields))]
+        field = self._fields[index] = DistanceField(self, index, *self._flood(index))
+        return field
+
+    ##########
+    def _flood(self, index: int) -> Tuple[array, array]:
+        ''' private BFS flood fill from the flat index over the whole maze,
+            one level at a time
+        Returns:
+            int32 arrays of the steps from the index to every cell (-1 if
+            unreachable) and of the parent of every reached cell
+        '''
+        size = self._num_rows * self._num_cols
+        offsets, targets = self._adjacency()
+        distances = array('i', [-1]) * size
+        parents   = array('i', [-1]) * size
+        distances[index] = 0
+        level, steps = [index], 0
+        while level:
+            steps += 1
+            following = []
+            for i in level:
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if distances[j] < 0:
+                        distances[j] = steps
+                        parents[j] = i
+                        following.append(j)
+            level = following
+        return distances, parents
+
     ##########
     def get_search_locations(self, cell: Cell) -> List[Cell]:
         ''' return a list of Cell objects of valid places to explore
@@ -169,157 +742,1127 @@ class Maze:
         Returns:
             a list of valid Cell objects for further exploration
         '''
-        valid_cells = []
-        locations = []
-
-        if cell._position.row != 0:
-            locations.append(self._grid[cell._position.row-1][cell._position.col])
-        if cell._position.row+1 != self._num_rows:
-            locations.append(self._grid[cell._position.row+1][cell._position.col])
-        if cell._position.col != 0:
-            locations.append(self._grid[cell._position.row][cell._position.col-1])
-        if cell._position.col+1 != self._num_cols:
-            locations.append(self._grid[cell._position.row][cell._position.col+1])
-
-        for location in locations:
-            if location.is_blocked() is False:
-                valid_cells.append(location)
-
-        return valid_cells
+        offsets, targets = self._adjacency()
+        index = self._index(cell._position)
+        return [self._cell(i) for i in targets[offsets[index]:offsets[index + 1]]]
 
     ##########
-    def dfs(self) -> Optional[Node]:
+    def dfs(self, compact: bool = False, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
         '''
         Use DFS + stack:
-            stack: push new Nodes (wrappers around cells) to be explored
-                    which will also keep track of the parent
-            list:  cells already explored
+            stack: push flat indices of cells to be explored
+            array: parent flat index of every reached cell, from which the
+                   path is rebuilt once the goal is found
+            bytearray: one flag per cell (by flat index) marking cells
+                       already explored
+        Args:
+            compact: return a Path over the parent array instead of Nodes
+            metrics: instrumentation told about the search, e.g., a
+                     SearchMetrics; the default records nothing
         Return:
-            current node if it is the goal
+            (goal node or Path, search count) if the goal can be reached
             None, if no goal can be found
         '''
-        stack = Stack()
-        stack.push(Node(self._start, None, None, None))
-
-        explored_list = [self._start]
-
-        try:
-            while not stack.is_empty():
-                node = stack.pop()
-                for loc in self.get_search_locations(node.cell):
-                    if loc not in explored_list:
-                        self._search_count += 1
-                        stack.push(Node(loc, node, None, None))
-                        explored_list.append(node.cell)
-                        if loc == self._goal: return Node(self._goal, node, None, None), self._search_count
-        except:
-            return None
+        return self._first_search(Stack(), compact, metrics, "dfs")
 
     ##########
-    def bfs(self) -> Optional[Node]:
+    def bfs(self, compact: bool = False, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
         '''
         Use BFS + queue:
-            queue: push new Nodes (wrappers around cells) to be explored
-                    which will also keep track of the parent
-            list:  cells already explored
+            queue: push flat indices of cells to be explored
+            array: parent flat index of every reached cell, from which the
+                   path is rebuilt once the goal is found
+            bytearray: one flag per cell (by flat index) marking cells
+                       already explored
+        Args:
+            compact: return a Path over the parent array instead of Nodes
+            metrics: instrumentation told about the search, e.g., a
+                     SearchMetrics; the default records nothing
         Return:
-            current node if it is the goal
+            (goal node or Path, search count) if the goal can be reached
             None, if no goal can be found
         '''
-        queue = Queue()
-        queue.push(Node(self._start, None, None, None))
+        return self._first_search(Queue(), compact, metrics, "bfs")
 
-        explored_list = [self._start]
+    ##########
+    def _first_search(self, frontier: Union[Stack, Queue], compact: bool, \
+                      metrics: NoMetrics, name: str) -> Optional[Node]:
+        ''' shared loop of dfs (given a Stack) and bfs (given a Queue) '''
+        metrics.start(name)
+        size  = self._num_rows * self._num_cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        offsets, targets = self._adjacency()
+
+        parents  = array('i', [-1]) * size
+        if start == goal:
+            self._finish(metrics, 0, 1, 0, 1)
+            return self._result(parents, goal, compact), 0
+        explored = bytearray(size)   # one byte per cell
+        explored[start] = 1
+        frontier.push(start)
+        count = peak = 0
+        track = metrics.enabled   # the frontier only grows between pops, so checking
+                                  # its size before each pop finds its peak
+
+        while not frontier.is_empty():
+            if track and len(frontier) > peak: peak = len(frontier)
+            i = frontier.pop()
+            for index in targets[offsets[i]:offsets[i + 1]]:
+                if not explored[index]:
+                    explored[index] = 1
+                    parents[index] = i
+                    count += 1
+                    frontier.push(index)
+                    if index == goal:
+                        peak = max(peak, len(frontier)) if track else 0
+                        self._finish(metrics, count, peak, count + 1 - len(frontier), count + 1)
+                        return self._result(parents, goal, compact), count
+        return self._finish(metrics, count, peak, count + 1, count + 1)
 
-        try:
-            while not queue.is_empty():
-                node = queue.pop()
-                for loc in self.get_search_locations(node.cell):
-                    if loc not in explored_list:
-                        self._search_count += 1
-                        queue.push(Node(loc, node, None, None))
-                        explored_list.append(node.cell)
-                        if loc == self._goal: return Node(self._goal, node, None, None), self._search_count
-        except:
-            return None
+    ##########
+    def _finish(self, metrics: NoMetrics, count: int, peak_frontier: int, \
+                expanded: Union[int, Callable[[], int]], visited: Union[int, Callable[[], int]]) -> None:
+        ''' private method every search ends with: stores its search count
+            (cells generated) and frontier high-water mark on the maze and,
+            if metrics are enabled, reports them with the cells expanded and
+            visited, which may be given as callables so that they are only
+            counted when someone is listening
+        Returns:
+            None, so that a search failing can return this directly
+        '''
+        self._search_count  = count
+        self._peak_frontier = peak_frontier
+        if metrics.enabled:
+            if callable(expanded): expanded = expanded()
+            if callable(visited):  visited  = visited()
+            metrics.stop(expanded, count, peak_frontier, visited)
 
     ##########
-    def a_star(self) -> Optional[Node]:
-        to_explore = PriorityQueue()
-        explored = {}
+    def dfs_steps(self, every: int = 1, max_expansions: Optional[int] = None, \
+                  deadline: Optional[float] = None, compact: bool = False) -> Iterator[SearchStep]:
+        ''' step-wise dfs: a generator yielding a running SearchStep every
+            given number of expansions and a last SearchStep with the outcome,
+            so the caller can watch, draw, or abandon the search
+        Args:
+            every:          expansions between running steps
+            max_expansions: stop with status "budget" after this many
+            deadline:       stop with status "budget" once perf_counter()
+                            passes this time (checked between batches)
+            compact:        give the found or best path as a Path
+        '''
+        return self._first_steps(Stack(), every, max_expansions, deadline, compact)
+
+    ##########
+    def bfs_steps(self, every: int = 1, max_expansions: Optional[int] = None, \
+                  deadline: Optional[float] = None, compact: bool = False) -> Iterator[SearchStep]:
+        ''' step-wise bfs, yielding SearchSteps like dfs_steps '''
+        return self._first_steps(Queue(), every, max_expansions, deadline, compact)
 
-        n = self._start
-        g_n = 0.0
-        h_n = manhattan(self._start, self._goal)
-        f_n = g_n + h_n
+    ##########
+    def _first_steps(self, frontier: Union[Stack, Queue], every: int, max_expansions: Optional[int], \
+                     deadline: Optional[float], compact: bool) -> Iterator[SearchStep]:
+        ''' generator version of _first_search, behind dfs_steps and bfs_steps '''
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        if self._separated(start, goal):
+            yield SearchStep("exhausted", 0, 0, 0, None)
+            return
+        offsets, targets = self._adjacency()
+
+        parents  = array('i', [-1]) * size
+        if start == goal:
+            self._search_count = 0
+            yield SearchStep("found", 0, 0, 0, self._result(parents, goal, compact))
+            return
+        explored = bytearray(size)
+        explored[start] = 1
+        frontier.push(start)
+        expanded = count = 0
+
+        while not frontier.is_empty():
+            batch = every if max_expansions is None else min(every, max_expansions - expanded)
+            if batch <= 0 or (deadline is not None and perf_counter() >= deadline):
+                self._search_count = count
+                yield SearchStep("budget", expanded, count, len(frontier), \
+                                 self._result(parents, self._nearest(explored, goal), compact))
+                return
+            for n in range(batch):
+                if frontier.is_empty(): break
+                i = frontier.pop()
+                expanded += 1
+                for index in targets[offsets[i]:offsets[i + 1]]:
+                    if not explored[index]:
+                        explored[index] = 1
+                        parents[index] = i
+                        count += 1
+                        frontier.push(index)
+                        if index == goal:
+                            self._search_count = count
+                            yield SearchStep("found", expanded, count, len(frontier), \
+                                             self._result(parents, goal, compact))
+                            return
+            else:
+                yield SearchStep("running", expanded, count, len(frontier), Path(self, parents, i))
+
+        self._search_count = count
+        yield SearchStep("exhausted", expanded, count, 0, None)
+
+    ##########
+    def _nearest(self, marked: bytearray, goal: int, default: int = -1) -> int:
+        ''' returns the flat index of the marked cell nearest the goal (by
+            Manhattan distance), or the default if none is marked; each row
+            is searched outwards from the goal's column with bytearray.find
+            and rfind, so the scan runs at C speed '''
+        cols = self._num_cols
+        goal_row, goal_col = divmod(goal, cols)
+        best, best_h = default, self._num_rows + cols
+        for row in range(self._num_rows):
+            if abs(row - goal_row) >= best_h: continue
+            first = row * cols
+            for index in (marked.rfind(1, first, first + goal_col + 1), \
+                          marked.find(1, first + goal_col, first + cols)):
+                if index != -1 and abs(row - goal_row) + abs(index - first - goal_col) < best_h:
+                    best, best_h = index, abs(row - goal_row) + abs(index - first - goal_col)
+        return best
+
+    ##########
+    def a_star_steps(self, every: int = 1, max_expansions: Optional[int] = None, \
+                     deadline: Optional[float] = None, compact: bool = False, \
+                     heuristic: Optional[Callable[[int], int]] = None) -> Iterator[SearchStep]:
+        ''' step-wise a_star, yielding SearchSteps like dfs_steps; like a_star,
+            on a maze with terrain weights each step costs the weight of the
+            cell stepped into and the heuristic is scaled by the smallest
+            weight, so the path found is the cheapest one
+        Args:
+            heuristic: lower bound on the steps to the goal, as for a_star;
+                       the Manhattan distance if None
+        '''
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal):
+            yield SearchStep("exhausted", 0, 0, 0, None)
+            return
+        offsets, targets = self._adjacency()
+        weights = self._weights
+        least   = 1 if weights is None else min(weights)
+
+        def h(j: int) -> int:
+            if heuristic is not None: return least * heuristic(j)
+            row, col = divmod(j, cols)
+            return least * (abs(row - goal_row) + abs(col - goal_col))
+
+        g_score = array('i', [2**31 - 1]) * size   # stands in for infinity
+        parents = array('i', [-1]) * size
+        closed  = bytearray(size)
+        scale   = 2**31   # key = f * scale - g, so equal f prefers larger g, as in a_star
+        expanded = count = 0
 
-        to_explore.insert(f_n, Node(n, None, g_n, h_n))
-        explored[n._position] = g_n
+        to_explore = PriorityQueue()
+        g_score[start] = 0
+        to_explore.insert(h(start) * scale, start)
 
         while not to_explore.is_empty():
-            e = to_explore.remove_min()
-            n = e._value
-            if n.cell == self._goal: return n, self._search_count
+            batch = every if max_expansions is None else min(every, max_expansions - expanded)
+            if batch <= 0 or (deadline is not None and perf_counter() >= deadline):
+                self._search_count = count
+                yield SearchStep("budget", expanded, count, len(to_explore), \
+                                 self._result(parents, self._nearest(closed, goal, start), \
+                                              compact, g_score))
+                return
+            for n in range(batch):
+                if to_explore.is_empty(): break
+                key, i = to_explore.remove_min()
+                if i == goal:
+                    self._search_count = count
+                    yield SearchStep("found", expanded, count, len(to_explore), \
+                                     self._result(parents, goal, compact, g_score))
+                    return
+                closed[i] = 1
+                expanded += 1
+
+                g_i = g_score[i]
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    g_m = g_i + (1 if weights is None else weights[j])
+                    if closed[j] or g_m >= g_score[j]: continue
+                    g_score[j] = g_m
+                    parents[j] = i
+                    count += 1
+                    to_explore.insert((g_m + h(j)) * scale - g_m, j)
+            else:
+                yield SearchStep("running", expanded, count, len(to_explore), Path(self, parents, i))
+
+        self._search_count = count
+        yield SearchStep("exhausted", expanded, count, 0, None)
 
-            for m in self.get_search_locations(n.cell):
-                g_m = g_n + 1
-                if m._position not in explored.keys() or g_m < explored[m._position]:
-                    self._search_count += 1
-                    explored[m._position] = g_m
-                    h_m = manhattan(m, self._goal)
-                    f_m = g_m + h_m
-                    to_explore.insert(f_m, Node(m, n, g_m, h_m))
+    ##########
+    def _result(self, parents: array, index: int, compact: bool, \
+                costs: Optional[array] = None) -> Union[Node, Path]:
+        ''' wraps a finished search's parent array as a Path if compact,
+            otherwise as a chain of Nodes '''
+        if compact: return Path(self, parents, index)
+        return self._trace(parents, index, costs)
 
     ##########
-    def show_path(self, node: Node) -> None:
+    def _trace(self, parents: array, index: int, costs: Optional[array] = None) -> Node:
+        ''' rebuilds the chain of Nodes ending at the given flat index by
+            following a parent-index array back to the cell with parent -1
+        Args:
+            parents: parent flat index of every reached cell (-1 for none)
+            index:   flat index of the last cell on the path
+            costs:   optional array of path costs (g-scores) by flat index
+        Returns:
+            the Node for the given index, whose parents lead back to the start
+        '''
         path = []
-        while node.parent is not None:
-            path.append(node.cell)
-            node = node.parent
-        path.append(node.cell)
-
+        while index != -1:
+            path.append(index)
+            index = parents[index]
         path.reverse()
+        return self._chain(path, costs)
 
-        for cell in path:
-            if cell != self._start and cell != self._goal:
-                cell.mark_on_path()
-        print(self)
+    ##########
+    def _chain(self, path: List[int], costs: Optional[array] = None) -> Node:
+        ''' builds a chain of Nodes along the given flat indices
+        Args:
+            path:  flat indices from the start cell to the last cell
+            costs: optional array of path costs (g-scores) by flat index
+        Returns:
+            the Node for the last index, whose parents lead back to the first
+        '''
+        node = None
+        for index in path:
+            cost = None if costs is None else costs[index]
+            node = Node(self._cell(index), node, cost, None)
+        return node
+
+    ##########
+    def a_star(self, compact: bool = False, metrics: NoMetrics = NO_METRICS, \
+               heuristic: Optional[Callable[[int], int]] = None) -> Optional[Node]:
+        '''
+        Use A* + indexed priority queue over flat cell indices:
+            priority queue: cells to be explored, keyed by f = g + h with
+                            ties broken toward the larger g
+            array:          best known g-score of every cell
+            array:          parent flat index of every reached cell
+            bytearray:      closed set, cells already expanded
+        On a maze with terrain weights, runs the weighted search of dijkstra
+        instead, guided by the heuristic times the smallest weight.
+        Args:
+            compact:   return a Path over the parent array instead of Nodes
+            metrics:   instrumentation told about the search
+            heuristic: function giving a lower bound on the steps from a
+                       flat index to the goal, consistent (changing by at
+                       most 1 per step), e.g., Landmarks.heuristic(goal);
+                       the Manhattan distance if None
+        Return:
+            (goal node, search count) if the goal can be reached
+            None, if no goal can be found
+        '''
+        if self._weights is not None:
+            least = min(self._weights)
+            return self._weighted_search(BucketQueue(max(self._weights) + least + 1), least, \
+                                         compact, metrics, "a_star", heuristic)
+
+        metrics.start("a_star")
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        offsets, targets = self._adjacency()
+
+        g_score = array('i', [size + 1]) * size   # size + 1 stands in for infinity
+        parents = array('i', [-1]) * size
+        closed  = bytearray(size)
+        scale   = size + 1   # key = f * scale - g, so equal f prefers larger g
+        count   = 0
+
+        to_explore = PriorityQueue()
+        g_score[start] = 0
+        row, col = divmod(start, cols)
+        h = abs(row - goal_row) + abs(col - goal_col) if heuristic is None else heuristic(start)
+        to_explore.insert(h * scale, start)
+
+        while not to_explore.is_empty():
+            key, i = to_explore.remove_min()
+            if i == goal:
+                self._finish(metrics, count, to_explore.high_water(), \
+                             lambda: closed.count(1), lambda: size - g_score.count(size + 1))
+                return self._result(parents, goal, compact, g_score), count
+            closed[i] = 1
+
+            g_m = g_score[i] + 1
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if closed[j] or g_m >= g_score[j]: continue
+                g_score[j] = g_m
+                parents[j] = i
+                count += 1
+                if heuristic is None:
+                    row, col = divmod(j, cols)
+                    h = abs(row - goal_row) + abs(col - goal_col)
+                else:
+                    h = heuristic(j)
+                to_explore.insert((g_m + h) * scale - g_m, j)
+
+        return self._finish(metrics, count, to_explore.high_water(), \
+                            lambda: closed.count(1), lambda: size - g_score.count(size + 1))
+
+    ##########
+    def dijkstra(self, compact: bool = False, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        '''
+        Use Dijkstra's algorithm over the terrain weights (each step costs
+        the weight of the cell stepped into; 1 on an unweighted maze) with
+        Dial's bucket queue: the weights are small integers, so every key
+        is within max weight of the last one removed, and a circular array
+        of max weight + 1 buckets replaces the binary heap
+        Args:
+            compact: return a Path over the parent array instead of Nodes
+            metrics: instrumentation told about the search
+        Return:
+            (goal node, search count) if the goal can be reached, the goal
+            node's cost being the total weight of the path
+            None, if no goal can be found
+        '''
+        span = 2 if self._weights is None else max(self._weights) + 1
+        return self._weighted_search(BucketQueue(span), 0, compact, metrics, "dijkstra")
+
+    ##########
+    def _weighted_search(self, frontier: Union[BucketQueue, PriorityQueue], least: int, \
+                         compact: bool, metrics: NoMetrics = NO_METRICS, name: str = "dijkstra", \
+                         heuristic: Optional[Callable[[int], int]] = None) -> Optional[Node]:
+        ''' shared loop of dijkstra (least 0) and weighted a_star, keyed by
+            g + least * (heuristic, by default the Manhattan distance to the
+            goal), over any queue with PriorityQueue's insert (decrease-key)
+            and remove_min
+        Args:
+            frontier: an empty BucketQueue (wide enough for the weights) or
+                      PriorityQueue
+            least:    the heuristic's weight per step, at most the smallest
+                      terrain weight so the heuristic stays consistent
+            compact:  return a Path over the parent array instead of Nodes
+            metrics:  instrumentation told about the search
+            name:     algorithm name given to the metrics
+            heuristic: lower bound on the steps to the goal, as for a_star
+        '''
+        metrics.start(name)
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        offsets, targets = self._adjacency()
+        weights = bytes([1]) * size if self._weights is None else self._weights
+
+        g_score = array('i', [2**31 - 1]) * size   # stands in for infinity
+        parents = array('i', [-1]) * size
+        closed  = bytearray(size)
+        count   = 0
+
+        def steps_left(j: int) -> int:
+            if heuristic is not None: return heuristic(j)
+            row, col = divmod(j, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        g_score[start] = 0
+        frontier.insert(least * steps_left(start), start)
+
+        while not frontier.is_empty():
+            key, i = frontier.remove_min()
+            if i == goal:
+                self._finish(metrics, count, frontier.high_water(), \
+                             lambda: closed.count(1), lambda: size - g_score.count(2**31 - 1))
+                return self._result(parents, goal, compact, g_score), count
+            closed[i] = 1
+
+            g_i = g_score[i]
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                g_m = g_i + weights[j]
+                if closed[j] or g_m >= g_score[j]: continue
+                g_score[j] = g_m
+                parents[j] = i
+                count += 1
+                frontier.insert(g_m + least * steps_left(j) if least else g_m, j)
+
+        return self._finish(metrics, count, frontier.high_water(), \
+                            lambda: closed.count(1), lambda: size - g_score.count(2**31 - 1))
 
     ##########
-    def path_length(self, node: Node) -> int:
+    def jps(self, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        '''
+        Use Jump Point Search, i.e., A* (same Manhattan heuristic, same
+        PriorityQueue) that only stops at jump points: from each expanded
+        cell it runs straight in each allowed direction until it hits the
+        goal or a cell with a forced neighbour (a free side cell whose
+        matching cell one step back is blocked), skipping the symmetric
+        paths in between; a vertical run also stops wherever a horizontal
+        run from it would find a jump point.  Successors are pruned to the
+        forward and side directions, never back toward the parent.
+            priority queue: jump points to be explored, keyed like a_star
+            arrays:         g-score and parent jump point of every cell
+            bytearray:      closed set of expanded jump points
+        Args:
+            metrics: instrumentation told about the search
+        Return:
+            (goal node, search count) if the goal can be reached, with the
+            straight runs between jump points filled back in
+            None, if no goal can be found
+        '''
+        metrics.start("jps")
+        rows, cols = self._num_rows, self._num_cols
+        size  = rows * cols
+        cells = self._cells
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+
+        def free(row: int, col: int) -> bool:
+            return 0 <= row < rows and 0 <= col < cols and cells[row * cols + col] != _BLOCKED
+
+        def jump_horizontal(row: int, col: int, d_col: int) -> int:
+            ''' runs along the row from (row, col), moving by d_col '''
+            while free(row, col):
+                if row == goal_row and col == goal_col: return row * cols + col
+                if (free(row - 1, col) and not free(row - 1, col - d_col)) or \
+                   (free(row + 1, col) and not free(row + 1, col - d_col)):
+                    return row * cols + col
+                col += d_col
+            return -1
+
+        def jump_vertical(row: int, col: int, d_row: int) -> int:
+            ''' runs along the column from (row, col), moving by d_row '''
+            while free(row, col):
+                if row == goal_row and col == goal_col: return row * cols + col
+                if (free(row, col - 1) and not free(row - d_row, col - 1)) or \
+                   (free(row, col + 1) and not free(row - d_row, col + 1)):
+                    return row * cols + col
+                if jump_horizontal(row, col + 1, 1) != -1 or jump_horizontal(row, col - 1, -1) != -1:
+                    return row * cols + col
+                row += d_row
+            return -1
+
+        g_score = array('i', [size + 1]) * size
+        parents = array('i', [-1]) * size
+        closed  = bytearray(size)
+        scale   = size + 1
+        count   = 0
+
+        to_explore = PriorityQueue()
+        g_score[start] = 0
+        row, col = divmod(start, cols)
+        to_explore.insert((abs(row - goal_row) + abs(col - goal_col)) * scale, start)
 
+        while not to_explore.is_empty():
+            key, i = to_explore.remove_min()
+            if i == goal: break
+            closed[i] = 1
+            row, col = divmod(i, cols)
+
+            if parents[i] == -1:
+                directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
+            else:
+                p_row, p_col = divmod(parents[i], cols)
+                d_row = (row > p_row) - (row < p_row)
+                d_col = (col > p_col) - (col < p_col)
+                if d_col != 0: directions = ((-1, 0), (1, 0), (0, d_col))
+                else:          directions = ((0, -1), (0, 1), (d_row, 0))
+
+            for d_row, d_col in directions:
+                if d_row == 0: j = jump_horizontal(row, col + d_col, d_col)
+                else:          j = jump_vertical(row + d_row, col, d_row)
+                if j == -1 or closed[j]: continue
+                j_row, j_col = divmod(j, cols)
+                g_m = g_score[i] + abs(j_row - row) + abs(j_col - col)
+                if g_m >= g_score[j]: continue
+                g_score[j] = g_m
+                parents[j] = i
+                count += 1
+                to_explore.insert((g_m + abs(j_row - goal_row) + abs(j_col - goal_col)) * scale - g_m, j)
+        else:
+            return self._finish(metrics, count, to_explore.high_water(), \
+                                lambda: closed.count(1), lambda: size - g_score.count(size + 1))
+
+        self._finish(metrics, count, to_explore.high_water(), \
+                     lambda: closed.count(1), lambda: size - g_score.count(size + 1))
+
+        # fill in the straight runs between consecutive jump points
+        path = [goal]
+        index = goal
+        while parents[index] != -1:
+            parent = parents[index]
+            step = cols if abs(index - parent) >= cols else 1
+            step = step if parent > index else -step
+            while index != parent:
+                index += step
+                path.append(index)
+        path.reverse()
+        return self._chain(path), count
+
+    ##########
+    def _join(self, forward: array, backward: array, meet_f: int, meet_b: int) -> Node:
+        ''' joins the two halves of a bidirectional search into one chain of
+            Nodes from the start to the goal
+        Args:
+            forward:  parent indices of the search from the start
+            backward: parent indices of the search from the goal
+            meet_f:   last cell of the start half of the path
+            meet_b:   first cell of the goal half of the path (may equal meet_f)
+        Returns:
+            the goal Node, whose parents lead back to the start
+        '''
         path = []
+        index = meet_f
+        while index != -1:
+            path.append(index)
+            index = forward[index]
+        path.reverse()
+        index = meet_b if meet_b != meet_f else backward[meet_b]
+        while index != -1:
+            path.append(index)
+            index = backward[index]
+        return self._chain(path)
 
-        while node.parent is not None:
+    ##########
+    def bidirectional_bfs(self, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        '''
+        Use BFS from the start and from the goal at the same time, a whole
+        level at a time from whichever frontier is smaller, stopping at the
+        level where the two searches meet:
+            lists:     the two current frontiers of flat indices
+            bytearray: which side (1 start, 2 goal) reached each cell
+            arrays:    distance and parent index of every reached cell
+        Args:
+            metrics: instrumentation told about the search
+        Return:
+            (goal node, search count) if the goal can be reached
+            None, if no goal can be found
+        '''
+        metrics.start("bidirectional_bfs")
+        size  = self._num_rows * self._num_cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        offsets, targets = self._adjacency()
+        if start == goal:
+            self._finish(metrics, 0, 1, 0, 1)
+            return self._chain([start]), 0
+
+        side     = bytearray(size)
+        distance = array('i', [0]) * size
+        forward  = array('i', [-1]) * size
+        backward = array('i', [-1]) * size
+        side[start], side[goal] = 1, 2
+        frontiers = {1: [start], 2: [goal]}
+        count = expanded = 0
+        peak = 2
+
+        while frontiers[1] and frontiers[2]:
+            peak = max(peak, len(frontiers[1]) + len(frontiers[2]))
+            this  = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+            other = 3 - this
+            parents = forward if this == 1 else backward
+            best = None   # (total length, cell on this side, cell on the other side)
+            level = []
+            for i in frontiers[this]:
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if side[j] == other:
+                        length = distance[i] + 1 + distance[j]
+                        if best is None or length < best[0]: best = (length, i, j)
+                    elif side[j] == 0:
+                        side[j] = this
+                        distance[j] = distance[i] + 1
+                        parents[j] = i
+                        count += 1
+                        level.append(j)
+            expanded += len(frontiers[this])
+            if best is not None:
+                self._finish(metrics, count, peak, expanded, count + 2)
+                length, i, j = best
+                meet_f, meet_b = (i, j) if this == 1 else (j, i)
+                return self._join(forward, backward, meet_f, meet_b), count
+            frontiers[this] = level
+
+        return self._finish(metrics, count, peak, expanded, count + 2)
 
-            path.append(node.cell)
-            node = node.parent
+    ##########
+    def bidirectional_a_star(self, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        '''
+        Use A* from the start towards the goal and from the goal towards the
+        start at the same time, expanding from whichever open list is smaller;
+        mu is the length of the best path found through a cell reached by
+        both searches, and the search stops once either open list's smallest
+        f is at least mu, since no shorter path can remain
+            priority queues: the two open lists of flat indices
+            arrays:          g-score and parent index of every cell, per side
+            bytearrays:      closed sets, per side
+        Args:
+            metrics: instrumentation told about the search; the peak
+                     frontier reported is the sum of the two open lists'
+                     high-water marks
+        Return:
+            (goal node, search count) if the goal can be reached
+            None, if no goal can be found
+        '''
+        metrics.start("bidirectional_a_star")
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        offsets, targets = self._adjacency()
+
+        infinity = size + 1
+        scale    = size + 1   # key = f * scale - g, as in a_star
+        g_scores = {1: array('i', [infinity]) * size, 2: array('i', [infinity]) * size}
+        parents  = {1: array('i', [-1]) * size,       2: array('i', [-1]) * size}
+        closed   = {1: bytearray(size),               2: bytearray(size)}
+        targets_ = {1: divmod(goal, cols),            2: divmod(start, cols)}
+        open_    = {1: PriorityQueue(),               2: PriorityQueue()}
+        count = 0
+
+        for this, source in ((1, start), (2, goal)):
+            g_scores[this][source] = 0
+            row, col = divmod(source, cols)
+            to_row, to_col = targets_[this]
+            open_[this].insert((abs(row - to_row) + abs(col - to_col)) * scale, source)
+
+        mu, meet = infinity, -1
+        if start == goal: mu, meet = 0, start
+
+        while not open_[1].is_empty() and not open_[2].is_empty():
+            # f >= mu exactly when key > (mu - 1) * scale, since 0 <= g < scale
+            if max(open_[1].top()[0], open_[2].top()[0]) > (mu - 1) * scale: break
+
+            this  = 1 if len(open_[1]) <= len(open_[2]) else 2
+            other = 3 - this
+            g_this, g_other = g_scores[this], g_scores[other]
+            to_row, to_col = targets_[this]
+
+            key, i = open_[this].remove_min()
+            closed[this][i] = 1
+            g_m = g_this[i] + 1
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if closed[this][j] or g_m >= g_this[j]: continue
+                g_this[j] = g_m
+                parents[this][j] = i
+                count += 1
+                if g_m + g_other[j] < mu: mu, meet = g_m + g_other[j], j
+                row, col = divmod(j, cols)
+                f_m = g_m + abs(row - to_row) + abs(col - to_col)
+                if f_m < mu:   # otherwise no shorter path can pass through j
+                    open_[this].insert(f_m * scale - g_m, j)
+
+        self._finish(metrics, count, open_[1].high_water() + open_[2].high_water(), \
+                     lambda: closed[1].count(1) + closed[2].count(1), \
+                     lambda: 2 * size - g_scores[1].count(infinity) - g_scores[2].count(infinity))
+        if meet == -1: return None
+        return self._join(parents[1], parents[2], meet, meet), count
 
-        path.append(node.cell)
+    ##########
+    def ida_star(self, metrics: NoMetrics = NO_METRICS, heuristic: Optional[Callable[[int], int]] = None, \
+                 max_expansions: Optional[int] = None) -> Optional[Node]:
+        '''
+        Use IDA* (iterative deepening A*): depth-first searches from the
+        start that cut off every branch whose f = g + h is over a bound,
+        the first bound being h(start) and each next one the smallest f that
+        was cut off, until one reaches the goal.  Its only state is the
+        current path -- a list of flat indices, their g-scores and
+        neighbour iterators, and a set of the indices for cycle checks --
+        and neighbours come from index arithmetic (or the CSR adjacency,
+        only if it is already cached), so memory grows with the depth of
+        the path, not with the maze; the
+        price is re-expanding cells, many times over on open mazes, since
+        nothing is remembered between branches or bounds.  On a maze with
+        terrain weights each step costs the weight of the cell stepped into
+        and the heuristic is scaled by the smallest weight, as in a_star.
+        Args:
+            metrics:        instrumentation told about the search; its
+                            frontier and visited peaks are the deepest path
+            heuristic:      lower bound on the steps from a flat index to
+                            the goal, as for a_star; Manhattan if None
+            max_expansions: give up (returning None) after this many
+                            expansions over all the bounds, if given; the
+                            guard against deepening for an exponentially
+                            long time on open mazes or toward a goal that
+                            cannot be reached (caught at once only if the
+                            component labels happen to be cached, as in
+                            every search -- building them would cost 4
+                            bytes per cell)
+        Return:
+            (goal node, search count) if the goal can be reached, the
+            count being the cells generated over all the bounds
+            None, if no goal can be found or the budget ran out
+        '''
+        metrics.start("ida_star")
+        cols  = self._num_cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+        weights = self._weights
+        least = 1 if weights is None else min(weights)
+        if self._adjacency_cache is None: neighbours = self._neighbours
+        else:
+            offsets, targets = self._adjacency_cache
+            neighbours = lambda i: targets[offsets[i]:offsets[i + 1]]
+
+        def h(j: int) -> int:
+            if heuristic is not None: return least * heuristic(j)
+            row, col = divmod(j, cols)
+            return least * (abs(row - goal_row) + abs(col - goal_col))
+
+        bound = h(start)
+        count = expanded = depth = 0
+        while True:
+            path, g_scores = [start], [0]
+            on_path = {start}
+            children = [iter(neighbours(start))]
+            cut = None   # smallest f over the bound
+            if start == goal: children = []
+
+            while children:
+                j = next(children[-1], None)
+                if j is None:
+                    on_path.discard(path.pop())
+                    g_scores.pop()
+                    children.pop()
+                    continue
+                if j in on_path: continue
+                g = g_scores[-1] + (1 if weights is None else weights[j])
+                f = g + h(j)
+                count += 1
+                if f > bound:
+                    if cut is None or f < cut: cut = f
+                    continue
+                path.append(j)
+                g_scores.append(g)
+                if j == goal: break
+                on_path.add(j)
+                children.append(iter(neighbours(j)))
+                expanded += 1
+                if len(path) > depth: depth = len(path)
+                if max_expansions is not None and expanded >= max_expansions:
+                    return self._finish(metrics, count, depth, expanded, depth)
+
+            if path and path[-1] == goal:
+                self._finish(metrics, count, depth, expanded, depth)
+                node = None
+                for index, g in zip(path, g_scores):
+                    node = Node(self._cell(index), node, g, None)
+                return node, count
+            if cut is None: return self._finish(metrics, count, depth, expanded, depth)
+            bound = cut
 
-        return len(path)
+    ##########
+    def ara_star(self, compact: bool = False, metrics: NoMetrics = NO_METRICS, \
+                 heuristic: Optional[Callable[[int], int]] = None, epsilon: float = 2.5, \
+                 step: float = 0.5, deadline: Optional[float] = None) -> Optional[Node]:
+        ''' anytime A*: runs ara_star_steps until it proves its path optimal
+            or the deadline passes, and returns the best path it found
+        Args:
+            compact:   return a Path over a parent array instead of Nodes
+            metrics:   instrumentation told about the search
+            heuristic: as for a_star
+            epsilon:   inflation of the heuristic for the first, quick path
+            step:      how much epsilon falls after each path
+            deadline:  perf_counter() time after which no better path is
+                       looked for; the first path is always finished
+        Return:
+            (goal node or Path, search count) of the best path found, the
+            count being the cells generated over every pass
+            None, if no goal can be found
+        '''
+        best = None
+        for best in self.ara_star_steps(epsilon, step, deadline, compact, metrics, heuristic): pass
+        return None if best is None else (best.path, self._search_count)
 
     ##########
-    def is_path_same(self, other, node, other_node) -> bool:
+    def ara_star_steps(self, epsilon: float = 2.5, step: float = 0.5, deadline: Optional[float] = None, \
+                       compact: bool = False, metrics: NoMetrics = NO_METRICS, \
+                       heuristic: Optional[Callable[[int], int]] = None) -> Iterator[AnytimeStep]:
+        '''
+        Use ARA* (anytime repairing A*): weighted A* keyed by g + epsilon * h,
+        which finds a path costing at most epsilon times the optimum with
+        far fewer expansions than a_star, then repeated with epsilon lowered
+        by step down to 1, each pass reusing the g-scores of the last one
+        and expanding only the cells whose g-scores it improves (those
+        already expanded in the pass wait, as inconsistent, for the next)
+            priority queue: open cells, keyed by (g + epsilon * h, -g)
+            arrays:         g-score and parent flat index of every cell
+            bytearray:      closed set of the current pass
+            set:            inconsistent cells, re-opened by the next pass
+        Args:
+            epsilon:   inflation of the heuristic for the first pass
+            step:      how much epsilon falls after each pass
+            deadline:  perf_counter() time after which no further pass is
+                       run, or the running one finished; the first path is
+                       always found
+            compact:   yield Paths over a copy of the parent array
+            metrics:   instrumentation told about the whole run
+            heuristic: as for a_star; the Manhattan distance if None
+        Yields:
+            an AnytimeStep each time a pass ends with a path, the last one
+            (epsilon 1) being optimal
+        '''
+        metrics.start("ara_star")
+        cols  = self._num_cols
+        size  = self._num_rows * cols
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        goal_row, goal_col = divmod(goal, cols)
+        if self._separated(start, goal):
+            self._finish(metrics, 0, 0, 0, 0)
+            return
+        offsets, targets = self._adjacency()
+        weights = self._weights
+        least = 1 if weights is None else min(weights)
+        infinity = 2**31 - 1
+
+        def h(j: int) -> int:
+            if heuristic is not None: return least * heuristic(j)
+            row, col = divmod(j, cols)
+            return least * (abs(row - goal_row) + abs(col - goal_col))
+
+        g_score = array('i', [infinity]) * size
+        parents = array('i', [-1]) * size
+        g_score[start] = 0
+        inconsistent = {start}
+        count = expanded = peak = 0
+        epsilon = max(epsilon, 1.0)
+
+        while True:
+            # re-key the open and inconsistent cells for this epsilon
+            to_explore = PriorityQueue()
+            for i in inconsistent: to_explore.insert((g_score[i] + epsilon * h(i), -g_score[i]), i)
+            inconsistent = set()
+            closed = bytearray(size)
+            found = g_score[goal] < infinity
+
+            while not to_explore.is_empty() and g_score[goal] > to_explore.top()[0][0]:
+                if found and deadline is not None and expanded % 256 == 0 and perf_counter() >= deadline:
+                    break
+                key, i = to_explore.remove_min()
+                closed[i] = 1
+                expanded += 1
+                g_i = g_score[i]
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    g_m = g_i + (1 if weights is None else weights[j])
+                    if g_m >= g_score[j]: continue
+                    g_score[j] = g_m
+                    parents[j] = i
+                    count += 1
+                    if closed[j]: inconsistent.add(j)
+                    else: to_explore.insert((g_m + epsilon * h(j), -g_m), j)
+            else:
+                peak = max(peak, to_explore.high_water())
+                if g_score[goal] == infinity: break   # no path at all
+                while not to_explore.is_empty(): inconsistent.add(to_explore.remove_min()[1])
+                self._search_count = count
+                path = self._result(array('i', parents) if compact else parents, goal, compact, g_score)
+                yield AnytimeStep(epsilon, expanded, count, path)
+                if epsilon == 1.0 or (deadline is not None and perf_counter() >= deadline): break
+                epsilon = max(1.0, epsilon - step)
+                continue
+            peak = max(peak, to_explore.high_water())
+            break   # out of time
+
+        self._finish(metrics, count, peak, expanded, lambda: size - g_score.count(infinity))
 
-        path  = []
-        path2 = []
+    ##########
+    def bitset_bfs(self, compact: bool = False, metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        '''
+        Use a bit-parallel BFS wavefront: the free cells, the cells not yet
+        reached and the frontier are each one Python int with a bit per
+        cell, laid out row-major with a zero guard column at the end of
+        every row, so each wave is four shifts (by 1 for left and right, by
+        the padded width for up and down), ORs and one AND over the whole
+        grid at C speed.  Each reached cell's distance mod 3 is kept in three
+        more ints, enough to walk one shortest path back from the goal: of
+        the cells around a cell at distance d, only those at d - 1 have
+        distance (d - 1) mod 3.  Every wave costs time in the size of the
+        whole grid, however thin it is, so this wins on open mazes and
+        loses badly on corridor mazes, whose paths take many waves.
+        Args:
+            compact: return a Path over a parent array instead of Nodes
+            metrics: instrumentation told about the search
+        Return:
+            (goal node or Path, search count) if the goal can be reached,
+            the count being every cell reached up to and including the
+            goal's whole level
+            None, if no goal can be found
+        '''
+        metrics.start("bitset_bfs")
+        rows, cols = self._num_rows, self._num_cols
+        width = cols + 1   # padded with the guard column
+        start = self._index(self._start._position)
+        goal  = self._index(self._goal._position)
+        if self._separated(start, goal): return self._finish(metrics, 0, 0, 0, 0)
+
+        # one character per bit, most significant (the last cell) first
+        free = bytes(self._cells).translate(_FREE_BITS)
+        text = b"0".join(free[r * cols:(r + 1) * cols] for r in range(rows)) + b"0"
+        unreached = int(text[::-1], 2)
+        start_bit = start + start // cols
+        goal_bit  = goal  + goal  // cols
+        frontier  = 1 << start_bit
+        unreached &= ~frontier
+        layers = [frontier, 0, 0]   # cells reached at distances 0, 1 and 2 mod 3
+        count = peak = expanded = steps = 0
+        track = metrics.enabled
+
+        while not (frontier >> goal_bit) & 1:
+            if track: peak = max(peak, frontier.bit_count())
+            expanded = count + 1
+            steps += 1
+            frontier = ((frontier << 1) | (frontier >> 1) | (frontier << width) | \
+                        (frontier >> width)) & unreached
+            if not frontier: return self._finish(metrics, count, peak, expanded, count + 1)
+            unreached ^= frontier
+            layers[steps % 3] |= frontier
+            count += frontier.bit_count()
+
+        # walk back from the goal, one layer at a time
+        size = rows * width
+        marks = [layer.to_bytes(size // 8 + 1, "little") for layer in layers]
+        path = [goal_bit]
+        bit = goal_bit
+        for step in range(steps - 1, -1, -1):
+            layer = marks[step % 3]
+            for j in (bit - width, bit - 1, bit + 1, bit + width):
+                if 0 <= j < size and (layer[j >> 3] >> (j & 7)) & 1:
+                    bit = j
+                    break
+            path.append(bit)
+        path = [bit - bit // width for bit in reversed(path)]
+
+        self._finish(metrics, count, peak, expanded, count + 1)
+        if not compact: return self._chain(path), count
+        parents = array('i', [-1]) * (rows * cols)
+        for i, j in zip(path, path[1:]): parents[j] = i
+        return Path(self, parents, goal), count
 
-        while node.parent is not None:
+    ##########
+    def parallel_bfs(self, workers: Optional[int] = None, compact: bool = False, \
+                     metrics: NoMetrics = NO_METRICS) -> Optional[Node]:
+        ''' bfs for very large mazes: expands one level at a time, with each
+            level split across worker processes sharing the adjacency and
+            explored flags through shared memory (see parallel.parallel_bfs);
+            returns the same path and search count as bfs
+        Args:
+            workers: number of worker processes (default one per CPU)
+            compact: return a Path over the parent array instead of Nodes
+            metrics: instrumentation told about the search
+        Return:
+            (goal node or Path, search count) if the goal can be reached
+            None, if no goal can be found
+        '''
+        from parallel import parallel_bfs   # parallel imports this module
+        return parallel_bfs(self, workers, compact, metrics)
 
-            path.append(node.cell)
-            node = node.parent
+    ##########
+    def find_paths(self, queries, algorithm: str = "a_star", \
+                   workers: Optional[int] = None) -> List[dict]:
+        ''' answers a batch of (start, goal) queries against a read-only
+            snapshot of the maze taken now, shared with worker processes
+            through shared memory (see service.PathService, which keeps the
+            workers up between batches); the maze itself is left untouched
+        Args:
+            queries:   iterable of ((row, col), (row, col)) start/goal pairs
+            algorithm: name of the Maze search to run, e.g., "a_star"
+            workers:   number of worker processes (default one per CPU);
+                       0 answers the queries in this process
+        Returns:
+            one dictionary per query, in order, with the path as a list of
+            [row, col] from start to goal and the search's metrics
+        '''
+        from service import PathService   # service imports this module
+        with PathService(self, algorithm, workers) as service:
+            return service.find_paths(queries)
 
-        path.append(node.cell)
+    ##########
+    def cached_path(self, start: Optional[Position] = None, goal: Optional[Position] = None, \
+                    algorithm: str = "a_star") -> Optional[Node]:
+        ''' returns the path the given search finds from start to goal (by
+            default the maze's own), answering repeated queries from an LRU
+            cache of at most PATH_CACHE_BYTES, keyed by start, goal, search
+            and the maze's version, so an edit to the maze is never answered
+            from paths found before it; the maze's start and goal are left
+            as they were
+        Args:
+            start, goal: (row, col) of the ends of the path
+            algorithm:   name of the Maze search to run, e.g., "bfs"
+        Returns:
+            the goal Node, whose parents lead back to the start (without
+            costs), or None if there is no path
+        Raises:
+            ValueError exception for an unknown search, or an end that is
+            off the grid or blocked
+        '''
+        if algorithm not in SEARCHES:
+            raise ValueError(f"Error in Maze.cached_path(): unknown algorithm {algorithm!r}")
+        start = self._start._position if start is None else Position(*start)
+        goal  = self._goal._position  if goal  is None else Position(*goal)
+        key = (self._index(start), self._index(goal), algorithm, self._version)
+        path = self._path_cache.get(key)
+
+        if path is None:
+            ends = self._start, self._goal
+            try:
+                self._aim(start, goal)
+                found = getattr(self, algorithm)()
+            finally:
+                self._start, self._goal = ends
+            path = array('i')   # empty for no path
+            if found is not None:
+                path.extend(self._index(cell._position) for cell in _walk(found[0]))
+                path.reverse()
+            self._path_cache.put(key, path)
+
+        return self._chain(path) if path else None
 
-        while other_node.parent is not None:
+    ##########
+    def show_path(self, node: Union[Node, Path]) -> None:
+        # mark this maze's grid by position, so a path found on one maze can
+        # be shown on a clone() of it
+        ends = (self._start._position, self._goal._position)
+        for cell in _walk(node):
+            if cell._position not in ends:
+                self._set_code(self._index(cell._position), _PATH)
+        print(self)
 
-            path2.append(other_node.cell)
-            other_node = other_node.parent
+    ##########
+    def path_length(self, node: Union[Node, Path]) -> int:
+        # a Path knows its own length, in O(1) if it came from a distance field
+        if isinstance(node, Path): return len(node)
+        return sum(1 for cell in _walk(node))
 
-        path2.append(other_node.cell)
+    ##########
+    def path_cost(self, node: Union[Node, Path]) -> int:
+        ''' returns the total terrain weight of the cells a path steps into
+            (all but its start); the number of steps on an unweighted maze '''
+        cells = [cell._position for cell in _walk(node)]
+        return sum(self.get_weight(position) for position in cells[:-1])
 
-        return path == path2
+    ##########
+    def is_path_same(self, other, node: Union[Node, Path], other_node: Union[Node, Path]) -> bool:
+
+        path, path2 = _walk(node), _walk(other_node)
+        end = object()
+
+        for cell in path:
+            other_cell = next(path2, end)
+            if other_cell is end or cell != other_cell: return False
+
+        return next(path2, end) is end
 
 ###############################################################################
 ###############################################################################
@@ -338,54 +1881,53 @@ def make_10x10_maze() -> Maze:
 
     blocks = [(0,5),(0,7),(1,1),(2,7),(3,1),(3,2),(3,9),(4,2),(5,2),(5,5),(6,1),(8,5),(8,9)]
     for r,c in blocks:
-        maze._grid[r][c]._contents = Contents.BLOCKED
+        maze.set_contents(Position(r,c), Contents.BLOCKED)
 
     return maze
 
 ###############################################################################
 ###############################################################################
 
-def one_experiment(maze: Maze, show: bool = False) -> list:
-
-    dfs = maze.dfs()
-
-    while dfs is not None:
-
-        maze_dfs   = copy.deepcopy(maze)
-        maze_bfs   = copy.deepcopy(maze)
-        maze_astar = copy.deepcopy(maze)
-
-        dfs        = maze_dfs.dfs()
-        dfs_goal   = dfs[0]
-        dfs_size   = dfs[1]
-        dfs_length = maze_dfs.path_length(dfs_goal)
+def one_experiment(maze: Maze, show: bool = False, metrics: NoMetrics = NO_METRICS, \
+                   extra: Tuple[str, ...] = ()) -> list:
+    ''' runs every search on the maze and compares their results; given a
+        SearchMetrics, each search also reports into it, and the metrics
+        of this experiment's searches are returned as a fifth item, one
+        dictionary per search
+    Args:
+        extra: names of further searches to run and report after the usual
+               five, e.g., ("ida_star", "ara_star"); ida_star can take
+               exponential time on open mazes, so add it only for small
+               ones; a search finding nothing is reported with path length 0
+    '''
 
-        bfs        = maze_bfs.bfs()
-        bfs_goal   = bfs[0]
-        bfs_size   = bfs[1]
-        bfs_length = maze_bfs.path_length(bfs_goal)
+    maze.reset()
+    # one labelling sweep answers solvability without running a search
+    if not maze.is_connected(): return 'NO MAZE SOLUTION'
 
-        a_star        = maze_astar.a_star()
-        a_star_goal   = a_star[0]
-        a_star_size   = a_star[1]
-        a_star_length = maze_astar.path_length(a_star_goal)
+    # every search runs on the same maze; reset() clears the search state
+    # between them, and paths are only marked on clones when shown
+    results = {}
+    for name in ("dfs", "bfs", "a_star", "bidirectional_bfs", "bidirectional_a_star") + tuple(extra):
+        maze.reset()
+        found = getattr(maze, name)(metrics = metrics)
+        results[name] = (None, maze._search_count) if found is None else found
 
-        search_size = [dfs_size, bfs_size, a_star_size]
-        path_length = [dfs_length, bfs_length, a_star_length]
+    search_size = [size for goal, size in results.values()]
+    path_length = [0 if goal is None else maze.path_length(goal) for goal, size in results.values()]
+    bfs_goal    = results["bfs"][0]
+    a_star_goal = results["a_star"][0]
 
-        if show == True:
-            print()
-            maze_dfs.show_path(dfs_goal)
-            print()
-            maze_bfs.show_path(bfs_goal)
-            print()
-            maze_astar.show_path(a_star_goal)
+    if show == True:
+        print()
+        for name in ("dfs", "bfs", "a_star"):
+            maze.clone().show_path(results[name][0])
             print()
 
-        return [search_size, path_length, a_star_length == bfs_length, \
-                    maze_dfs.is_path_same(maze, bfs_goal, a_star_goal)]
-
-    else: return 'NO MAZE SOLUTION'
+    summary = [search_size, path_length, path_length[2] == path_length[1], \
+                maze.is_path_same(maze, bfs_goal, a_star_goal)]
+    if metrics.enabled: summary.append(metrics.as_dicts()[-len(results):])
+    return summary
 
 ###############################################################################
 ###############################################################################
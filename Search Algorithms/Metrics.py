@@ -0,0 +1,107 @@
+'''
+Topic:      Instrumentation hooks recording per-search metrics
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from time import perf_counter
+from typing import IO, List, NamedTuple, Optional
+import json
+import tracemalloc
+
+###############################################################################
+###############################################################################
+
+class SearchRecord(NamedTuple):
+    ''' the metrics of one search '''
+    algorithm:     str
+    expanded:      int             # cells taken off the frontier and expanded
+    generated:     int             # cells newly reached or given a better cost
+    peak_frontier: int             # largest frontier (open list) size
+    peak_visited:  int             # cells the search held state for at the end
+    seconds:       float           # wall time
+    peak_bytes:    Optional[int]   # tracemalloc peak above the start, if traced
+
+###############################################################################
+###############################################################################
+
+class NoMetrics:
+    ''' the default instrumentation of every search: does nothing, and its
+        enabled flag tells the searches not to gather anything either '''
+
+    __slots__ = ()
+    enabled = False
+
+    ##########
+    def start(self, algorithm: str) -> None: pass
+
+    ##########
+    def stop(self, expanded: int, generated: int, peak_frontier: int, peak_visited: int) -> None: pass
+
+NO_METRICS = NoMetrics()
+
+###############################################################################
+###############################################################################
+
+class SearchMetrics(NoMetrics):
+    ''' instrumentation passed to the Maze searches: each search calls
+        start when it begins and stop with its counters when it ends, and a
+        SearchRecord is kept for every search in order '''
+
+    __slots__ = ('records', '_trace_memory', '_algorithm', '_start', '_base', '_was_tracing')
+    enabled = True
+
+    ##########
+    def __init__(self, trace_memory: bool = False):
+        '''
+        Args:
+            trace_memory: also record each search's tracemalloc peak; this
+                          slows the searches down several times
+        '''
+        self.records: List[SearchRecord] = []
+        self._trace_memory = trace_memory
+
+    ##########
+    def start(self, algorithm: str) -> None:
+        ''' called by a search as it begins '''
+        self._algorithm = algorithm
+        if self._trace_memory:
+            self._was_tracing = tracemalloc.is_tracing()
+            if not self._was_tracing: tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+        self._start = perf_counter()
+
+    ##########
+    def stop(self, expanded: int, generated: int, peak_frontier: int, peak_visited: int) -> None:
+        ''' called by a search as it ends, with its counters '''
+        seconds = perf_counter() - self._start
+        peak_bytes = None
+        if self._trace_memory:
+            peak_bytes = tracemalloc.get_traced_memory()[1] - self._base
+            if not self._was_tracing: tracemalloc.stop()
+        self.records.append(SearchRecord(self._algorithm, expanded, generated, peak_frontier, \
+                                         peak_visited, seconds, peak_bytes))
+
+    ##########
+    def last(self) -> SearchRecord:
+        ''' returns the record of the most recent search
+        Raises:
+            IndexError exception if no search has been recorded
+        '''
+        return self.records[-1]
+
+    ##########
+    def as_dicts(self) -> List[dict]:
+        ''' returns every record as a dictionary, in search order '''
+        return [record._asdict() for record in self.records]
+
+    ##########
+    def dump(self, stream: IO[str]) -> None:
+        ''' writes every record to the stream as one JSON object per line '''
+        for record in self.as_dicts():
+            stream.write(json.dumps(record) + "\n")
+
+###############################################################################
+###############################################################################
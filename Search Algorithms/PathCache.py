@@ -0,0 +1,100 @@
+'''
+Topic:      LRU cache of search results with a limit in bytes
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from array import array
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+###############################################################################
+###############################################################################
+
+class PathCache:
+    ''' least-recently-used cache of paths, each an int32 array of flat
+        cell indices (empty for "no path"), holding at most max_bytes of
+        entries: when a new path would go over the limit, the paths used
+        longest ago are evicted until it fits
+
+        Entries are never invalidated by hand; Maze keys them by its version
+        counter, so paths found before an edit are simply never asked for
+        again and age out of the cache like any other cold entry.
+    '''
+
+    __slots__ = ('_entries', '_max_bytes', '_bytes', 'hits', 'misses', 'evictions')
+
+    ENTRY_BYTES = 128   # charged per entry on top of its path: the key, the
+                        # dictionary slot and the array header
+
+    ##########
+    def __init__(self, max_bytes: int):
+        '''
+        Args:
+            max_bytes: most bytes of entries the cache holds at once
+        '''
+        self._entries: 'OrderedDict[Hashable, array]' = OrderedDict()   # oldest use first
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    ##########
+    def __len__(self): return len(self._entries)
+
+    ##########
+    def __contains__(self, key: Hashable) -> bool: return key in self._entries
+
+    ##########
+    def nbytes(self) -> int:
+        ''' returns the bytes charged for the entries held now '''
+        return self._bytes
+
+    ##########
+    def _size(self, path: array) -> int:
+        return PathCache.ENTRY_BYTES + path.itemsize * len(path)
+
+    ##########
+    def get(self, key: Hashable) -> Optional[array]:
+        ''' returns the path cached under the key, marking it as the most
+            recently used, or None (counted as a miss) if there is none '''
+        path = self._entries.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return path
+
+    ##########
+    def put(self, key: Hashable, path: array) -> None:
+        ''' caches the path under the key as the most recently used entry,
+            evicting the least recently used ones to make room; a path too
+            big for the whole cache is not kept '''
+        size = self._size(path)
+        old = self._entries.pop(key, None)
+        if old is not None: self._bytes -= self._size(old)
+        if size > self._max_bytes: return
+        while self._bytes + size > self._max_bytes:
+            key_out, path_out = self._entries.popitem(last = False)
+            self._bytes -= self._size(path_out)
+            self.evictions += 1
+        self._entries[key] = path
+        self._bytes += size
+
+    ##########
+    def clear(self) -> None:
+        ''' drops every entry; the counters are kept '''
+        self._entries.clear()
+        self._bytes = 0
+
+    ##########
+    def stats(self) -> dict:
+        ''' returns the counters, the number of entries and their bytes '''
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, \
+                "entries": len(self._entries), "bytes": self._bytes}
+
+###############################################################################
+###############################################################################
@@ -3,55 +3,157 @@
 ###############################################################################
 ###############################################################################
 
-from typing import Generic, TypeVar
+from typing import Dict, Generic, List, Tuple, TypeVar
 T = TypeVar("T")
 
-from heapq import *
 import random
 import string
 
 ###############################################################################
 ###############################################################################
 
-class Entry(Generic[T]):
-    def __init__(self, priority: 'float|str', data: T):
-        self._key   = priority
-        self._value = data
-    def __eq__(self, other):
-        return self._key == other._key and self._value == other._value
-    def __lt__(self, other):
-        return self._key < other._key
-    def __repr__(self):
-        key = f"'{self._key}'"   if isinstance(self._key,   str) else f"{self._key}"
-        val = f"'{self._value}'" if isinstance(self._value, str) else f"{self._value}"
-        return f"({key},{val})"
-    def __str__(self):
-        return repr(self)
-
-###############################################################################
-###############################################################################
-
 class PriorityQueue(Generic[T]):
+    ''' indexed binary min-heap of (key, item) tuples; a position map from
+        each item to its slot in the heap means an item is stored at most
+        once, and inserting it again with a smaller key is a decrease-key
+        instead of a duplicate entry (items must therefore be hashable) '''
 
-    __slots__ = ('_container')
+    __slots__ = ('_heap', '_where', '_high_water')
 
     ##########
     def __init__(self):
-        self._container = []
+        self._heap:  List[Tuple['float|str', T]] = []
+        self._where: Dict[T, int] = {}
+        self._high_water = 0
+
+    ##########
+    def __len__(self): return len(self._heap)
+
+    ##########
+    def __contains__(self, item: T) -> bool: return item in self._where
+
+    ##########
+    def is_empty(self): return len(self._heap) == 0
+
+    ##########
+    def high_water(self) -> int:
+        ''' returns the largest number of entries the heap has ever held '''
+        return self._high_water
+
+    ##########
+    def key(self, item: T) -> 'float|str':
+        ''' returns the current key of an item in the queue
+        Raises:
+            KeyError exception if the item is not in the queue
+        '''
+        return self._heap[self._where[item]][0]
+
+    ##########
+    def insert(self, key: 'float|str', item: T) -> bool:
+        ''' inserts the item with the given key; if the item is already in
+            the queue its key is lowered to the given key (decrease-key), and
+            left alone if the given key is not smaller
+        Returns:
+            True if the item was added or its key was decreased
+        '''
+        where = self._where.get(item)
+        if where is None:
+            self._heap.append((key, item))
+            self._where[item] = len(self._heap) - 1
+            if len(self._heap) > self._high_water: self._high_water = len(self._heap)
+            self._upheap(len(self._heap) - 1)
+            return True
+        if key < self._heap[where][0]:
+            self._heap[where] = (key, item)
+            self._upheap(where)
+            return True
+        return False
+
+    ##########
+    def update(self, key: 'float|str', item: T) -> None:
+        ''' sets the key of the item to the given key, whether larger or
+            smaller than its current key, inserting it if necessary '''
+        where = self._where.get(item)
+        if where is None:
+            self.insert(key, item)
+        else:
+            self._heap[where] = (key, item)
+            self._upheap(where)
+            self._downheap(self._where[item])
+
+    ##########
+    def remove(self, item: T) -> None:
+        ''' removes the given item from the queue
+        Raises:
+            KeyError exception if the item is not in the queue
+        '''
+        where = self._where.pop(item)
+        last = self._heap.pop()
+        if where < len(self._heap):
+            self._heap[where] = last
+            self._where[last[1]] = where
+            self._upheap(where)
+            self._downheap(self._where[last[1]])
 
     ##########
-    def __len__(self): return len(self._container)
+    def top(self) -> Tuple['float|str', T]:
+        ''' returns the (key, item) tuple with the smallest key without
+            removing it '''
+        return self._heap[0]
 
     ##########
-    def is_empty(self): return len(self._container) == 0
+    def remove_min(self) -> Tuple['float|str', T]:
+        ''' removes and returns the (key, item) tuple with the smallest key
+        Raises:
+            IndexError exception if the queue is empty
+        '''
+        heap = self._heap
+        last = heap.pop()
+        if not heap:
+            del self._where[last[1]]
+            return last
+        entry = heap[0]
+        heap[0] = last
+        del self._where[entry[1]]
+        self._where[last[1]] = 0
+        self._downheap(0)
+        return entry
 
     ##########
-    def insert(self, key: 'float|str', item: T):
-        entry = Entry(key, item)
-        heappush(self._container, entry)
+    def _upheap(self, i: int) -> None:
+        ''' private method moving the entry at slot i up to its place '''
+        heap, where = self._heap, self._where
+        entry = heap[i]
+        key = entry[0]
+        while i > 0:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if not key < above[0]: break
+            heap[i] = above
+            where[above[1]] = i
+            i = parent
+        heap[i] = entry
+        where[entry[1]] = i
 
     ##########
-    def remove_min(self): return heappop(self._container)
+    def _downheap(self, i: int) -> None:
+        ''' private method moving the entry at slot i down to its place '''
+        heap, where = self._heap, self._where
+        size = len(heap)
+        entry = heap[i]
+        key = entry[0]
+        while True:
+            child = 2 * i + 1
+            if child >= size: break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            below = heap[child]
+            if not below[0] < key: break
+            heap[i] = below
+            where[below[1]] = i
+            i = child
+        heap[i] = entry
+        where[entry[1]] = i
 
 ###############################################################################
 ###############################################################################
@@ -60,8 +162,7 @@ def main():
 
     pq = PriorityQueue()
     for i in range(10):
-        entry = Entry(random.randint(1,100), random.choice(string.ascii_letters))
-        pq.insert(entry._key, entry._value)
+        pq.insert(random.randint(1,100), random.choice(string.ascii_letters))
 
     while not pq.is_empty():
         print(pq.remove_min())
@@ -6,7 +6,8 @@ Date:       22 October 2021
 ###############################################################################
 ###############################################################################
 
-from typing import Generic, List, TypeVar
+from collections import deque
+from typing import Deque, Generic, Iterable, TypeVar
 
 T = TypeVar("T") # initializing generic type 'T' variable
 
@@ -22,21 +23,22 @@ class EmptyError(Exception):
 ###############################################################################
 
 class Queue(Generic[T]):
-    ''' class to implement a stack ADT using a Python list '''
+    ''' class to implement a queue ADT using a double-ended queue, so that both
+        push and pop run in constant time '''
 
     __slots__ = ("_data")
 
     ##########
     def __init__(self):
-        self._data: List[T] = []
+        self._data: Deque[T] = deque()
 
     ##########
     def __len__(self) -> int:
         ''' allows the len function to be called using a Queue object, e.g.,
-               stack = Queue()
+               queue = Queue()
                print(len(queue))
         Returns:
-            number of elements in the stack, as an integer
+            number of elements in the queue, as an integer
         '''
         return len(self._data)
 
@@ -50,6 +52,17 @@ class Queue(Generic[T]):
         '''
         self._data.append(item)
 
+    ##########
+    def extend(self, items: Iterable[T]) -> None:
+        ''' pushes every item of the given iterable into the queue, in order,
+            e.g., all the neighbours of a cell at once
+        Args:
+            items: an iterable of items of arbitrary type
+        Returns:
+            None
+        '''
+        self._data.extend(items)
+
     ##########
     def pop(self) -> T:
         ''' removes the leftmost element from the queue and returns that element
@@ -60,7 +73,7 @@ class Queue(Generic[T]):
         '''
         if len(self._data) == 0:
             raise EmptyError('Error in Queue.pop(): queue is empty')
-        return self._data.pop(0)
+        return self._data.popleft()
 
     ##########
     def top(self) -> T:
@@ -85,7 +98,7 @@ class Queue(Generic[T]):
     ##########
     def __str__(self) -> str:
         ''' returns an str implementation of the Queue '''
-        string = str(self._data)
+        string = str(list(self._data))
         return string
 
 ###############################################################################
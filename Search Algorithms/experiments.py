@@ -0,0 +1,714 @@
+'''
+Topic:      Benchmarks for the maze search data structures and algorithms
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from BucketQueue import *
+from HPAStar import *
+from LPAStar import *
+from Landmarks import *
+from PathCache import *
+from generators import *
+from heapq import heappush, heappop
+from time import perf_counter
+import copy
+import os
+import Maze as maze_module
+import random
+import tracemalloc
+
+###############################################################################
+###############################################################################
+
+class _ListQueue:
+    ''' the original list-backed queue, where every pop is O(n); kept here
+        only as the "before" baseline for the queue benchmark '''
+
+    __slots__ = ("_data")
+
+    def __init__(self):            self._data = []
+    def __len__(self):             return len(self._data)
+    def push(self, item):          self._data.append(item)
+    def extend(self, items):       self._data.extend(items)
+    def pop(self):                 return self._data.pop(0)
+    def is_empty(self):            return len(self._data) == 0
+
+###############################################################################
+###############################################################################
+
+class _HeapqQueue:
+    ''' the original heapq-backed priority queue, which stores a new entry
+        for every insert (stale duplicates included); kept here only as the
+        "before" baseline for the priority queue benchmark '''
+
+    __slots__ = ("_container", "_high_water")
+
+    def __init__(self):            self._container, self._high_water = [], 0
+    def __len__(self):             return len(self._container)
+    def is_empty(self):            return len(self._container) == 0
+    def high_water(self):          return self._high_water
+    def remove_min(self):          return heappop(self._container)
+    def insert(self, key, item):
+        heappush(self._container, (key, item))
+        self._high_water = max(self._high_water, len(self._container))
+
+###############################################################################
+###############################################################################
+
+class _CountingQueue(PriorityQueue):
+    ''' PriorityQueue that counts remove_min calls, i.e., A* expansions '''
+
+    __slots__ = ()
+    removed = 0
+
+    def remove_min(self):
+        _CountingQueue.removed += 1
+        return PriorityQueue.remove_min(self)
+
+###############################################################################
+###############################################################################
+
+def _old_a_star(maze: Maze):
+    ''' the original Maze.a_star loop (Position-keyed dict, a manhattan()
+        call per neighbour, g never taken from the popped node); kept here
+        only as the "before" baseline for the A* benchmark
+    Returns:
+        (goal node or None, search count, expansions)
+    '''
+    to_explore = _HeapqQueue()
+    explored = {}
+    count = expansions = 0
+    tie = 0
+
+    n = maze.get_start()
+    g_n = 0.0
+    h_n = manhattan(n, maze.get_goal())
+    to_explore.insert((g_n + h_n, tie), Node(n, None, g_n, h_n))
+    explored[n._position] = g_n
+
+    while not to_explore.is_empty():
+        key, n = to_explore.remove_min()
+        expansions += 1
+        if n.cell == maze.get_goal(): return n, count, expansions
+
+        for m in maze.get_search_locations(n.cell):
+            g_m = g_n + 1
+            if m._position not in explored.keys() or g_m < explored[m._position]:
+                count += 1
+                tie += 1
+                explored[m._position] = g_m
+                h_m = manhattan(m, maze.get_goal())
+                to_explore.insert((g_m + h_m, tie), Node(m, n, g_m, h_m))
+
+    return None, count, expansions
+
+##########
+def _old_random_grid(rows: int, cols: int, prop_blocked: float) -> bytearray:
+    ''' the original grid draw: random.sample of the blocked flat indices,
+        then one Python-level store per blocked cell; kept here only as the
+        "before" baseline for the generation benchmark '''
+    cells = bytearray(Contents.EMPTY.value, "ascii") * (rows * cols)
+    blocked = random.sample(range(rows * cols - 2), k = round((rows * cols - 2) * prop_blocked))
+    for b in blocked:
+        cells[b + 1] = maze_module._BLOCKED
+    return cells
+
+###############################################################################
+###############################################################################
+
+def bfs_flood(maze: Maze, queue) -> int:
+    ''' breadth-first flood fill of the maze from its start cell, using the
+        given (empty) queue object for the frontier
+    Args:
+        maze:  the Maze to explore
+        queue: an empty queue supporting push/extend/pop/is_empty
+    Returns:
+        the number of cells reached
+    '''
+    start = maze.get_start().get_position()
+    explored = {start}
+    queue.push(maze.get_start())
+    while not queue.is_empty():
+        cell = queue.pop()
+        fresh = [loc for loc in maze.get_search_locations(cell) \
+                    if loc._position not in explored]
+        explored.update(loc._position for loc in fresh)
+        queue.extend(fresh)
+    return len(explored)
+
+###############################################################################
+###############################################################################
+
+def queue_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.2) -> None:
+    ''' times a BFS flood over one rows x cols maze with the old list-backed
+        queue and with the deque-backed Queue '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+
+    for name, make_queue in (("list queue (before)", _ListQueue), ("deque Queue (after)", Queue)):
+        start = perf_counter()
+        reached = bfs_flood(maze, make_queue())
+        end = perf_counter()
+        print(f"{name:24} {rows}x{cols}: reached {reached:8} cells in {end - start:8.3f} s")
+
+##########
+def frontier_experiment(size: int = 100000) -> None:
+    ''' times size push/pop pairs against a standing frontier of size items,
+        isolating the queue from the rest of the search; a grid BFS frontier
+        is only O(rows + cols) long, so this is where pop(0) really hurts '''
+
+    for name, make_queue in (("list queue (before)", _ListQueue), ("deque Queue (after)", Queue)):
+        queue = make_queue()
+        queue.extend(range(size))
+        start = perf_counter()
+        for i in range(size):
+            queue.push(queue.pop())
+        end = perf_counter()
+        print(f"{name:24} frontier {size:8}: {size} pop/push pairs in {end - start:8.3f} s")
+
+##########
+def adjacency_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.2) -> None:
+    ''' times one visit of every cell's neighbours, first recomputing them
+        with bounds checks and then reading the cached CSR adjacency '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    size = rows * cols
+
+    start = perf_counter()
+    for index in range(size):
+        for j in maze._neighbours(index): pass
+    end = perf_counter()
+    print(f"{'recomputed neighbours':24} {rows}x{cols}: {end - start:8.3f} s")
+
+    start = perf_counter()
+    offsets, targets = maze._adjacency()
+    end = perf_counter()
+    print(f"{'CSR build (once)':24} {rows}x{cols}: {end - start:8.3f} s")
+
+    start = perf_counter()
+    for index in range(size):
+        for j in targets[offsets[index]:offsets[index + 1]]: pass
+    end = perf_counter()
+    print(f"{'CSR slice lookups':24} {rows}x{cols}: {end - start:8.3f} s")
+
+##########
+def heap_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2) -> None:
+    ''' runs a_star on one maze with the duplicating heapq queue and with
+        the indexed PriorityQueue, reporting the heap high-water marks '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # build the neighbour cache outside the timings
+
+    for name, queue_class in (("heapq (before)", _HeapqQueue), ("indexed heap (after)", PriorityQueue)):
+        maze_module.PriorityQueue = queue_class
+        try:
+            start = perf_counter()
+            result = maze.a_star()
+            end = perf_counter()
+        finally:
+            maze_module.PriorityQueue = PriorityQueue
+        found = "no path" if result is None else f"path {maze.path_length(result[0])}"
+        print(f"{name:24} {rows}x{cols}: {found}, heap high-water {maze._peak_frontier:8}, {end - start:8.3f} s")
+
+##########
+def a_star_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2) -> None:
+    ''' compares the original A* loop with the flat-index a_star on one maze:
+        generated nodes, expansions, path length and wall time '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # build the neighbour cache outside the timings
+
+    start = perf_counter()
+    node, count, expansions = _old_a_star(maze)
+    end = perf_counter()
+    found = "no path" if node is None else f"path {maze.path_length(node):6}"
+    print(f"{'A* (before)':24} {rows}x{cols}: {found}, generated {count:8}, " \
+          f"expanded {expansions:8}, {end - start:8.3f} s")
+
+    _CountingQueue.removed = 0
+    maze_module.PriorityQueue = _CountingQueue
+    try:
+        maze._search_count = 0
+        start = perf_counter()
+        result = maze.a_star()
+        end = perf_counter()
+    finally:
+        maze_module.PriorityQueue = PriorityQueue
+    found = "no path" if result is None else f"path {maze.path_length(result[0]):6}"
+    print(f"{'A* (after)':24} {rows}x{cols}: {found}, generated {maze._search_count:8}, " \
+          f"expanded {_CountingQueue.removed:8}, {end - start:8.3f} s")
+
+##########
+def bidirectional_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2) -> None:
+    ''' compares search counts and times of the one- and two-directional
+        BFS and A* on one maze '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # build the neighbour cache outside the timings
+
+    for name in ("bfs", "bidirectional_bfs", "a_star", "bidirectional_a_star"):
+        maze._search_count = 0
+        start = perf_counter()
+        result = getattr(maze, name)()
+        end = perf_counter()
+        found = "no path" if result is None else f"path {maze.path_length(result[0]):6}"
+        print(f"{name:24} {rows}x{cols}: {found}, search count {maze._search_count:8}, {end - start:8.3f} s")
+
+##########
+def jps_experiment(rows: int = 300, cols: int = 300, trials: int = 5) -> None:
+    ''' compares a_star and jps on open (0.0 - 0.1) and dense (0.3 - 0.4)
+        mazes, averaging search counts and times over solvable mazes '''
+
+    for label, low, high in (("open", 0.0, 0.1), ("dense", 0.3, 0.4)):
+        totals = {"a_star": [0, 0.0], "jps": [0, 0.0]}
+        solved = 0
+        while solved < trials:
+            maze = Maze(rows, cols, random.uniform(low, high), \
+                        start = Position(0,0), goal = Position(rows-1,cols-1))
+            maze._adjacency()   # build the neighbour cache outside the timings
+            if maze.bidirectional_bfs() is None: continue
+            solved += 1
+            for name in totals:
+                maze._search_count = 0
+                start = perf_counter()
+                getattr(maze, name)()
+                totals[name][0] += maze._search_count
+                totals[name][1] += perf_counter() - start
+        for name, (count, elapsed) in totals.items():
+            print(f"{name:8} {label:6} {rows}x{cols}: mean search count {count / trials:10.1f}, " \
+                  f"mean time {elapsed / trials:8.4f} s")
+
+##########
+def hpa_experiment(rows: int = 300, cols: int = 300, prop_blocked: float = 0.2, \
+                   cluster_size: int = 10, queries: int = 50) -> None:
+    ''' reports HPA* preprocessing time and the mean query latency and path
+        length of HPA* next to plain a_star over random start/goal pairs '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # build the neighbour cache outside the timings
+
+    start = perf_counter()
+    hpa = HPAStar(maze, cluster_size)
+    print(f"{'HPA* preprocessing':24} {rows}x{cols}, clusters of {cluster_size}: {perf_counter() - start:8.3f} s")
+
+    free = [i for i in range(rows * cols) if maze._cells[i] != ord(Contents.BLOCKED.value)]
+    totals = {"a_star": [0.0, 0], "HPA*": [0.0, 0]}
+    answered = 0
+    for q in range(queries):
+        s, g = [Position(*divmod(index, cols)) for index in random.sample(free, 2)]
+        maze.set_endpoints(s, g)
+        start = perf_counter()
+        a_star = maze.a_star()
+        middle = perf_counter()
+        hpa_result = hpa.query(s, g)
+        end = perf_counter()
+        totals["a_star"][0] += middle - start
+        totals["HPA*"][0]   += end - middle
+        if a_star is not None and hpa_result is not None:
+            answered += 1
+            totals["a_star"][1] += maze.path_length(a_star[0])
+            totals["HPA*"][1]   += maze.path_length(hpa_result[0])
+
+    for name, (elapsed, length) in totals.items():
+        print(f"{name:24} {rows}x{cols}: mean latency {1000 * elapsed / queries:8.2f} ms, " \
+              f"mean path length {length / max(answered, 1):8.1f}")
+
+##########
+def replanning_experiment(rows: int = 200, cols: int = 200, prop_blocked: float = 0.2, \
+                          edits: int = 50) -> None:
+    ''' compares replanning latency of LPA* with a full a_star rerun after
+        each of a series of random single-cell edits; a_star's time includes
+        rebuilding the neighbour cache that every edit invalidates '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    start = perf_counter()
+    planner = LPAStar(maze)
+    planner.plan()
+    print(f"{'LPA* initial plan':24} {rows}x{cols}: {perf_counter() - start:8.3f} s")
+
+    endpoints = (maze._index(maze._start._position), maze._index(maze._goal._position))
+    lpa_time = a_star_time = 0.0
+    for e in range(edits):
+        index = endpoints[0]
+        while index in endpoints: index = random.randrange(rows * cols)
+        blocked = maze._cells[index] == ord(Contents.BLOCKED.value)
+        start = perf_counter()
+        planner.update_cell(Position(*divmod(index, cols)), Contents.EMPTY if blocked else Contents.BLOCKED)
+        middle = perf_counter()
+        maze.a_star()
+        end = perf_counter()
+        lpa_time    += middle - start
+        a_star_time += end - middle
+
+    print(f"{'LPA* replan':24} {rows}x{cols}: mean latency {1000 * lpa_time / edits:8.2f} ms")
+    print(f"{'a_star from scratch':24} {rows}x{cols}: mean latency {1000 * a_star_time / edits:8.2f} ms")
+
+##########
+def copy_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.2) -> None:
+    ''' compares copy.deepcopy of a maze with Maze.clone and Maze.reset, next
+        to the cost of one bfs on the same maze '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+
+    for name, operation in (("copy.deepcopy", lambda: copy.deepcopy(maze)), \
+                            ("Maze.clone", maze.clone), ("Maze.reset", maze.reset), \
+                            ("one bfs", maze.bfs)):
+        start = perf_counter()
+        operation()
+        print(f"{name:24} {rows}x{cols}: {perf_counter() - start:8.4f} s")
+
+##########
+def parent_array_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2) -> None:
+    ''' compares peak traced memory and time of each search returning a
+        Node chain and returning a compact Path, per cell the search reached '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # build the neighbour cache outside the measurements
+
+    for name in ("dfs", "bfs", "a_star"):
+        for compact in (False, True):
+            maze.reset()
+            tracemalloc.start()
+            start = perf_counter()
+            result = getattr(maze, name)(compact = compact)
+            end = perf_counter()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            reached = max(maze._search_count, 1)
+            label = f"{name} ({'Path' if compact else 'Nodes'})"
+            print(f"{label:24} {rows}x{cols}: peak {peak / 2**20:8.2f} MiB, " \
+                  f"{peak / reached:8.1f} bytes per reached cell, {end - start:8.3f} s")
+
+##########
+def generation_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.2, \
+                          large: int = 10000) -> None:
+    ''' times the original and the one-call random grid draw, a large random
+        maze, and each structured generator '''
+
+    for name, build in (("random.sample draw", lambda: _old_random_grid(rows, cols, prop_blocked)), \
+                        ("one-call draw", lambda: Maze(rows, cols, prop_blocked)), \
+                        ("backtracker_maze", lambda: backtracker_maze(rows, cols, seed = 229)), \
+                        ("prim_maze", lambda: prim_maze(rows, cols, seed = 229)), \
+                        ("cave_maze", lambda: cave_maze(rows, cols, seed = 229))):
+        start = perf_counter()
+        build()
+        print(f"{name:24} {rows}x{cols}: {perf_counter() - start:8.3f} s")
+
+    start = perf_counter()
+    maze = Maze(large, large, prop_blocked)
+    elapsed = perf_counter() - start
+    print(f"{'one-call draw':24} {large}x{large}: {elapsed:8.3f} s, " \
+          f"{maze._cells.count(maze_module._BLOCKED)} blocked cells")
+
+##########
+def component_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.3, \
+                         queries: int = 1000) -> None:
+    ''' compares answering "are start and goal connected?" with a dfs and
+        with the component labelling, then times many random queries on the
+        cached labels '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # both use the grid only; keep the cache build out of the dfs time
+
+    start = perf_counter()
+    solvable = maze.dfs() is not None
+    print(f"{'dfs solvability':24} {rows}x{cols}: {perf_counter() - start:8.3f} s, {solvable}")
+
+    start = perf_counter()
+    solvable = maze.is_connected()
+    print(f"{'component labelling':24} {rows}x{cols}: {perf_counter() - start:8.3f} s, {solvable}")
+
+    positions = [Position(random.randrange(rows), random.randrange(cols)) for i in range(2 * queries)]
+    start = perf_counter()
+    connected = sum(maze.is_connected(a, b) for a, b in zip(positions[::2], positions[1::2]))
+    elapsed = perf_counter() - start
+    print(f"{'cached queries':24} {rows}x{cols}: {elapsed / queries * 1e6:8.2f} us per query, " \
+          f"{connected}/{queries} connected")
+
+##########
+def weighted_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2, \
+                        high: int = 9) -> None:
+    ''' times Dijkstra and weighted A* on terrain weights 1..high with the
+        bucket (Dial) queue and with the binary-heap PriorityQueue '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze.set_weights(terrain_weights(rows, cols, 1, high, seed = 229))
+    maze._adjacency()   # build the neighbour cache outside the measurements
+
+    for name, least in (("dijkstra", 0), ("weighted a_star", 1)):
+        span = high + least + 1
+        for label, frontier in (("BucketQueue", BucketQueue(span)), ("PriorityQueue", PriorityQueue())):
+            maze.reset()
+            start = perf_counter()
+            found = maze._weighted_search(frontier, least, False)
+            elapsed = perf_counter() - start
+            cost = None if found is None else found[0].cost
+            print(f"{name + ' (' + label + ')':34} {rows}x{cols}: {elapsed:8.3f} s, " \
+                  f"{maze._search_count} generated, cost {cost}")
+
+##########
+def budget_experiment(rows: int = 1000, cols: int = 1000, prop_blocked: float = 0.2, \
+                      seconds: float = 0.05) -> None:
+    ''' on a maze whose goal is walled in, times a full bfs (which must
+        flood everything) against bfs_steps with a deadline, and the cost of
+        the generator on a solvable maze '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+    start = perf_counter()
+    maze.bfs()
+    print(f"{'bfs':24} {rows}x{cols}: {perf_counter() - start:8.3f} s")
+    start = perf_counter()
+    step = last_step(maze.bfs_steps(every = 1000))
+    print(f"{'bfs_steps (every 1000)':24} {rows}x{cols}: {perf_counter() - start:8.3f} s, {step.status}")
+
+    maze.set_contents(Position(rows-2, cols-1), Contents.BLOCKED)
+    maze.set_contents(Position(rows-1, cols-2), Contents.BLOCKED)
+    maze._adjacency()
+    maze._component_cache = None   # make the searches find out the hard way
+    start = perf_counter()
+    maze.bfs()
+    print(f"{'bfs (walled goal)':24} {rows}x{cols}: {perf_counter() - start:8.3f} s")
+    start = perf_counter()
+    step = last_step(maze.bfs_steps(every = 1000, deadline = perf_counter() + seconds))
+    print(f"{'bfs_steps (deadline)':24} {rows}x{cols}: {perf_counter() - start:8.3f} s, " \
+          f"{step.status} after {step.expanded} expansions")
+
+##########
+def distance_field_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2, \
+                              goals: int = 100) -> None:
+    ''' compares one bfs per goal with one distance field from the depot
+        (the start) and a path read off it per goal '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+    free = [i for i in range(1, rows * cols) if maze._cells[i] != maze_module._BLOCKED]
+    targets = [Position(*divmod(i, cols)) for i in random.sample(free, goals)]
+
+    start = perf_counter()
+    lengths = []
+    for goal in targets:
+        maze.set_endpoints(Position(0,0), goal)
+        found = maze.bfs(compact = True)
+        lengths.append(0 if found is None else maze.path_length(found[0]))
+    print(f"{'bfs per goal':24} {rows}x{cols}: {perf_counter() - start:8.3f} s for {goals} goals")
+
+    start = perf_counter()
+    field = maze.distance_field(Position(0,0))
+    built = perf_counter() - start
+    paths = [field.path(goal, compact = True) for goal in targets]
+    field_lengths = [0 if path is None else maze.path_length(path) for path in paths]
+    print(f"{'distance field':24} {rows}x{cols}: {perf_counter() - start:8.3f} s for {goals} goals " \
+          f"({built:.3f} s flood), same lengths: {field_lengths == lengths}")
+
+##########
+def landmark_experiment(rows: int = 201, cols: int = 201, queries: int = 20, \
+                        ks = (0, 1, 2, 4, 8, 16)) -> None:
+    ''' on a perfect (backtracker) maze, where the Manhattan distance is a
+        poor guide, compares A* with the ALT heuristic for k landmarks:
+        precompute time and memory, mean cells generated and time per query '''
+
+    maze = backtracker_maze(rows, cols, seed = 229)
+    maze._adjacency()
+    free = [i for i in range(rows * cols) if maze._cells[i] != maze_module._BLOCKED]
+    pairs = [[Position(*divmod(i, cols)) for i in random.sample(free, 2)] for q in range(queries)]
+
+    for k in ks:
+        start = perf_counter()
+        landmarks = Landmarks(maze, k)
+        built = perf_counter() - start
+        generated, elapsed = 0, 0.0
+        for source, goal in pairs:
+            maze.set_endpoints(source, goal)
+            heuristic = None if k == 0 else landmarks.heuristic(goal)
+            start = perf_counter()
+            found, count = maze.a_star(heuristic = heuristic)
+            elapsed += perf_counter() - start
+            generated += count
+        print(f"{'A* with ' + str(k) + ' landmarks':24} {rows}x{cols}: precompute {built:7.3f} s, " \
+              f"{landmarks.nbytes() / 2**20:6.2f} MiB, {generated / queries:9.1f} generated, " \
+              f"{elapsed / queries:7.4f} s per query")
+
+##########
+def path_cache_experiment(rows: int = 200, cols: int = 200, prop_blocked: float = 0.2, \
+                          pairs: int = 1000, queries: int = 5000, s: float = 1.1, \
+                          edits: int = 5, limits = (64 * 1024, 1 << 20)) -> None:
+    ''' replays a Zipf-distributed workload (the pair of rank r asked with
+        probability proportional to 1 / r**s) of A* queries, with a cell
+        blocked edits times along the way, without a cache and through
+        cached_path with each byte limit '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+    free = [i for i in range(rows * cols) if maze._cells[i] != maze_module._BLOCKED]
+    pool = [[Position(*divmod(i, cols)) for i in random.sample(free, 2)] for p in range(pairs)]
+    workload = random.choices(pool, weights = [1 / rank ** s for rank in range(1, pairs + 1)], k = queries)
+    walls = [Position(*divmod(i, cols)) for i in random.sample(free, edits)]
+    edit_every = queries // (edits + 1)
+
+    def replay(ask) -> float:
+        # runs the workload, blocking the same cells at the same points, and
+        # frees them again afterwards
+        start, blocked = perf_counter(), []
+        for q, (source, goal) in enumerate(workload):
+            if q and q % edit_every == 0 and len(blocked) < edits:
+                blocked.append(walls[len(blocked)])
+                maze.set_contents(blocked[-1], Contents.BLOCKED)
+            if not maze.get_cell(source).is_blocked() and not maze.get_cell(goal).is_blocked():
+                ask(source, goal)
+        elapsed = perf_counter() - start
+        for position in blocked: maze.set_contents(position, Contents.EMPTY)
+        return elapsed
+
+    def uncached(source: Position, goal: Position) -> None:
+        maze._aim(source, goal)
+        maze.a_star()
+
+    elapsed = replay(uncached)
+    maze._aim(Position(0,0), Position(rows-1,cols-1))
+    print(f"{'a_star, no cache':24} {rows}x{cols}: {elapsed:8.3f} s for {queries} Zipf({s}) " \
+          f"queries over {pairs} pairs, {edits} edits")
+
+    for limit in limits:
+        maze._path_cache = PathCache(limit)
+        elapsed = replay(maze.cached_path)
+        stats = maze.get_path_cache().stats()
+        print(f"{'cached_path ' + str(limit // 1024) + ' KiB':24} {rows}x{cols}: {elapsed:8.3f} s, " \
+              f"hits {stats['hits']}, misses {stats['misses']}, evictions {stats['evictions']}, " \
+              f"hit rate {stats['hits'] / (stats['hits'] + stats['misses']):.1%}, " \
+              f"{stats['bytes'] / 1024:.0f} KiB held")
+
+##########
+def parallel_bfs_experiment(rows: int = 2000, cols: int = 2000, prop_blocked: float = 0.2, \
+                            workers = (1, 2, 4, 8)) -> None:
+    ''' times parallel_bfs with each number of workers against bfs on the
+        same maze, checking it finds the same path and search count; the
+        speedup is bounded by the cores this machine has '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+    start = perf_counter()
+    found = maze.bfs(compact = True)
+    base = perf_counter() - start
+    print(f"{'bfs':24} {rows}x{cols}: {base:8.3f} s, {os.cpu_count()} cores")
+
+    for count in workers:
+        start = perf_counter()
+        result = maze.parallel_bfs(count, compact = True)
+        elapsed = perf_counter() - start
+        same = (found is None) == (result is None) and \
+               (found is None or (found[1] == result[1] and list(found[0]) == list(result[0])))
+        print(f"{'parallel_bfs ' + str(count) + ' workers':24} {rows}x{cols}: {elapsed:8.3f} s, " \
+              f"speedup {base / elapsed:5.2f}, same result: {same}")
+
+##########
+def bitset_experiment(rows: int = 1000, cols: int = 1000, trials: int = 3) -> None:
+    ''' compares bfs with the bit-parallel bitset_bfs on an open maze, on
+        random mazes of rising density and on a perfect (backtracker) maze,
+        whose long corridors make for many thin waves '''
+
+    mazes = [(f"{p:.0%} blocked", Maze(rows, cols, p, start = Position(0,0), \
+                                      goal = Position(rows-1,cols-1))) for p in (0.0, 0.2, 0.25, 0.3)]
+    mazes.append(("backtracker", backtracker_maze(rows, cols, seed = 229)))
+
+    for label, maze in mazes:
+        maze._adjacency()
+        times = {}
+        for name in ("bfs", "bitset_bfs"):
+            start = perf_counter()
+            for t in range(trials): found = getattr(maze, name)(compact = True)
+            times[name] = (perf_counter() - start) / trials, found
+        (slow, found), (fast, bits) = times["bfs"], times["bitset_bfs"]
+        same = (found is None) == (bits is None) and \
+               (found is None or maze.path_length(found[0]) == maze.path_length(bits[0]))
+        print(f"{'bitset_bfs, ' + label:24} {rows}x{cols}: bfs {slow:7.3f} s, bitset_bfs " \
+              f"{fast:7.3f} s, speedup {slow / fast:6.1f}, same length: {same}")
+
+##########
+def memory_bounded_experiment(rows: int = 40, cols: int = 40, prop_blocked: float = 0.2, \
+                              max_expansions: int = 2000000) -> None:
+    ''' compares the memory (tracemalloc peak above the maze) and time of
+        a_star, ida_star and ara_star on a random maze; ida_star gives up
+        after max_expansions, as it re-expands cells exponentially often
+        on bigger open mazes '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    searches = {"a_star":   Maze.a_star, \
+                "ida_star": lambda maze, metrics: maze.ida_star(metrics = metrics, max_expansions = max_expansions), \
+                "ara_star": Maze.ara_star}
+    for name, search in searches.items():
+        # a fresh copy with nothing cached, so the trace includes whatever
+        # the search builds for itself (the CSR adjacency, for a_star)
+        fresh = maze.clone()
+        metrics = SearchMetrics(trace_memory = True)
+        found = search(fresh, metrics = metrics)
+        record = metrics.last()
+        length = 0 if found is None else maze.path_length(found[0])
+        print(f"{name:24} {rows}x{cols}: {record.seconds:8.3f} s (traced), {record.peak_bytes / 1024:8.1f} KiB " \
+              f"peak, {record.expanded:9} expanded, path {length}")
+
+##########
+def anytime_experiment(rows: int = 500, cols: int = 500, prop_blocked: float = 0.2, \
+                       budgets = (0.01, 0.05, 0.2, 1.0)) -> None:
+    ''' how good a path ara_star returns within each time budget, against
+        a_star's optimal path and time '''
+
+    maze = Maze(rows, cols, prop_blocked, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()
+    start = perf_counter()
+    found = maze.a_star()
+    elapsed = perf_counter() - start
+    best = 0 if found is None else maze.path_length(found[0])
+    print(f"{'a_star':24} {rows}x{cols}: {elapsed:8.3f} s, path {best}")
+    if found is None: return
+
+    for budget in budgets:
+        start = perf_counter()
+        steps = list(maze.ara_star_steps(deadline = start + budget))
+        elapsed = perf_counter() - start
+        print(f"{'ara_star, ' + str(budget) + ' s':24} {rows}x{cols}: {elapsed:8.3f} s, path " \
+              f"{maze.path_length(steps[-1].path)}, epsilon {steps[-1].epsilon:.1f}, {len(steps)} paths")
+
+###############################################################################
+###############################################################################
+
+def main():
+
+    random.seed(8675309) # setting seed for reproducible mazes
+
+    queue_experiment(1000, 1000, 0.0)
+    queue_experiment(1000, 1000, 0.2)
+    frontier_experiment(100000)
+    adjacency_experiment(1000, 1000, 0.2)
+    heap_experiment(500, 500, 0.2)
+    a_star_experiment(500, 500, 0.2)
+    a_star_experiment(500, 500, 0.3)
+    bidirectional_experiment(500, 500, 0.2)
+    bidirectional_experiment(500, 500, 0.35)
+    jps_experiment(300, 300)
+    hpa_experiment(300, 300, 0.2)
+    replanning_experiment(200, 200, 0.2)
+    copy_experiment(1000, 1000, 0.2)
+    parent_array_experiment(500, 500, 0.2)
+    generation_experiment(1000, 1000, 0.2)
+    component_experiment(1000, 1000, 0.3)
+    weighted_experiment(500, 500, 0.2)
+    budget_experiment(1000, 1000, 0.2)
+    distance_field_experiment(500, 500, 0.2)
+    landmark_experiment(201, 201)
+    path_cache_experiment(200, 200, 0.2)
+    parallel_bfs_experiment(2000, 2000, 0.2)
+    bitset_experiment(1000, 1000)
+    memory_bounded_experiment(40, 40, 0.2)
+    memory_bounded_experiment(1000, 1000, 0.0)
+    anytime_experiment(500, 500, 0.2)
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    main()
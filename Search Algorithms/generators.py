@@ -0,0 +1,157 @@
+'''
+Topic:      Seeded structured maze generators writing straight into a flat grid
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from Maze import _BLOCKED, _EMPTY
+from typing import Optional
+import random
+
+###############################################################################
+###############################################################################
+
+def _lattice_goal(rows: int, cols: int) -> Position:
+    ''' returns the bottom-right cell of the passage lattice (even row and
+        column), where the perfect-maze generators put the goal by default '''
+    return Position((rows - 1) // 2 * 2, (cols - 1) // 2 * 2)
+
+##########
+def _finish(rows: int, cols: int, cells: bytearray, start: Position, \
+            goal: Optional[Position]) -> Maze:
+    ''' wraps a generated grid in a Maze, forcing the start and goal open '''
+    goal = _lattice_goal(rows, cols) if goal is None else goal
+    return Maze.from_cells(rows, cols, cells, start, goal)
+
+##########
+def _lattice_neighbours(index: int, rows: int, cols: int):
+    ''' yields (wall index, cell index) for each passage-lattice cell two steps
+        away from the given lattice cell '''
+    row, col = divmod(index, cols)
+    if row >= 2:       yield index - cols,  index - 2 * cols
+    if row + 2 < rows: yield index + cols,  index + 2 * cols
+    if col >= 2:       yield index - 1,     index - 2
+    if col + 2 < cols: yield index + 1,     index + 2
+
+###############################################################################
+###############################################################################
+
+def backtracker_maze(rows: int, cols: int, seed: Optional[int] = None, \
+                     start: Position = Position(0, 0), goal: Optional[Position] = None) -> Maze:
+    ''' generates a perfect maze (exactly one path between any two open
+        cells) with an iterative recursive backtracker: a random walk over
+        the lattice of even (row, col) cells that knocks down the wall into
+        each unvisited cell it steps to, backing up when it is stuck; the
+        result has long, winding corridors
+    Args:
+        rows, cols: size of the grid
+        seed:       seed for this generator's own random.Random
+        start:      start position (default the top-left corner)
+        goal:       goal position (default the bottom-right lattice cell)
+    Returns:
+        a Maze object
+    '''
+    rng = random.Random(seed)
+    cells = bytearray([_BLOCKED]) * (rows * cols)
+    cells[0] = _EMPTY
+    stack = [0]
+    while stack:
+        options = [(wall, cell) for wall, cell in _lattice_neighbours(stack[-1], rows, cols) \
+                   if cells[cell] == _BLOCKED]
+        if not options:
+            stack.pop()
+            continue
+        wall, cell = rng.choice(options)
+        cells[wall] = cells[cell] = _EMPTY
+        stack.append(cell)
+    return _finish(rows, cols, cells, start, goal)
+
+##########
+def prim_maze(rows: int, cols: int, seed: Optional[int] = None, \
+              start: Position = Position(0, 0), goal: Optional[Position] = None) -> Maze:
+    ''' generates a perfect maze with randomized Prim's algorithm: grows the
+        maze from the top-left cell by repeatedly opening a random wall
+        between the maze and a lattice cell not yet in it; the result has
+        many short dead ends
+    Args:
+        rows, cols: size of the grid
+        seed:       seed for this generator's own random.Random
+        start:      start position (default the top-left corner)
+        goal:       goal position (default the bottom-right lattice cell)
+    Returns:
+        a Maze object
+    '''
+    rng = random.Random(seed)
+    cells = bytearray([_BLOCKED]) * (rows * cols)
+    cells[0] = _EMPTY
+    frontier = list(_lattice_neighbours(0, rows, cols))
+    while frontier:
+        k = rng.randrange(len(frontier))
+        frontier[k], frontier[-1] = frontier[-1], frontier[k]
+        wall, cell = frontier.pop()
+        if cells[cell] != _BLOCKED: continue
+        cells[wall] = cells[cell] = _EMPTY
+        frontier.extend((w, c) for w, c in _lattice_neighbours(cell, rows, cols) \
+                        if cells[c] == _BLOCKED)
+    return _finish(rows, cols, cells, start, goal)
+
+##########
+def cave_maze(rows: int, cols: int, seed: Optional[int] = None, fill: float = 0.45, \
+              steps: int = 4, start: Position = Position(0, 0), \
+              goal: Optional[Position] = None) -> Maze:
+    ''' generates an open cave with a cellular automaton: blocks each cell
+        with probability fill, then, steps times, makes every cell a wall if
+        at least 5 of the 9 cells in its 3x3 neighbourhood are walls (cells
+        off the grid count as walls) and open otherwise
+    Args:
+        rows, cols: size of the grid
+        seed:       seed for this generator's own random.Random
+        fill:       initial proportion of blocked cells
+        steps:      number of smoothing steps
+        start:      start position (default the top-left corner)
+        goal:       goal position (default the bottom-right corner)
+    Returns:
+        a Maze object
+    '''
+    rng = random.Random(seed)
+    cut = round(fill * 256)
+    table = bytes(_BLOCKED if value < cut else _EMPTY for value in range(256))
+    cells = bytearray(rng.randbytes(rows * cols).translate(table))
+
+    for step in range(steps):
+        # pad with a ring of walls so every cell has a full 3x3 neighbourhood
+        width = cols + 2
+        padded = bytearray([_BLOCKED]) * (width * (rows + 2))
+        for r in range(rows):
+            padded[(r + 1) * width + 1:(r + 1) * width + 1 + cols] = cells[r * cols:(r + 1) * cols]
+        walls = [value == _BLOCKED for value in padded]
+        for r in range(rows):
+            above, here, below = r * width, (r + 1) * width, (r + 2) * width
+            for c in range(cols):
+                count = walls[above + c] + walls[above + c + 1] + walls[above + c + 2] + \
+                        walls[here  + c] + walls[here  + c + 1] + walls[here  + c + 2] + \
+                        walls[below + c] + walls[below + c + 1] + walls[below + c + 2]
+                cells[r * cols + c] = _BLOCKED if count >= 5 else _EMPTY
+
+    goal = Position(rows - 1, cols - 1) if goal is None else goal
+    return _finish(rows, cols, cells, start, goal)
+
+##########
+def terrain_weights(rows: int, cols: int, low: int = 1, high: int = 9, \
+                    seed: Optional[int] = None) -> bytes:
+    ''' draws a terrain weight in low..high (inclusive, at most 255) for
+        every cell, uniformly at random, ready for Maze.set_weights
+    Args:
+        rows, cols: size of the grid
+        low, high:  smallest and largest weight
+        seed:       seed for this generator's own random.Random
+    Returns:
+        one weight byte per cell, in row-major order
+    '''
+    rng = random.Random(seed)
+    return bytes(rng.choices(range(low, high + 1), k = rows * cols))
+
+###############################################################################
+###############################################################################
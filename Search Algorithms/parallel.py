@@ -0,0 +1,168 @@
+'''
+Topic:      Level-synchronous BFS with each level split across processes
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+import os
+
+###############################################################################
+###############################################################################
+
+GRAIN = 4096   # fewest frontier cells worth handing to a worker
+
+# this process's views of the shared grid, set up by _attach
+_shared: dict = {}
+
+###############################################################################
+###############################################################################
+
+def _layout(size: int, edges: int) -> List[Tuple[int, int]]:
+    ''' returns the (offset, length) in bytes of the CSR offsets, the CSR
+        targets, the frontier (all int32) and the explored flags (one byte
+        per cell) in the shared block '''
+    offsets  = (0, 4 * (size + 1))
+    targets  = (offsets[1], 4 * edges)
+    frontier = (targets[0] + targets[1], 4 * size)
+    explored = (frontier[0] + frontier[1], size)
+    return [offsets, targets, frontier, explored]
+
+##########
+def _attach(name: str, size: int, edges: int) -> None:
+    ''' worker initializer: maps the shared block and views its arrays '''
+    _shared["memory"] = SharedMemory(name = name)   # kept open for the views
+    views = [_shared["memory"].buf[start:start + length] for start, length in _layout(size, edges)]
+    _shared.update(offsets = views[0].cast('i'), targets = views[1].cast('i'), \
+                   frontier = views[2].cast('i'), explored = views[3])
+
+##########
+def _expand(chunk: Tuple[int, int]) -> bytes:
+    ''' expands the frontier cells in [lo, hi), in order, against the
+        explored flags as they stood at the start of the level
+    Returns:
+        int32 (cell, parent) pairs for every cell first reached from this
+        chunk, in the order a sequential bfs would reach them
+    '''
+    lo, hi = chunk
+    offsets, targets = _shared["offsets"], _shared["targets"]
+    explored = _shared["explored"]
+    found = array('i')
+    append, seen = found.append, set()
+    for i in _shared["frontier"][lo:hi]:
+        for j in targets[offsets[i]:offsets[i + 1]]:
+            if not explored[j] and j not in seen:
+                seen.add(j)
+                append(j)
+                append(i)
+    return found.tobytes()
+
+###############################################################################
+###############################################################################
+
+def parallel_bfs(maze: Maze, workers: Optional[int] = None, compact: bool = False, \
+                 metrics: NoMetrics = NO_METRICS, grain: int = GRAIN) -> Optional[Node]:
+    ''' breadth-first search one level at a time: the cells of each level
+        are split into contiguous chunks, expanded by worker processes over
+        a shared-memory copy of the adjacency and explored flags, and their
+        discoveries merged back in chunk order, so that every cell gets the
+        parent, and the goal the search count, that Maze.bfs would give it
+    Args:
+        maze:    the Maze to search, from its start to its goal
+        workers: number of worker processes (default one per CPU); 0 or 1
+                 expands every level in this process
+        compact: return a Path over the parent array instead of Nodes
+        metrics: instrumentation told about the search
+        grain:   fewest frontier cells per chunk; smaller levels are
+                 expanded in this process
+    Return:
+        (goal node or Path, search count) if the goal can be reached
+        None, if no goal can be found
+    '''
+    metrics.start("parallel_bfs")
+    size  = maze._num_rows * maze._num_cols
+    start = maze._index(maze._start._position)
+    goal  = maze._index(maze._goal._position)
+    if maze._separated(start, goal): return maze._finish(metrics, 0, 0, 0, 0)
+    if start == goal:
+        maze._finish(metrics, 0, 1, 0, 1)
+        return maze._result(array('i', [-1]) * size, goal, compact), 0
+    offsets, targets = maze._adjacency()
+    workers = os.cpu_count() if workers is None else workers
+
+    if workers <= 1:
+        _shared.update(offsets = offsets, targets = targets, frontier = array('i', [start]) * size, \
+                       explored = bytearray(size))
+        _shared["explored"][start] = 1
+        try:
+            return _levels(maze, None, 1, grain, compact, metrics)
+        finally:
+            _shared.clear()
+
+    memory = SharedMemory(create = True, size = _layout(size, len(targets))[-1][0] + size)
+    buffers = [memory.buf[begin:begin + length] for begin, length in _layout(size, len(targets))]
+    try:
+        buffers[0][:] = offsets.tobytes()
+        buffers[1][:] = targets.tobytes()
+        buffers[3][:] = bytes(size)
+        _shared.update(offsets = offsets, targets = targets, \
+                       frontier = buffers[2].cast('i'), explored = buffers[3])
+        _shared["frontier"][0] = start
+        _shared["explored"][start] = 1
+        with Pool(workers, initializer = _attach, initargs = (memory.name, size, len(targets))) as pool:
+            return _levels(maze, pool, workers, grain, compact, metrics)
+    finally:
+        for view in (_shared.pop("frontier", None), *buffers):
+            if view is not None: view.release()
+        _shared.clear()
+        memory.close()
+        memory.unlink()
+
+##########
+def _levels(maze: Maze, pool: Optional[Pool], workers: int, grain: int, \
+            compact: bool, metrics: NoMetrics) -> Optional[Node]:
+    ''' the level loop of parallel_bfs, over the arrays in _shared, whose
+        frontier holds the start and whose explored flags mark it '''
+    size = maze._num_rows * maze._num_cols
+    goal = maze._index(maze._goal._position)
+    frontier, explored = _shared["frontier"], _shared["explored"]
+    parents = array('i', [-1]) * size
+    width = 1   # cells on the current level
+    count = peak = expanded = 0
+
+    while width:
+        peak = max(peak, width)
+        chunks = min(workers, -(-width // grain))
+        bounds = [(width * k // chunks, width * (k + 1) // chunks) for k in range(chunks)]
+        if pool is None or chunks == 1: results = [_expand(bound) for bound in bounds]
+        else: results = pool.map(_expand, bounds)
+
+        # merge in chunk order, dropping cells an earlier chunk reached first
+        level = array('i')
+        append = level.append
+        for result in results:
+            pairs = array('i')
+            pairs.frombytes(result)
+            for j, i in zip(pairs[::2], pairs[1::2]):
+                if explored[j]: continue
+                explored[j] = 1
+                parents[j] = i
+                append(j)
+                count += 1
+                if j == goal:
+                    # bfs stops here, with the rest of this level unexpanded
+                    maze._finish(metrics, count, peak, \
+                                 lambda: expanded + frontier[:width].tolist().index(i) + 1, count + 1)
+                    return maze._result(parents, goal, compact), count
+        expanded += width
+        frontier[:len(level)] = level
+        width = len(level)
+
+    return maze._finish(metrics, count, peak, count + 1, count + 1)
+
+###############################################################################
+###############################################################################
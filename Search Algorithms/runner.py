@@ -0,0 +1,152 @@
+'''
+Topic:      Parallel, reproducible runner for maze search experiments
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from multiprocessing import Pool
+from time import perf_counter
+from typing import Dict, Iterator, List, Tuple, Union
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+
+###############################################################################
+###############################################################################
+
+ALGORITHMS = ["dfs", "bfs", "a_star", "bidirectional_bfs", "bidirectional_a_star", "jps", "dijkstra", \
+              "bitset_bfs", "ara_star"]   # not ida_star: it has no bound on its time
+
+###############################################################################
+###############################################################################
+
+def derive_seeds(master_seed: int, count: int) -> List[int]:
+    ''' derives one 64-bit seed per experiment from a single master seed, so
+        a whole run can be reproduced, and any one experiment re-run alone,
+        no matter which worker it lands on
+    Args:
+        master_seed: the seed for the whole run
+        count:       number of experiments
+    Returns:
+        a list of count integer seeds
+    '''
+    generator = random.Random(master_seed)
+    return [generator.getrandbits(64) for i in range(count)]
+
+###############################################################################
+###############################################################################
+
+def run_one(task: Tuple[int, int, dict]) -> Dict[str, Union[int, float, bool]]:
+    ''' runs one experiment in a worker: seeds the random module, draws the
+        maze size and blocked proportion from the given ranges, builds the
+        maze and times each algorithm on it
+    Args:
+        task: (experiment number, seed, settings dictionary)
+    Returns:
+        a flat dictionary of the experiment's parameters and results
+    '''
+    number, seed, settings = task
+    random.seed(seed)
+    rows = random.randint(*settings["rows"])
+    cols = random.randint(*settings["cols"])
+    prop = random.uniform(*settings["prop_blocked"])
+
+    start = perf_counter()
+    maze = Maze(rows, cols, prop, start = Position(0,0), goal = Position(rows-1,cols-1))
+    maze._adjacency()   # charge the neighbour cache to the build, not the first search
+    result = {"experiment": number, "seed": seed, "rows": rows, "cols": cols, \
+              "prop_blocked": round(prop, 4), "build_seconds": round(perf_counter() - start, 6)}
+
+    metrics = SearchMetrics()
+    for name in settings["algorithms"]:
+        maze.reset()
+        found = getattr(maze, name)(metrics = metrics)
+        record = metrics.last()
+        result["solvable"] = found is not None
+        result[f"{name}_search"]   = record.generated
+        result[f"{name}_expanded"] = record.expanded
+        result[f"{name}_frontier"] = record.peak_frontier
+        result[f"{name}_length"]   = 0 if found is None else maze.path_length(found[0])
+        result[f"{name}_seconds"]  = round(record.seconds, 6)
+    return result
+
+###############################################################################
+###############################################################################
+
+def run(count: int, master_seed: int, settings: dict, workers: int) -> Iterator[dict]:
+    ''' spreads the experiments over a pool of worker processes
+    Args:
+        count:       number of experiments
+        master_seed: seed the per-experiment seeds are derived from
+        settings:    dictionary of "rows", "cols", "prop_blocked" ranges and
+                     the list of "algorithms" to run
+        workers:     number of worker processes
+    Returns:
+        an iterator of per-experiment result dictionaries, in the order the
+        experiments finish
+    '''
+    tasks = [(number, seed, settings) for number, seed in enumerate(derive_seeds(master_seed, count))]
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(run_one, tasks)
+
+###############################################################################
+###############################################################################
+
+def parse_range(text: str, kind = int) -> Tuple:
+    ''' parses "low:high" (or a single value) into a (low, high) tuple '''
+    low, _, high = text.partition(":")
+    return kind(low), kind(high or low)
+
+##########
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description = "run maze search experiments in parallel")
+    parser.add_argument("-n", "--experiments", type = int, default = 30)
+    parser.add_argument("-s", "--seed", type = int, default = 8675309, \
+                        help = "master seed the per-experiment seeds are derived from")
+    parser.add_argument("-w", "--workers", type = int, default = os.cpu_count())
+    parser.add_argument("--rows", default = "5:10", help = "row count range low:high")
+    parser.add_argument("--cols", default = "5:10", help = "column count range low:high")
+    parser.add_argument("--prop-blocked", default = "0.2", help = "blocked proportion range low:high")
+    parser.add_argument("--algorithms", default = ",".join(ALGORITHMS[:5]), \
+                        help = "comma-separated Maze search methods to run")
+    parser.add_argument("--format", choices = ("csv", "json"), default = "csv", \
+                        help = "csv rows or one JSON object per line")
+    parser.add_argument("-o", "--output", default = "-", help = "output file, - for stdout")
+    return parser.parse_args(argv)
+
+##########
+def main(argv: List[str] = sys.argv[1:]):
+
+    args = parse_args(argv)
+    algorithms = args.algorithms.split(",")
+    for name in algorithms:
+        if name not in ALGORITHMS: sys.exit(f"unknown algorithm {name!r}, choose from {ALGORITHMS}")
+    settings = {"rows": parse_range(args.rows), "cols": parse_range(args.cols), \
+                "prop_blocked": parse_range(args.prop_blocked, float), "algorithms": algorithms}
+
+    fields = ["experiment", "seed", "rows", "cols", "prop_blocked", "build_seconds", "solvable"]
+    for name in algorithms:
+        fields += [f"{name}_search", f"{name}_expanded", f"{name}_frontier", \
+                   f"{name}_length", f"{name}_seconds"]
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline = "")
+    try:
+        writer = csv.DictWriter(output, fieldnames = fields)
+        if args.format == "csv": writer.writeheader()
+        for result in run(args.experiments, args.seed, settings, args.workers):
+            if args.format == "csv": writer.writerow(result)
+            else: output.write(json.dumps(result) + "\n")
+            output.flush()   # stream each result as soon as it finishes
+    finally:
+        if output is not sys.stdout: output.close()
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    main()
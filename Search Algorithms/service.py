@@ -0,0 +1,257 @@
+'''
+Topic:      Batch pathfinding service over a shared, read-only maze snapshot
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+from Maze import _EMPTY, _PATH, _walk
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import random
+import sys
+
+###############################################################################
+###############################################################################
+
+ALGORITHMS = list(SEARCHES)
+
+# the read-only maze of this worker process, set up by _attach; only worker
+# processes use it, an in-process service keeps its own
+_worker: dict = {}
+
+###############################################################################
+###############################################################################
+
+def _layout(rows: int, cols: int, edges: int) -> List[Tuple[int, int]]:
+    ''' returns the (offset, length) in bytes of the grid, the CSR offsets,
+        the CSR targets and the component labels in the shared block; the
+        int32 arrays start on 4-byte boundaries '''
+    size = rows * cols
+    grid = (0, size)
+    offsets = (size + (-size % 4), 4 * (size + 1))
+    targets = (offsets[0] + offsets[1], 4 * edges)
+    labels  = (targets[0] + targets[1], 4 * size)
+    return [grid, offsets, targets, labels]
+
+##########
+def _views(buffer: memoryview, rows: int, cols: int, edges: int) -> List[memoryview]:
+    ''' cuts a buffer laid out by _layout into read-only views: the grid as
+        unsigned bytes, the other three as int32 '''
+    buffer = buffer.toreadonly()
+    views = [buffer[start:start + length] for start, length in _layout(rows, cols, edges)]
+    return [views[0]] + [view.cast('i') for view in views[1:]]
+
+##########
+def _attach(name: str, rows: int, cols: int, edges: int, weights: Optional[bytes], \
+            algorithm: str) -> None:
+    ''' worker initializer: sets up this process's read-only maze over the
+        shared block with the given name '''
+    _worker["memory"] = SharedMemory(name = name)   # kept open for the views
+    buffers = _views(_worker["memory"].buf, rows, cols, edges)
+    _worker["maze"] = Maze._read_only(rows, cols, *buffers, weights)
+    _worker["algorithm"] = algorithm
+
+##########
+def _answer_in_worker(task: Tuple[int, Position, Position]) -> dict:
+    ''' answers one query with this worker process's maze '''
+    return _answer(_worker["maze"], _worker["algorithm"], task)
+
+##########
+def _answer(maze: Maze, algorithm: str, task: Tuple[int, Position, Position]) -> dict:
+    ''' answers one query
+    Args:
+        maze:      the read-only maze to search
+        algorithm: name of the Maze search to run
+        task:      (query number, start, goal)
+    Returns:
+        a flat, JSON-ready dictionary of the query and its result
+    '''
+    number, start, goal = task
+    result = {"query": number, "start": list(start), "goal": list(goal)}
+    try:
+        maze._aim(start, goal)
+    except ValueError as error:
+        result.update(found = False, error = str(error))
+        return result
+
+    metrics = SearchMetrics()
+    found = getattr(maze, algorithm)(metrics = metrics)
+    record = metrics.last()
+    path = None if found is None else [list(cell._position) for cell in _walk(found[0])][::-1]
+    result.update(found = found is not None, length = 0 if path is None else len(path), path = path, \
+                  expanded = record.expanded, generated = record.generated, \
+                  peak_frontier = record.peak_frontier, seconds = round(record.seconds, 6))
+    return result
+
+###############################################################################
+###############################################################################
+
+class PathService:
+    ''' answers batches of start/goal queries against a snapshot of a maze
+        taken when the service starts: the grid, its CSR adjacency and its
+        component labels are copied once into a block of shared memory,
+        which every worker process maps read-only, so no worker rebuilds
+        anything and the maze can be edited (or shown) while it runs
+
+        Use as a context manager, so the workers are stopped and the shared
+        block is freed:
+            with PathService(maze, "a_star", 4) as service:
+                results = service.find_paths(queries)
+    '''
+
+    ##########
+    def __init__(self, maze: Maze, algorithm: str = "a_star", workers: Optional[int] = None, \
+                 chunksize: int = 16):
+        '''
+        Args:
+            maze:      the Maze to snapshot
+            algorithm: name of the Maze search to run
+            workers:   number of worker processes (default one per CPU);
+                       0 answers the queries in this process
+            chunksize: queries handed to a worker at a time
+        Raises:
+            ValueError exception for an unknown algorithm
+        '''
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Error in PathService(): unknown algorithm {algorithm!r}")
+        rows, cols = maze._num_rows, maze._num_cols
+        offsets, targets = maze._adjacency()
+        labels = maze._components()
+        self._chunksize = chunksize
+        self._algorithm = algorithm
+        self._memory, self._pool, self._maze = None, None, None
+        # the snapshot: a copy of every buffer, with show_path's marks cleared
+        grid = bytes(maze._cells).replace(bytes([_PATH]), bytes([_EMPTY]))
+        arrays = [grid, offsets.tobytes(), targets.tobytes(), labels.tobytes()]
+
+        if workers == 0:
+            buffer = bytearray(_layout(rows, cols, len(targets))[-1][0] + 4 * rows * cols)
+            self._write(memoryview(buffer), rows, cols, len(targets), arrays)
+            views = _views(memoryview(buffer), rows, cols, len(targets))
+            self._maze = Maze._read_only(rows, cols, *views, maze._weights)
+            return
+
+        self._memory = SharedMemory(create = True, size = len(grid) + 4 * (2 * rows * cols + 1) \
+                                                          + 4 * len(targets) + 3)
+        self._write(self._memory.buf, rows, cols, len(targets), arrays)
+        self._pool = Pool(workers or os.cpu_count(), initializer = _attach, \
+                          initargs = (self._memory.name, rows, cols, len(targets), \
+                                      maze._weights, algorithm))
+
+    ##########
+    @staticmethod
+    def _write(buffer: memoryview, rows: int, cols: int, edges: int, arrays: List[bytes]) -> None:
+        ''' copies the snapshot's buffers into place in the block '''
+        for (start, length), data in zip(_layout(rows, cols, edges), arrays):
+            buffer[start:start + length] = data
+
+    ##########
+    def find_paths(self, queries: Iterable[Sequence]) -> List[dict]:
+        ''' answers a batch of queries, spread over the workers
+        Args:
+            queries: iterable of ((row, col), (row, col)) start/goal pairs
+        Returns:
+            one result dictionary per query, in order (see Maze.find_paths)
+        '''
+        tasks = [(number, Position(*start), Position(*goal)) for number, (start, goal) in enumerate(queries)]
+        if self._pool is None: return [_answer(self._maze, self._algorithm, task) for task in tasks]
+        return self._pool.map(_answer_in_worker, tasks, self._chunksize)
+
+    ##########
+    def close(self) -> None:
+        ''' stops the workers and frees the shared block (or, in process,
+            the snapshot) '''
+        self._maze = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    ##########
+    def __enter__(self) -> 'PathService': return self
+
+    ##########
+    def __exit__(self, *exception) -> None: self.close()
+
+###############################################################################
+###############################################################################
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description = "answer start/goal queries, one JSON object " \
+                                     "per line on stdin, against a seeded random maze")
+    parser.add_argument("--rows", type = int, default = 1000)
+    parser.add_argument("--cols", type = int, default = 1000)
+    parser.add_argument("--prop-blocked", type = float, default = 0.2)
+    parser.add_argument("-s", "--seed", type = int, default = 229, help = "seed of the maze")
+    parser.add_argument("-a", "--algorithm", choices = ALGORITHMS, default = "a_star")
+    parser.add_argument("-w", "--workers", type = int, default = os.cpu_count(), \
+                        help = "worker processes, 0 to answer in this process")
+    parser.add_argument("-b", "--batch", type = int, default = 256, \
+                        help = "queries read before a batch is answered")
+    parser.add_argument("--load-test", type = int, metavar = "N", default = 0, \
+                        help = "ignore stdin, answer N random queries and report throughput")
+    parser.add_argument("--no-paths", action = "store_true", help = "leave the paths out of the output")
+    return parser.parse_args(argv)
+
+##########
+def read_queries(lines: Iterable[str], batch: int) -> Iterable[List[Tuple[list, list]]]:
+    ''' groups JSON query lines, {"start": [row, col], "goal": [row, col]}
+        or [[row, col], [row, col]], into batches '''
+    queries = []
+    for line in lines:
+        if not line.strip(): continue
+        query = json.loads(line)
+        queries.append((query["start"], query["goal"]) if isinstance(query, dict) else tuple(query))
+        if len(queries) == batch:
+            yield queries
+            queries = []
+    if queries: yield queries
+
+##########
+def main(argv: List[str] = sys.argv[1:]):
+
+    args = parse_args(argv)
+    random.seed(args.seed)
+    maze = Maze(args.rows, args.cols, args.prop_blocked, start = Position(0,0), \
+                goal = Position(args.rows-1, args.cols-1))
+
+    start = perf_counter()
+    with PathService(maze, args.algorithm, args.workers) as service:
+        ready = perf_counter() - start
+        if args.load_test:
+            free = [i for i in range(args.rows * args.cols) if not maze._cell(i).is_blocked()]
+            pairs = [[divmod(index, args.cols) for index in random.sample(free, 2)] \
+                     for i in range(args.load_test)]
+            batches = [pairs[i:i + args.batch] for i in range(0, len(pairs), args.batch)]
+        else:
+            batches = read_queries(sys.stdin, args.batch)
+
+        count, start = 0, perf_counter()
+        for batch in batches:
+            for result in service.find_paths(batch):
+                result["query"] += count
+                if args.no_paths: result.pop("path", None)
+                if not args.load_test: sys.stdout.write(json.dumps(result) + "\n")
+            count += len(batch)
+            sys.stdout.flush()
+        elapsed = perf_counter() - start
+
+    print(f"{count} queries in {elapsed:.3f} s ({count / max(elapsed, 1e-9):.1f} per second) " \
+          f"with {args.workers} workers, snapshot ready in {ready:.3f} s", file = sys.stderr)
+
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+'''
+Topic:      Tests for the bucket (Dial) queue
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from BucketQueue import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def empty_bq():
+    ''' returns an empty BucketQueue object with 10 buckets '''
+    return BucketQueue(10)
+
+###############################################################################
+###############################################################################
+
+##########
+def test_empty_bq(empty_bq):
+    assert(empty_bq.is_empty())
+    assert(len(empty_bq) == 0)
+    with pytest.raises(IndexError):
+        empty_bq.remove_min()
+
+##########
+def test_monotone_removal_order(empty_bq):
+    # a Dijkstra-like run: each new key is within 9 of the last removed key
+    removed, last, item = [], 0, 0
+    empty_bq.insert(0, item)
+    while not empty_bq.is_empty() and len(removed) < 500:
+        last, top = empty_bq.remove_min()
+        removed.append(last)
+        for i in range(random.randint(0, 2)):
+            item += 1
+            empty_bq.insert(last + random.randint(0, 9), item)
+    assert(removed == sorted(removed))
+
+##########
+def test_decrease_key_skips_stale_entries(empty_bq):
+    assert(empty_bq.insert(8, "a"))
+    assert(empty_bq.insert(5, "b"))
+    assert(empty_bq.insert(2, "a"))
+    assert(not empty_bq.insert(7, "a"))
+    assert(len(empty_bq) == 2 and empty_bq.high_water() == 2)
+    assert(empty_bq.key("a") == 2)
+    assert(empty_bq.remove_min() == (2, "a"))
+    assert(empty_bq.remove_min() == (5, "b"))
+    assert(empty_bq.is_empty())
+
+##########
+def test_window_is_enforced(empty_bq):
+    empty_bq.insert(100, "a")   # an empty queue moves its window
+    with pytest.raises(ValueError):
+        empty_bq.insert(110, "b")
+    with pytest.raises(ValueError):
+        empty_bq.insert(99, "b")
+    assert(empty_bq.remove_min() == (100, "a"))
@@ -0,0 +1,68 @@
+'''
+Topic:      Tests for hierarchical pathfinding (HPA*)
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from HPAStar import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def random_maze():
+    ''' returns a seeded 40x30 maze with a fifth of its cells blocked '''
+    random.seed(229)
+    return Maze(40, 30, 0.2, start = Position(0,0), goal = Position(39,29))
+
+###############################################################################
+###############################################################################
+
+##########
+def is_valid_path(maze: Maze, node: Node, start: Position, goal: Position) -> bool:
+    ''' checks that the Node chain runs from start to goal in unit steps
+        through unblocked cells '''
+    if node.cell.get_position() != goal: return False
+    while node.parent is not None:
+        a, b = node.cell.get_position(), node.parent.cell.get_position()
+        if abs(a.row - b.row) + abs(a.col - b.col) != 1 or node.cell.is_blocked():
+            return False
+        node = node.parent
+    return node.cell.get_position() == start
+
+##########
+def test_queries_match_bfs_reachability(random_maze):
+    hpa = HPAStar(random_maze, cluster_size = 7)
+    free = [i for i in range(40 * 30) if not random_maze._cell(i).is_blocked()]
+    for i in range(50):
+        start, goal = [Position(*divmod(index, 30)) for index in random.sample(free, 2)]
+        random_maze.set_endpoints(start, goal)
+        bfs, hpa_result = random_maze.bfs(), hpa.query(start, goal)
+        assert((bfs is None) == (hpa_result is None))
+        if bfs is None: continue
+        assert(is_valid_path(random_maze, hpa_result[0], start, goal))
+        assert(random_maze.path_length(hpa_result[0]) >= random_maze.path_length(bfs[0]))
+
+##########
+def test_only_changed_cluster_is_dirty(random_maze):
+    random_maze.set_contents(Position(15,15), Contents.EMPTY)
+    random_maze.set_contents(Position(16,16), Contents.BLOCKED)
+    hpa = HPAStar(random_maze, cluster_size = 10)
+    random_maze.get_cell(Position(15,15)).mark_on_path()
+    assert(hpa._dirty == set())
+    random_maze.set_contents(Position(15,15), Contents.BLOCKED)
+    random_maze.set_contents(Position(16,16), Contents.EMPTY)
+    assert(hpa._dirty == {hpa._cluster_of(random_maze._index(Position(15,15)))})
+
+##########
+def test_walling_off_the_goal_is_seen():
+    maze = Maze(20, 20, 0.0, start = Position(0,0), goal = Position(19,19))
+    hpa = HPAStar(maze, cluster_size = 5)
+    assert(hpa.query(Position(0,0), Position(19,19)) is not None)
+    maze.set_contents(Position(18,19), Contents.BLOCKED)
+    maze.set_contents(Position(19,18), Contents.BLOCKED)
+    assert(hpa.query(Position(0,0), Position(19,19)) is None)
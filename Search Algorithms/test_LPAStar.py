@@ -0,0 +1,55 @@
+'''
+Topic:      Tests for incremental replanning with LPA*
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from LPAStar import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def open_maze():
+    ''' returns a 20x20 maze with no blocked cells '''
+    return Maze(20, 20, 0.0, start = Position(0,0), goal = Position(19,19))
+
+###############################################################################
+###############################################################################
+
+##########
+def test_first_plan_is_shortest(open_maze):
+    node, count = LPAStar(open_maze).plan()
+    assert(open_maze.path_length(node) == 39)
+
+##########
+def test_replanning_matches_bfs_after_edits():
+    random.seed(229)
+    maze = Maze(25, 25, 0.25, start = Position(0,0), goal = Position(24,24))
+    planner = LPAStar(maze)
+    result = planner.plan()
+    for i in range(60):
+        bfs = maze.bfs()
+        assert((bfs is None) == (result is None))
+        if bfs is not None:
+            assert(maze.path_length(result[0]) == maze.path_length(bfs[0]))
+        index = random.randrange(1, 25 * 25 - 1)
+        contents = Contents.EMPTY if maze._cell(index).is_blocked() else Contents.BLOCKED
+        result = planner.update_cell(Position(*divmod(index, 25)), contents)
+
+##########
+def test_replanning_only_touches_affected_cells(open_maze):
+    planner = LPAStar(open_maze)
+    node, first = planner.plan()
+    node, second = planner.update_cell(Position(19,0), Contents.BLOCKED)
+    assert(open_maze.path_length(node) == 39)
+    assert(second < first)
+
+##########
+def test_cannot_block_the_goal(open_maze):
+    with pytest.raises(ValueError):
+        LPAStar(open_maze).update_cell(Position(19,19), Contents.BLOCKED)
@@ -0,0 +1,72 @@
+'''
+Topic:      Tests for the landmark (ALT) heuristic
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Landmarks import *
+from generators import backtracker_maze
+import gc
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def random_maze():
+    ''' returns a seeded 30x40 maze with a third of its cells blocked '''
+    random.seed(229)
+    return Maze(30, 40, 0.33, start = Position(0,0), goal = Position(29,39))
+
+###############################################################################
+###############################################################################
+
+##########
+def test_alt_is_admissible_and_consistent(random_maze):
+    landmarks = Landmarks(random_maze, k = 4)
+    assert(len(landmarks.cells()) == 4 and landmarks.nbytes() == 4 * 4 * 30 * 40)
+    goal = Position(29,39)
+    field = random_maze.distance_field(goal)
+    h = landmarks.heuristic(goal)
+    for index in range(30 * 40):
+        if field.distances[index] < 0: continue
+        assert(h(index) <= field.distances[index])
+        for j in random_maze._neighbours(index):
+            assert(abs(h(index) - h(j)) <= 1)
+
+##########
+def test_alt_a_star_finds_shortest_paths_with_fewer_expansions():
+    maze = backtracker_maze(41, 41, seed = 229)
+    landmarks = Landmarks(maze, k = 6)
+    random.seed(229)
+    free = [i for i in range(41 * 41) if not maze._cell(i).is_blocked()]
+    manhattan_total = alt_total = 0
+    for trial in range(20):
+        start, goal = [Position(*divmod(index, 41)) for index in random.sample(free, 2)]
+        maze.set_endpoints(start, goal)
+        node, count = maze.a_star()
+        alt_node, alt_count = maze.a_star(heuristic = landmarks.heuristic(goal))
+        assert(maze.path_length(alt_node) == maze.path_length(node))
+        manhattan_total += count
+        alt_total += alt_count
+    assert(alt_total < manhattan_total)
+
+##########
+def test_landmarks_are_rebuilt_after_edits(random_maze):
+    landmarks = Landmarks(random_maze, k = 2)
+    random_maze.set_contents(Position(0,1), Contents.BLOCKED)
+    assert(landmarks._dirty)
+    landmarks.heuristic(Position(29,39))
+    assert(not landmarks._dirty)
+
+##########
+def test_dropped_landmarks_stop_watching(random_maze):
+    landmarks = Landmarks(random_maze, k = 2)
+    assert(len(random_maze._watchers) == 1)
+    del landmarks
+    gc.collect()
+    assert(len(random_maze._watchers) == 0)
+    random_maze.set_contents(Position(0,1), Contents.BLOCKED)   # nothing left to notify
@@ -0,0 +1,412 @@
+'''
+Topic:      Tests for the Maze search algorithms
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def small_maze():
+    ''' returns the 10x10 maze from the day 27 slides '''
+    return make_10x10_maze()
+
+##########
+@pytest.fixture
+def open_maze():
+    ''' returns a 30x40 maze with no blocked cells '''
+    return Maze(30, 40, 0.0, start = Position(0,0), goal = Position(29,39))
+
+##########
+@pytest.fixture
+def walled_maze():
+    ''' returns a 10x10 maze where column 5 is fully blocked '''
+    maze = Maze(10, 10, 0.0, start = Position(0,0), goal = Position(9,9))
+    for r in range(10):
+        maze.set_contents(Position(r,5), Contents.BLOCKED)
+    return maze
+
+###############################################################################
+###############################################################################
+
+##########
+def test_dfs_finds_goal(small_maze):
+    node, count = small_maze.dfs()
+    assert(node.cell.get_position() == Position(9,9))
+    assert(count > 0)
+
+##########
+def test_bfs_shortest_path(small_maze):
+    node, count = small_maze.bfs()
+    assert(small_maze.path_length(node) == 19)
+
+##########
+def test_a_star_shortest_path(small_maze):
+    node, count = small_maze.a_star()
+    assert(small_maze.path_length(node) == 19)
+
+##########
+def test_open_maze_path_lengths(open_maze):
+    assert(open_maze.path_length(open_maze.bfs()[0]) == 30 + 40 - 1)
+    assert(open_maze.path_length(open_maze.a_star()[0]) == 30 + 40 - 1)
+
+##########
+def test_unsolvable_maze(walled_maze):
+    assert(walled_maze.dfs() is None)
+    assert(walled_maze.bfs() is None)
+    assert(walled_maze.a_star() is None)
+
+##########
+def test_cells_are_views_of_the_grid(small_maze):
+    cell = small_maze.get_cell(Position(4,4))
+    assert(not cell.is_blocked())
+    cell._contents = Contents.BLOCKED
+    assert(small_maze.get_cell(Position(4,4)).is_blocked())
+    assert(small_maze._cells[small_maze._index(Position(4,4))] == ord("X"))
+    assert(str(small_maze).splitlines()[4] == "|  |  |X |  |X |  |  |  |  |  |")
+
+##########
+def test_adjacency_cache_is_invalidated(open_maze):
+    offsets, targets = open_maze._adjacency()
+    assert(open_maze._adjacency() == (offsets, targets))
+    open_maze.get_cell(Position(0,5)).mark_on_path()
+    assert(open_maze._adjacency_cache is not None)
+    open_maze.set_contents(Position(0,1), Contents.BLOCKED)
+    assert(open_maze._adjacency_cache is None)
+    offsets, targets = open_maze._adjacency()
+    assert(list(targets[offsets[0]:offsets[1]]) == [open_maze._index(Position(1,0))])
+
+##########
+def test_bfs_matches_a_star_on_random_mazes():
+    random.seed(229)
+    for i in range(20):
+        maze = Maze(15, 15, 0.25, start = Position(0,0), goal = Position(14,14))
+        bfs = maze.bfs()
+        a_star = maze.a_star()
+        assert((bfs is None) == (a_star is None))
+        if bfs is not None:
+            assert(maze.path_length(bfs[0]) == maze.path_length(a_star[0]))
+            assert(a_star[0].cost == maze.path_length(a_star[0]) - 1)
+
+##########
+def test_bidirectional_searches_find_shortest_paths(small_maze, walled_maze):
+    assert(small_maze.path_length(small_maze.bidirectional_bfs()[0]) == 19)
+    assert(small_maze.path_length(small_maze.bidirectional_a_star()[0]) == 19)
+    assert(walled_maze.bidirectional_bfs() is None)
+    assert(walled_maze.bidirectional_a_star() is None)
+
+##########
+def test_bidirectional_paths_are_connected():
+    random.seed(7)
+    for i in range(30):
+        maze = Maze(20, 25, 0.3, start = Position(0,0), goal = Position(19,24))
+        bfs = maze.bfs()
+        for search in (maze.bidirectional_bfs, maze.bidirectional_a_star):
+            result = search()
+            assert((bfs is None) == (result is None))
+            if result is None: continue
+            assert(maze.path_length(result[0]) == maze.path_length(bfs[0]))
+            node = result[0]
+            assert(node.cell.get_position() == Position(19,24))
+            while node.parent is not None:
+                a, b = node.cell.get_position(), node.parent.cell.get_position()
+                assert(abs(a.row - b.row) + abs(a.col - b.col) == 1)
+                assert(not node.cell.is_blocked())
+                node = node.parent
+            assert(node.cell.get_position() == Position(0,0))
+
+##########
+def test_jps_matches_bfs_path_lengths(small_maze, walled_maze, open_maze):
+    assert(small_maze.path_length(small_maze.jps()[0]) == 19)
+    assert(open_maze.path_length(open_maze.jps()[0]) == 30 + 40 - 1)
+    assert(walled_maze.jps() is None)
+    random.seed(8)
+    for i in range(100):
+        p = random.choice([0.0, 0.1, 0.2, 0.3, 0.4])
+        maze = Maze(18, 23, p, start = Position(0,0), goal = Position(17,22))
+        bfs, jps = maze.bfs(), maze.jps()
+        assert((bfs is None) == (jps is None))
+        if jps is None: continue
+        assert(maze.path_length(jps[0]) == maze.path_length(bfs[0]))
+        node = jps[0]
+        while node.parent is not None:
+            a, b = node.cell.get_position(), node.parent.cell.get_position()
+            assert(abs(a.row - b.row) + abs(a.col - b.col) == 1)
+            assert(not node.cell.is_blocked())
+            node = node.parent
+
+##########
+def test_clone_and_reset(small_maze):
+    node, count = small_maze.bfs()
+    copy = small_maze.clone()
+    copy.show_path(node)
+    assert(Contents.PATH.value not in str(small_maze))
+    assert(str(copy).count(Contents.PATH.value) == 17)
+    assert(copy._search_count == 0 and small_maze._search_count == count)
+    copy.reset()
+    small_maze.reset()
+    assert(str(copy) == str(small_maze))
+    assert(small_maze._search_count == 0)
+
+##########
+def test_one_experiment_leaves_maze_unchanged(small_maze):
+    before = str(small_maze)
+    search_size, path_length, same_length, same_path = one_experiment(small_maze)
+    assert(path_length[1:] == [19, 19, 19, 19])
+    assert(same_length)
+    assert(str(small_maze) == before)
+
+##########
+def test_compact_paths_match_node_chains(small_maze):
+    for name in ("dfs", "bfs", "a_star"):
+        small_maze.reset()
+        node, count = getattr(small_maze, name)()
+        small_maze.reset()
+        path, compact_count = getattr(small_maze, name)(compact = True)
+        assert(isinstance(path, Path))
+        assert(compact_count == count)
+        assert(len(path) == small_maze.path_length(path) == small_maze.path_length(node))
+        assert(small_maze.is_path_same(small_maze, path, node))
+        assert(small_maze.is_path_same(small_maze, path.to_node(), node))
+        assert(next(iter(path)) == small_maze._index(Position(9,9)))
+    assert(not small_maze.is_path_same(small_maze, small_maze.dfs()[0], small_maze.bfs()[0]))
+
+##########
+def test_components_match_bfs_reachability(walled_maze):
+    random.seed(229)
+    for trial in range(40):
+        maze = Maze(12, 9, 0.35, start = Position(0,0), goal = Position(11,8))
+        assert(maze.is_connected() == (maze.bfs() is not None))
+        free = [i for i in range(12 * 9) if not maze._cell(i).is_blocked()]
+        for a, b in zip(free, reversed(free)):
+            if a == b: continue
+            maze.reset()
+            maze.set_endpoints(Position(*divmod(a, 9)), Position(*divmod(b, 9)))
+            maze._component_cache = None   # compare against an uncached search
+            found = maze.bfs() is not None
+            assert(maze.is_connected() == found)
+    assert(not walled_maze.is_connected())
+    assert(walled_maze.bfs() is None and walled_maze._search_count == 0)
+
+##########
+def test_components_are_relabelled_after_edits(open_maze):
+    assert(open_maze.is_connected())
+    for col in range(open_maze._num_cols):
+        open_maze.set_contents(Position(4, col), Contents.BLOCKED)
+    assert(not open_maze.is_connected())
+    assert(not open_maze.is_connected(Position(4,0), Position(0,0)))
+    open_maze.set_contents(Position(4, 3), Contents.EMPTY)
+    assert(open_maze.is_connected())
+
+##########
+def test_weighted_searches_find_cheapest_paths():
+    from generators import terrain_weights
+    random.seed(229)
+    for trial in range(20):
+        maze = Maze(15, 12, 0.25, start = Position(0,0), goal = Position(14,11))
+        maze.set_weights(terrain_weights(15, 12, seed = trial))
+        dijkstra, a_star = maze.dijkstra(), maze.a_star()
+        heap = maze._weighted_search(PriorityQueue(), 0, False)
+        assert((dijkstra is None) == (a_star is None) == (heap is None) == (not maze.is_connected()))
+        if dijkstra is None: continue
+        cost = dijkstra[0].cost
+        assert(maze.path_cost(dijkstra[0]) == cost)
+        assert(maze.path_cost(a_star[0]) == a_star[0].cost == cost)
+        assert(heap[0].cost == cost)
+
+##########
+def test_unit_weights_match_bfs(small_maze):
+    length = small_maze.path_length(small_maze.bfs()[0])
+    node, count = small_maze.dijkstra()
+    assert(small_maze.path_length(node) == length and node.cost == length - 1)
+    small_maze.set_weights(bytes([1]) * 100)
+    assert(small_maze.path_cost(small_maze.a_star()[0]) == length - 1)
+    with pytest.raises(ValueError):
+        small_maze.set_weights(bytes(100))
+
+##########
+def test_step_wise_searches_match_full_searches(small_maze, walled_maze):
+    for name in ("dfs", "bfs", "a_star"):
+        small_maze.reset()
+        node, count = getattr(small_maze, name)()
+        steps = list(getattr(small_maze, name + "_steps")(every = 3))
+        assert(all(step.status == "running" and step.expanded % 3 == 0 for step in steps[:-1]))
+        assert(steps[-1].status == "found" and steps[-1].generated == count)
+        assert(small_maze.is_path_same(small_maze, steps[-1].path, node))
+        assert(last_step(getattr(walled_maze, name + "_steps")()).status == "exhausted")
+
+##########
+def test_step_wise_a_star_follows_weights_and_heuristic(open_maze):
+    rng = random.Random(229)
+    open_maze.set_weights(bytes(rng.randint(1, 9) for i in range(30 * 40)))
+    node, count = open_maze.a_star()
+    step = last_step(open_maze.a_star_steps(every = 10))
+    assert(step.status == "found" and step.path.cost == node.cost == open_maze.path_cost(node))
+    open_maze.set_weights(None)
+    zero = last_step(open_maze.a_star_steps(heuristic = lambda index: 0))
+    assert(zero.status == "found" and open_maze.path_length(zero.path) == 30 + 40 - 1)
+    assert(zero.expanded > last_step(open_maze.a_star_steps()).expanded)
+
+##########
+def test_step_wise_budgets(open_maze):
+    step = last_step(open_maze.bfs_steps(max_expansions = 50, compact = True))
+    assert(step.status == "budget" and step.expanded == 50)
+    assert(isinstance(step.path, Path) and len(step.path) > 1)
+    step = last_step(open_maze.a_star_steps(deadline = 0.0))
+    assert(step.status == "budget" and step.expanded == 0)
+
+##########
+def test_render_leaves_maze_unchanged(small_maze):
+    before = str(small_maze)
+    running = next(small_maze.bfs_steps(every = 5))
+    drawn = small_maze.render(running.path)
+    assert(str(small_maze) == before)
+    assert(drawn.count(Contents.PATH.value) == len(running.path) - 1)
+
+##########
+def test_distance_field_matches_bfs(small_maze):
+    field = small_maze.distance_field()
+    assert(small_maze.distance_field(Position(0,0)) is field)   # cached
+    for row in range(10):
+        for col in range(10):
+            position = Position(row, col)
+            if position == Position(0,0): continue
+            if small_maze.get_cell(position).is_blocked():
+                assert(field.distance(position) is None)
+                continue
+            small_maze.set_endpoints(Position(0,0), position)
+            found = small_maze.bfs()
+            assert((found is None) == (field.distance(position) is None))
+            if found is None: continue
+            path = field.path(position, compact = True)
+            assert(small_maze.path_length(path) == small_maze.path_length(found[0]) \
+                   == field.distance(position) + 1 == sum(1 for index in path))
+            assert(field.path(position).cost == field.distance(position))
+
+##########
+def test_distance_fields_are_dropped_after_edits(open_maze):
+    field = open_maze.distance_field()
+    assert(field.distance(Position(29,39)) == 68)
+    open_maze.set_contents(Position(0,1), Contents.BLOCKED)
+    assert(open_maze.distance_field() is not field)
+    assert(open_maze.distance_field().distance(Position(29,39)) == 68)
+    with pytest.raises(ValueError):
+        open_maze.distance_field(Position(0,1))
+
+##########
+def test_cached_path_hits_until_an_edit(walled_maze):
+    cache = walled_maze.get_path_cache()
+    assert(walled_maze.cached_path() is None)   # column 5 is a wall
+    assert(walled_maze.cached_path() is None and cache.stats()["hits"] == 1)
+    node = walled_maze.cached_path(Position(0,0), Position(9,4), "bfs")
+    assert(walled_maze.path_length(node) == 14 and node.cell.get_position() == Position(9,4))
+    assert(walled_maze.get_start().get_position() == Position(0,0))
+    assert(walled_maze.get_goal().get_position() == Position(9,9))
+
+    version = walled_maze.get_version()
+    walled_maze.set_contents(Position(4,5), Contents.EMPTY)
+    assert(walled_maze.get_version() == version + 1)
+    assert(walled_maze.path_length(walled_maze.cached_path()) == 19)
+    assert((cache.hits, cache.misses) == (1, 3))
+    with pytest.raises(ValueError):
+        walled_maze.cached_path(algorithm = "no_such_search")
+
+##########
+def test_parallel_bfs_matches_bfs(small_maze, walled_maze):
+    random.seed(229)
+    large = Maze(60, 60, 0.2, start = Position(0,0), goal = Position(59,59))
+    from parallel import parallel_bfs
+    for maze in (small_maze, walled_maze, large):
+        found = maze.bfs()
+        for workers, grain in ((0, 4096), (2, 4), (3, 1)):
+            result = parallel_bfs(maze, workers, grain = grain)
+            assert((result is None) == (found is None))
+            if found is None: continue
+            assert(result[1] == found[1] == maze._search_count)
+            assert(maze.is_path_same(maze, result[0], found[0]))
+    path = small_maze.parallel_bfs(1, compact = True)[0]
+    assert(small_maze.path_length(path) == 19)
+
+##########
+def test_every_search_finds_a_one_cell_path_when_start_is_goal(small_maze):
+    small_maze.set_endpoints(Position(0,0), Position(0,0))
+    for name in SEARCHES + ("ida_star", "parallel_bfs"):
+        node, count = getattr(small_maze, name)()
+        assert(small_maze.path_length(node) == 1 and count == 0), name
+    for name in ("dfs", "bfs", "a_star"):
+        assert(len(getattr(small_maze, name)(compact = True)[0]) == 1)
+        step = last_step(getattr(small_maze, name + "_steps")())
+        assert(step.status == "found" and small_maze.path_length(step.path) == 1)
+    assert(small_maze.cached_path(algorithm = "bfs") is not None)
+    results = [small_maze.find_paths([[(3,3), (3,3)]], name, workers = 0)[0] for name in SEARCHES]
+    assert(all(result["found"] and result["length"] == 1 for result in results))
+
+##########
+def test_bitset_bfs_finds_shortest_paths(small_maze, open_maze, walled_maze):
+    for maze in (small_maze, open_maze):
+        node, count = maze.bitset_bfs()
+        path, count2 = maze.bitset_bfs(compact = True)
+        assert(maze.path_length(node) == maze.path_length(path) == maze.path_length(maze.bfs()[0]))
+        assert(maze.is_path_same(maze, node, path.to_node()) and count == count2 >= maze.bfs()[1])
+    positions = []
+    node = small_maze.bitset_bfs()[0]
+    while node is not None:
+        positions.append(node.cell.get_position())
+        node = node.parent
+    assert(positions[0] == Position(9,9) and positions[-1] == Position(0,0))
+    for a, b in zip(positions, positions[1:]):
+        assert(abs(a.row - b.row) + abs(a.col - b.col) == 1)
+        assert(not small_maze.get_cell(b).is_blocked())
+    walled_maze._component_cache = None
+    assert(walled_maze.bitset_bfs() is None)
+
+##########
+def test_ida_star_and_ara_star_find_shortest_paths(small_maze, walled_maze):
+    best = small_maze.path_length(small_maze.a_star()[0])
+    node, count = small_maze.ida_star()
+    assert(small_maze.path_length(node) == best and node.cost == best - 1)
+    assert(small_maze.ida_star(max_expansions = 5) is None)
+    node, count = small_maze.ara_star()
+    assert(small_maze.path_length(node) == best and count == small_maze._search_count)
+    # with no labels cached, only the budget stops it deepening toward a walled-off goal
+    assert(walled_maze.ida_star(max_expansions = 10000) is None and walled_maze.ara_star() is None)
+    assert(walled_maze.is_connected() is False and walled_maze.ida_star() is None)
+
+##########
+def test_ida_star_builds_no_maze_sized_structures():
+    random.seed(7)
+    maze = Maze(30, 30, 0.2, start = Position(0,0), goal = Position(29,29))
+    node, count = maze.ida_star(max_expansions = 1000000)
+    assert(maze._adjacency_cache is None and maze._component_cache is None)
+    assert(maze.path_length(node) == maze.path_length(maze.a_star()[0]))
+    assert(maze.ida_star()[1] == count)   # the same search over the cached adjacency
+
+##########
+def test_one_experiment_runs_extra_searches_on_request(small_maze):
+    metrics = SearchMetrics()
+    result = one_experiment(small_maze, metrics = metrics, extra = ("ida_star", "ara_star"))
+    assert(result[1][5:] == [19, 19])
+    assert([record["algorithm"] for record in result[4][5:]] == ["ida_star", "ara_star"])
+    assert(len(one_experiment(small_maze)[0]) == 5)
+
+##########
+def test_ara_star_improves_until_optimal():
+    random.seed(1)
+    maze = Maze(120, 120, 0.2, start = Position(0,0), goal = Position(119,119))
+    best = maze.path_length(maze.a_star()[0])
+    steps = list(maze.ara_star_steps(epsilon = 3.0, step = 1.0, compact = True))
+    assert([step.epsilon for step in steps] == [3.0, 2.0, 1.0])
+    lengths = [maze.path_length(step.path) for step in steps]
+    assert(lengths == sorted(lengths, reverse = True) and lengths[-1] == best)
+    assert(all(length <= step.epsilon * best for length, step in zip(lengths, steps)))
+    assert(steps[0].expanded < steps[-1].expanded)
+    # with no time left after the first path, only that path is returned
+    quick = list(maze.ara_star_steps(epsilon = 3.0, deadline = perf_counter()))
+    assert(len(quick) == 1 and maze.path_length(quick[0].path) == lengths[0])
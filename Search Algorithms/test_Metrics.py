@@ -0,0 +1,77 @@
+'''
+Topic:      Tests for the search instrumentation
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Maze import *
+import json
+import io
+import pytest
+
+###############################################################################
+###############################################################################
+
+SEARCHES = ["dfs", "bfs", "a_star", "dijkstra", "jps", "bidirectional_bfs", "bidirectional_a_star", \
+            "bitset_bfs"]
+
+##########
+@pytest.fixture
+def random_maze():
+    ''' returns a seeded 30x30 maze with a fifth of its cells blocked '''
+    random.seed(229)
+    return Maze(30, 30, 0.2, start = Position(0,0), goal = Position(29,29))
+
+###############################################################################
+###############################################################################
+
+##########
+def test_search_count_is_not_cumulative(random_maze):
+    for name in SEARCHES:
+        first  = getattr(random_maze, name)()[1]
+        second = getattr(random_maze, name)()[1]
+        assert(first == second == random_maze._search_count)
+
+##########
+@pytest.mark.parametrize("name", SEARCHES)
+def test_records_are_consistent(random_maze, name):
+    metrics = SearchMetrics()
+    node, count = getattr(random_maze, name)(metrics = metrics)
+    record = metrics.last()
+    assert(record.algorithm == name and record.generated == count)
+    assert(0 < record.expanded <= record.peak_visited)
+    assert(0 < record.peak_frontier <= record.peak_visited)
+    assert(record.seconds > 0 and record.peak_bytes is None)
+    assert(record.peak_frontier == random_maze._peak_frontier)
+
+##########
+def test_bfs_expands_every_reachable_cell_when_walled_off(random_maze):
+    for col in range(30):
+        random_maze.set_contents(Position(15, col), Contents.BLOCKED)
+    labels = random_maze._components()
+    reached = sum(1 for label in labels if label == labels[0])
+    metrics = SearchMetrics()
+    assert(random_maze.bfs(metrics = metrics) is None)   # rejected by the labels
+    assert(metrics.last().expanded == metrics.last().peak_visited == 0)
+    random_maze._component_cache = None
+    assert(random_maze.bfs(metrics = metrics) is None)
+    assert(metrics.last().expanded == metrics.last().peak_visited == reached)
+
+##########
+def test_memory_tracing_and_dump(random_maze):
+    metrics = SearchMetrics(trace_memory = True)
+    result = one_experiment(random_maze, metrics = metrics)
+    assert(len(result) == 5)
+    assert([record["algorithm"] for record in result[4]] == \
+           ["dfs", "bfs", "a_star", "bidirectional_bfs", "bidirectional_a_star"])
+    assert(all(record["peak_bytes"] > 0 for record in result[4]))
+
+    stream = io.StringIO()
+    metrics.dump(stream)
+    assert([json.loads(line) for line in stream.getvalue().splitlines()] == result[4])
+
+##########
+def test_default_records_nothing(random_maze):
+    assert(len(one_experiment(random_maze)) == 4)
+    assert(not NO_METRICS.enabled)
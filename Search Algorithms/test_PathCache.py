@@ -0,0 +1,50 @@
+'''
+Topic:      Tests for the LRU path cache
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from PathCache import *
+import pytest
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def small_cache():
+    ''' returns a PathCache with room for three 8-cell paths '''
+    return PathCache(3 * (PathCache.ENTRY_BYTES + 4 * 8))
+
+###############################################################################
+###############################################################################
+
+##########
+def test_hits_and_misses(small_cache):
+    assert(small_cache.get("a") is None)
+    small_cache.put("a", array('i', range(8)))
+    small_cache.put("none", array('i'))   # a cached "no path"
+    assert(list(small_cache.get("a")) == list(range(8)))
+    assert(len(small_cache.get("none")) == 0)
+    assert(small_cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "entries": 2, \
+                                   "bytes": 2 * PathCache.ENTRY_BYTES + 4 * 8})
+
+##########
+def test_least_recently_used_is_evicted(small_cache):
+    for key in "abc":
+        small_cache.put(key, array('i', range(8)))
+    small_cache.get("a")
+    small_cache.put("d", array('i', range(8)))
+    assert("b" not in small_cache and all(key in small_cache for key in "acd"))
+    assert(small_cache.evictions == 1 and small_cache.nbytes() <= 3 * (PathCache.ENTRY_BYTES + 32))
+
+    small_cache.put("a", array('i', range(20)))   # replacing an entry re-charges it
+    assert("a" in small_cache and small_cache.evictions == 2 and len(small_cache) == 2)
+    small_cache.put("huge", array('i', range(1000)))   # bigger than the whole cache
+    assert("huge" not in small_cache and len(small_cache) == 2)
+    small_cache.clear()
+    assert(len(small_cache) == 0 and small_cache.nbytes() == 0 and small_cache.evictions == 2)
+
+###############################################################################
+###############################################################################
@@ -0,0 +1,68 @@
+'''
+Topic:      Tests for the indexed PriorityQueue
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from PriorityQueue import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def empty_pq():
+    ''' returns an empty PriorityQueue object '''
+    return PriorityQueue()
+
+##########
+@pytest.fixture
+def random_keys():
+    ''' returns a dictionary mapping 200 distinct items to random keys '''
+    return {item: random.randint(1,1000) for item in range(200)}
+
+###############################################################################
+###############################################################################
+
+##########
+def test_empty_pq(empty_pq):
+    assert(empty_pq.is_empty())
+    assert(len(empty_pq) == 0)
+    with pytest.raises(IndexError):
+        empty_pq.remove_min()
+
+##########
+def test_remove_min_order(empty_pq, random_keys):
+    for item, key in random_keys.items():
+        empty_pq.insert(key, item)
+    removed = [empty_pq.remove_min() for i in range(len(random_keys))]
+    assert([key for key, item in removed] == sorted(random_keys.values()))
+    assert(all(random_keys[item] == key for key, item in removed))
+
+##########
+def test_decrease_key_keeps_one_entry(empty_pq):
+    assert(empty_pq.insert(10, "a"))
+    assert(empty_pq.insert(5, "b"))
+    assert(empty_pq.insert(1, "a"))
+    assert(not empty_pq.insert(7, "a"))
+    assert(len(empty_pq) == 2 and empty_pq.high_water() == 2)
+    assert(empty_pq.remove_min() == (1, "a"))
+    assert(empty_pq.remove_min() == (5, "b"))
+
+##########
+def test_update_and_remove(empty_pq, random_keys):
+    for item, key in random_keys.items():
+        empty_pq.insert(key, item)
+    for item in range(0, 200, 2):
+        random_keys[item] = random.randint(1,1000)
+        empty_pq.update(random_keys[item], item)
+    for item in range(0, 200, 3):
+        empty_pq.remove(item)
+        del random_keys[item]
+    assert(all(empty_pq.key(item) == key for item, key in random_keys.items()))
+    removed = [empty_pq.remove_min()[0] for i in range(len(random_keys))]
+    assert(removed == sorted(random_keys.values()))
+    assert(empty_pq.is_empty())
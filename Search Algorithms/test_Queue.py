@@ -0,0 +1,73 @@
+'''
+Topic:      Tests for the deque-backed Queue
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from Queue import *
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def empty_queue():
+    ''' returns an empty Queue object '''
+    return Queue()
+
+##########
+@pytest.fixture
+def hundred_elements():
+    ''' returns a hundred-element Python list containing random integers '''
+    return [random.randint(1,1000) for i in range(100)]
+
+###############################################################################
+###############################################################################
+
+##########
+def test_empty_queue_len(empty_queue):
+    assert(len(empty_queue) == 0)
+    assert(empty_queue.is_empty())
+
+##########
+def test_empty_queue_pop(empty_queue):
+    with pytest.raises(EmptyError):
+        empty_queue.pop()
+
+##########
+def test_empty_queue_top(empty_queue):
+    with pytest.raises(EmptyError):
+        empty_queue.top()
+
+##########
+def test_push_pop_is_fifo(empty_queue, hundred_elements):
+    for item in hundred_elements:
+        empty_queue.push(item)
+    assert(len(empty_queue) == 100)
+    assert(empty_queue.top() == hundred_elements[0])
+    assert([empty_queue.pop() for i in range(100)] == hundred_elements)
+    assert(empty_queue.is_empty())
+
+##########
+def test_interleaved_push_pop(empty_queue, hundred_elements):
+    ''' interleave pushes and pops so the queue never fully drains '''
+    expected = []
+    for i, item in enumerate(hundred_elements):
+        empty_queue.push(item)
+        expected.append(item)
+        if i % 3 == 0:
+            assert(empty_queue.pop() == expected.pop(0))
+    assert(str(empty_queue) == str(expected))
+    assert([empty_queue.pop() for i in range(len(expected))] == expected)
+
+##########
+def test_extend(empty_queue, hundred_elements):
+    empty_queue.push(0)
+    empty_queue.pop()
+    empty_queue.extend(hundred_elements[:10])
+    empty_queue.extend(hundred_elements[10:])
+    assert(len(empty_queue) == 100)
+    assert([empty_queue.pop() for i in range(100)] == hundred_elements)
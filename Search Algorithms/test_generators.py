@@ -0,0 +1,59 @@
+'''
+Topic:      Tests for the random grid draw and the structured maze generators
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from generators import *
+from Maze import _BLOCKED
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+def test_random_grid_has_exact_blocked_count():
+    random.seed(229)
+    for prop in (0.0, 0.2, 0.5, 1.0):
+        maze = Maze(37, 23, prop, start = Position(0,0), goal = Position(36,22))
+        assert(maze._cells.count(_BLOCKED) == round((37 * 23 - 2) * prop))
+        assert(not maze.get_start().is_blocked() and not maze.get_goal().is_blocked())
+
+##########
+def test_random_grid_checks_proportion():
+    for prop in (-0.1, 1.2):
+        with pytest.raises(ValueError):
+            Maze(5, 5, prop, start = Position(0,0), goal = Position(4,4))
+
+##########
+def test_from_cells_checks_size():
+    with pytest.raises(ValueError):
+        Maze.from_cells(3, 3, bytearray(b" " * 8), Position(0,0), Position(2,2))
+
+##########
+@pytest.mark.parametrize("generator", [backtracker_maze, prim_maze])
+def test_perfect_mazes_are_seeded_and_spanning(generator):
+    maze = generator(21, 31, seed = 229)
+    assert(str(maze) == str(generator(21, 31, seed = 229)))
+    assert(maze.get_goal().get_position() == Position(20, 30))
+
+    # a spanning tree over the 11x16 lattice cells: every one is reached,
+    # and there is one fewer opened wall than lattice cells
+    open_cells = 21 * 31 - maze._cells.count(_BLOCKED)
+    assert(open_cells == 2 * 11 * 16 - 1)
+    reached, stack = {0}, [0]
+    while stack:
+        for j in maze._neighbours(stack.pop()):
+            if j not in reached:
+                reached.add(j)
+                stack.append(j)
+    assert(len(reached) == open_cells)
+
+##########
+def test_caves_are_seeded_and_keep_endpoints_free():
+    maze = cave_maze(30, 40, seed = 229)
+    assert(str(maze) == str(cave_maze(30, 40, seed = 229)))
+    assert(str(maze) != str(cave_maze(30, 40, seed = 230)))
+    assert(not maze.get_start().is_blocked() and not maze.get_goal().is_blocked())
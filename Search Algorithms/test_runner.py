@@ -0,0 +1,51 @@
+'''
+Topic:      Tests for the parallel experiment runner
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from runner import *
+import pytest
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def settings():
+    ''' returns a settings dictionary for small mazes '''
+    return {"rows": (8, 12), "cols": (8, 12), "prop_blocked": (0.1, 0.3), \
+            "algorithms": ["bfs", "a_star"]}
+
+###############################################################################
+###############################################################################
+
+##########
+def without_timings(result: dict) -> dict:
+    return {key: value for key, value in result.items() if not key.endswith("seconds")}
+
+##########
+def test_seeds_are_reproducible():
+    assert(derive_seeds(229, 10) == derive_seeds(229, 10))
+    assert(derive_seeds(229, 10)[:5] == derive_seeds(229, 5))
+    assert(len(set(derive_seeds(229, 1000))) == 1000)
+
+##########
+def test_run_one_is_deterministic(settings):
+    seed = derive_seeds(229, 1)[0]
+    first, second = run_one((0, seed, settings)), run_one((0, seed, settings))
+    assert(without_timings(first) == without_timings(second))
+    if first["solvable"]:
+        assert(first["bfs_length"] == first["a_star_length"])
+
+##########
+def test_pool_matches_serial_results(settings):
+    pooled = sorted((without_timings(r) for r in run(6, 229, settings, 2)), key = lambda r: r["experiment"])
+    serial = [without_timings(run_one((n, s, settings))) for n, s in enumerate(derive_seeds(229, 6))]
+    assert(pooled == serial)
+
+##########
+def test_parse_range():
+    assert(parse_range("5:10") == (5, 10))
+    assert(parse_range("0.2", float) == (0.2, 0.2))
@@ -0,0 +1,96 @@
+'''
+Topic:      Tests for the shared-memory batch path query service
+Date:       18 October 2026
+'''
+###############################################################################
+###############################################################################
+
+from service import *
+from Maze import _BLOCKED
+import io
+import json
+import pytest
+import random
+
+###############################################################################
+###############################################################################
+
+##########
+@pytest.fixture
+def random_maze():
+    ''' returns a seeded 30x40 maze with a quarter of its cells blocked '''
+    random.seed(229)
+    return Maze(30, 40, 0.25, start = Position(0,0), goal = Position(29,39))
+
+##########
+def random_queries(maze: Maze, count: int) -> list:
+    ''' returns count random pairs of open cells of the maze '''
+    rng = random.Random(count)
+    free = [i for i in range(len(maze._cells)) if maze._cells[i] != _BLOCKED]
+    return [[divmod(i, maze._num_cols) for i in rng.sample(free, 2)] for k in range(count)]
+
+##########
+def without_times(results: list) -> list:
+    return [{key: value for key, value in result.items() if key != "seconds"} for result in results]
+
+###############################################################################
+###############################################################################
+
+##########
+def test_in_process_matches_single_queries(random_maze):
+    queries = random_queries(random_maze, 40)
+    before = bytes(random_maze._cells)
+    results = random_maze.find_paths(queries, "a_star", workers = 0)
+    assert(bytes(random_maze._cells) == before)   # the maze is never aimed or marked
+
+    for (start, goal), result in zip(queries, results):
+        random_maze.set_endpoints(Position(*start), Position(*goal))
+        found = random_maze.a_star()
+        random_maze.set_endpoints(Position(0,0), Position(29,39))
+        assert(result["found"] == (found is not None))
+        if found is None: continue
+        assert(result["length"] == random_maze.path_length(found[0]))
+        assert(result["path"][0] == list(start) and result["path"][-1] == list(goal))
+
+##########
+def test_workers_match_in_process(random_maze):
+    queries = random_queries(random_maze, 60)
+    for algorithm in ["bfs", "a_star", "dijkstra"]:
+        alone = random_maze.find_paths(queries, algorithm, workers = 0)
+        with PathService(random_maze, algorithm, workers = 2, chunksize = 4) as service:
+            shared = service.find_paths(queries)
+            assert(without_times(service.find_paths(queries[:5])) == without_times(shared[:5]))
+        assert(without_times(shared) == without_times(alone))
+
+##########
+def test_in_process_services_keep_their_own_maze(random_maze):
+    small = Maze(5, 5, 0.0, start = Position(0,0), goal = Position(4,4))
+    with PathService(random_maze, "bfs", workers = 0) as first, \
+         PathService(small, "dfs", workers = 0) as second:
+        query = [[(0,0), (29,39)]]
+        assert(without_times(first.find_paths(query)) == \
+               without_times(random_maze.find_paths(query, "bfs", workers = 0)))
+        assert("off the grid" in second.find_paths(query)[0]["error"])
+        assert(second.find_paths([[(0,0), (4,4)]])[0]["found"])
+
+##########
+def test_bad_queries(random_maze):
+    blocked = divmod(random_maze._cells.index(_BLOCKED), 40)
+    results = random_maze.find_paths([[(0,0), blocked], [(0,0), (30,0)], [(0,0), (29,39)]], workers = 0)
+    assert([result["found"] for result in results[:2]] == [False, False])
+    assert("blocked" in results[0]["error"] and "off the grid" in results[1]["error"])
+    assert(results[2]["query"] == 2 and "error" not in results[2])
+    with pytest.raises(ValueError):
+        PathService(random_maze, "no_such_search", workers = 0)
+
+##########
+def test_json_lines_round_trip(random_maze):
+    lines = io.StringIO('{"start": [0, 0], "goal": [29, 39]}\n\n[[0, 0], [29, 39]]\n' * 3)
+    batches = list(read_queries(lines, batch = 4))
+    assert([len(batch) for batch in batches] == [4, 2])
+    results = random_maze.find_paths(batches[0], workers = 0)
+    assert(json.loads(json.dumps(results)) == results)
+    assert(len({json.dumps(without_times([result])) for result in results}) == 4)   # numbered
+
+###############################################################################
+###############################################################################